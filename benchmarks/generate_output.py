@@ -0,0 +1,153 @@
+"""Generate a synthetic SplashTool output folder for benchmarks.
+
+Writes <i>wd_out.tif, <i>flow_xy_out.tif, <i>flowvectors_<N>.shp and
+<i>.splashconfig for a number of checkpoints, mimicking the files in examples/.
+
+    python benchmarks/generate_output.py /tmp/splash_bench --iterations 20 --features 30000 --raster-size 4000
+"""
+# Python standard library
+import argparse
+import os
+
+# Third party (available in the Python environment of QGIS)
+import numpy as np
+from osgeo import gdal, ogr, osr
+
+EPSG = 25832
+ORIGIN_X = 473140.0
+ORIGIN_Y = 5521310.0
+PIXEL_SIZE = 1.0
+NODATA = -88888.0
+FLOWVECTOR_FIELDS = ("FlowAcc", "Flow_X", "Flow_Y", "FlowDir")
+
+SPLASHCONFIG_TEMPLATE = """### SplashTool outfile ###
+### This files provides a basic water balance and may
+### additionally be used to load configuration options
+### for restarting an iteration using previous output
+### files as infiles.
+
+### Water Balance ###
+initial volume:\t\t\t{init_vol:.2f}
+outflow from sinks:\t\t{sinkflow:.2f}
+remaining volume:\t\t{remaining:.2f}
+volume error:\t\t\t{error:.3f}%
+total flow accumulation:\t{flowacc:.3E}\t
+
+### Parameters used for restart ###
+dem_path=C:/Projekte/Splash_GIS-Projekte/dgm.tif
+outdir={outdir}
+wd={outdir}\\{i}wd_out.tif
+create_sinks=1
+output_triggers=
+flowdir_distances={distances}
+flowdir_minacc=20.0
+iteration_checkpoint={checkpoint}
+flow={outdir}\\{i}flow_out.tif
+flow_x={outdir}\\{i}flow_x_out.tif
+flow_y={outdir}\\{i}flow_y_out.tif
+nodata={nodata:.9f}
+i={i}
+init_vol={init_vol:.5f}
+sinkflow={sinkflow:.5f}
+moving=0.00100
+frequent_output=0
+wd_max_output=0
+computation_mode=GPU
+legacy_flowacc=0
+"""
+
+
+def write_raster(path, data, srs):
+    driver = gdal.GetDriverByName("GTiff")
+    dataset = driver.Create(path, data.shape[1], data.shape[0], 1, gdal.GDT_Float32, ["TILED=YES", "COMPRESS=LZW"])
+    dataset.SetGeoTransform((ORIGIN_X, PIXEL_SIZE, 0, ORIGIN_Y, 0, -PIXEL_SIZE))
+    dataset.SetProjection(srs.ExportToWkt())
+    band = dataset.GetRasterBand(1)
+    band.SetNoDataValue(NODATA)
+    band.WriteArray(data)
+    dataset = None
+
+
+def write_flowvectors(path, count, extent, rng, srs):
+    driver = ogr.GetDriverByName("ESRI Shapefile")
+    if os.path.exists(path):
+        driver.DeleteDataSource(path)
+    dataset = driver.CreateDataSource(path)
+    layer = dataset.CreateLayer(os.path.splitext(os.path.basename(path))[0], srs, ogr.wkbPoint)
+    for name in FLOWVECTOR_FIELDS:
+        field = ogr.FieldDefn(name, ogr.OFTReal)
+        field.SetWidth(24)
+        field.SetPrecision(15)
+        layer.CreateField(field)
+
+    xs = rng.uniform(extent[0], extent[2], count)
+    ys = rng.uniform(extent[1], extent[3], count)
+    # Most features have a small flow accumulation, a few a very large one
+    flowacc = 20.0 + rng.pareto(1.2, count) * 30.0
+    angle = rng.uniform(0, 2 * np.pi, count)
+    defn = layer.GetLayerDefn()
+    dataset.StartTransaction()
+    for x, y, acc, a in zip(xs, ys, flowacc, angle):
+        feature = ogr.Feature(defn)
+        feature.SetGeometry(ogr.CreateGeometryFromWkt(f"POINT ({x} {y})"))
+        feature.SetField(0, float(acc))
+        feature.SetField(1, float(np.cos(a) * acc))
+        feature.SetField(2, float(np.sin(a) * acc))
+        feature.SetField(3, float(np.degrees(a)))
+        layer.CreateFeature(feature)
+    dataset.CommitTransaction()
+    dataset = None
+
+
+def generate(folder, iterations=5, checkpoint=5000, scales=(16, 32, 64), features=30000, raster_size=2000,
+             seed=0):
+    """Write a synthetic output folder.
+
+    :param features: Number of flowvectors at the finest scale, coarser scales
+        get proportionally fewer (features / (scale / finest scale)^2).
+    :param raster_size: Width and height of the wd and flow_xy rasters in pixels.
+    """
+    os.makedirs(folder, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    srs = osr.SpatialReference()
+    srs.ImportFromEPSG(EPSG)
+    extent = (ORIGIN_X, ORIGIN_Y - raster_size * PIXEL_SIZE, ORIGIN_X + raster_size * PIXEL_SIZE, ORIGIN_Y)
+    outdir = "C:/Projekte/SplashOut"
+    init_vol = 491650.06
+
+    for n in range(1, iterations + 1):
+        i = n * checkpoint
+        progress = n / iterations
+        wd = rng.gamma(0.5, 0.3 * progress, (raster_size, raster_size)).astype(np.float32)
+        write_raster(os.path.join(folder, f"{i}wd_out.tif"), wd, srs)
+        flow = rng.pareto(1.0, (raster_size, raster_size)).astype(np.float32) * 5.0
+        write_raster(os.path.join(folder, f"{i}flow_xy_out.tif"), flow, srs)
+        for scale in scales:
+            count = max(1, int(features / (scale / scales[0]) ** 2))
+            write_flowvectors(os.path.join(folder, f"{i}flowvectors_{scale}.shp"), count, extent, rng, srs)
+
+        sinkflow = 17527.03 * progress
+        # SplashTool writes Windows line endings
+        with open(os.path.join(folder, f"{i}.splashconfig"), "w", encoding="utf-8", newline="\r\n") as f:
+            f.write(SPLASHCONFIG_TEMPLATE.format(
+                init_vol=init_vol, sinkflow=sinkflow, remaining=init_vol - sinkflow,
+                error=0.127 / progress, flowacc=5.11e8 * progress, outdir=outdir, i=i,
+                distances=";".join(f"{s:.4f}" for s in scales), checkpoint=checkpoint, nodata=NODATA))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("folder")
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--checkpoint", type=int, default=5000)
+    parser.add_argument("--scales", default="16,32,64", help="Comma separated flowvectors scales")
+    parser.add_argument("--features", type=int, default=30000, help="Flowvectors at the finest scale")
+    parser.add_argument("--raster-size", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    generate(args.folder, args.iterations, args.checkpoint, tuple(int(s) for s in args.scales.split(",")),
+             args.features, args.raster_size, args.seed)
+
+
+if __name__ == "__main__":
+    main()
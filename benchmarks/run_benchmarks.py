@@ -0,0 +1,149 @@
+"""Time the phases of loading a SplashTool output folder.
+
+Runs against a standalone QgsApplication and writes comparable JSON results:
+
+    python benchmarks/generate_output.py /tmp/splash_bench
+    python benchmarks/run_benchmarks.py /tmp/splash_bench --repeat 5 --output results.json
+
+Phases: directory scan (cold, from the manifest, cached), matching the result
+files, opening the providers (sequentially and in a worker pool), style
+application (loadNamedStyle and the style cache) and layer-tree insertion.
+"""
+# Python standard library
+import argparse
+import configparser
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def summarize(runs):
+    return {"min": min(runs), "median": statistics.median(runs), "max": max(runs), "runs": runs}
+
+
+def plugin_version():
+    metadata = configparser.ConfigParser(interpolation=None)
+    metadata.read(os.path.join(ROOT_DIR, "splashtool_result_loader", "metadata.txt"), encoding="utf-8")
+    return metadata.get("general", "version", fallback="unknown")
+
+
+def benchmark(folder, repeat):
+    from qgis.core import Qgis, QgsProject
+    from splashtool_result_loader import result_index
+    from splashtool_result_loader.loader_task import open_layer
+    from splashtool_result_loader.manifest import manifest_paths
+    from splashtool_result_loader.result_files import find_result_files, layer_load_order
+    from splashtool_result_loader.style_cache import StyleCache
+    from splashtool_result_loader.symbology import style_path, style_type
+
+    phases = {}
+
+    def record(name, seconds):
+        phases.setdefault(name, []).append(seconds)
+
+    for _ in range(repeat):
+        # Scan without any cache, then from the manifest, then from memory
+        for path in manifest_paths(folder):
+            if os.path.exists(path):
+                os.remove(path)
+        result_index._index_cache.clear()
+        seconds, index = timed(result_index.get_result_index, folder)
+        record("scan_cold", seconds)
+        index.save_manifest()
+        result_index._index_cache.clear()
+        record("scan_manifest", timed(result_index.get_result_index, folder)[0])
+        seconds, index = timed(result_index.get_result_index, folder)
+        record("scan_cached", seconds)
+
+        seconds, (latest_files, all_flowvectors) = timed(find_result_files, index)
+        layers = layer_load_order(latest_files, all_flowvectors)
+        record("match", seconds)
+
+        sources = [(index.file_path(result_file), layer_name) for result_file, layer_name in layers]
+        opened = []
+        start = time.perf_counter()
+        for file_path, layer_name in sources:
+            seconds, layer = timed(open_layer, file_path, layer_name)
+            record(f"open:{layer_name}", seconds)
+            opened.append(layer)
+        record("open_sequential", time.perf_counter() - start)
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            list(executor.map(lambda source: open_layer(*source), sources))
+        record("open_concurrent", time.perf_counter() - start)
+
+        styles = [(layer, style_path(style_type(name), name)) for layer, (_, name) in zip(opened, sources) if layer]
+        start = time.perf_counter()
+        for layer, qml_path in styles:
+            layer.loadNamedStyle(qml_path)
+        record("style_load_named_style", time.perf_counter() - start)
+        cache = StyleCache()
+        start = time.perf_counter()
+        for layer, qml_path in styles:
+            cache.apply(layer, qml_path)
+        record("style_cache_cold", time.perf_counter() - start)
+        start = time.perf_counter()
+        for layer, qml_path in styles:
+            cache.apply(layer, qml_path)
+        record("style_cache_warm", time.perf_counter() - start)
+
+        project = QgsProject()
+        group = project.layerTreeRoot().addGroup("SplashTool")
+        start = time.perf_counter()
+        for layer, _ in styles:
+            project.addMapLayer(layer, False)
+            group.addLayer(layer)
+        record("layer_tree_insert", time.perf_counter() - start)
+        project.clear()
+
+    return {
+        "plugin_version": plugin_version(),
+        "qgis_version": Qgis.version(),
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "folder": {
+            "path": folder,
+            "result_files": len(index.result_files()),
+            "iterations": len(index.iterations()),
+            "loaded_layers": [name for _, name in sources],
+        },
+        "repeat": repeat,
+        "phases": {name: summarize(runs) for name, runs in phases.items()},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("folder", help="SplashTool output folder, e.g. created by generate_output.py")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Write the JSON results to this file instead of stdout")
+    args = parser.parse_args()
+
+    from splashtool_result_loader.batch import init_worker
+    init_worker()
+
+    results = benchmark(os.path.abspath(args.folder), args.repeat)
+    text = json.dumps(results, indent=1)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+import sys
+
+from splashtool_result_loader.batch import main
+
+sys.exit(main())
@@ -0,0 +1,208 @@
+# Python standard library
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Headless batch mode: resolves the latest results of many SplashTool output
+# folders and writes one styled QGIS project (.qgs) or layer definition (.qlr)
+# per folder. Each worker process runs its own standalone QgsApplication.
+#
+#   python -m splashtool_result_loader run1/ run2/ ... --format qlr --workers 4
+#
+# Only the worker processes create a QgsApplication, the main process just
+# distributes the folders and collects the reports.
+
+GROUP_NAME = "SplashTool"
+
+_qgs_app = None
+
+
+def init_worker():
+    """Start a standalone QgsApplication in a worker process."""
+    global _qgs_app
+    from qgis.core import QgsApplication
+    prefix_path = os.environ.get("QGIS_PREFIX_PATH")
+    if prefix_path:
+        QgsApplication.setPrefixPath(prefix_path, True)
+    _qgs_app = QgsApplication([], False)
+    _qgs_app.initQgis()
+
+
+def output_path(folder, output_dir, output_format):
+    if output_dir:
+        name = os.path.basename(os.path.normpath(folder))
+        return os.path.join(output_dir, f"{name}.{output_format}")
+    return os.path.join(folder, f"splashtool_results.{output_format}")
+
+
+def load_styled_layers(folder, timer, log, is_canceled=lambda: False):
+    """Open and style the latest results of an output folder, without adding them to a project.
+
+    Used by the batch mode and by the Processing algorithms (see processing_provider.py).
+
+    :param is_canceled: Checked before each file, loading stops if it returns True.
+    :type is_canceled: function
+
+    :returns: Index of the folder, loaded (result_file, layer_name, layer) tuples in
+        the order of the group and the paths of the files that could not be loaded.
+    :rtype: tuple
+    """
+    from .classification import adapt_wd_classification
+    from .loader_task import open_layer
+    from .manifest import layer_quantiles
+    from .result_files import find_result_files, layer_load_order
+    from .result_index import get_result_index
+    from .style_cache import style_cache
+    from .symbology import style_path, style_type
+
+    with timer.phase("scan"):
+        index = get_result_index(folder)
+    with timer.phase("match"):
+        latest_files, all_flowvectors = find_result_files(index, log)
+    layers = layer_load_order(latest_files, all_flowvectors)
+    if not layers:
+        raise IOError("No SplashTool results found")
+
+    loaded = []
+    failed = []
+    for result_file, layer_name in layers:
+        if is_canceled():
+            break
+        layer = open_layer(index.file_path(result_file), layer_name, timer, log)
+        if layer is None:
+            failed.append(index.file_path(result_file))
+            continue
+        qml_path = style_path(style_type(layer_name), layer_name)
+        if qml_path:
+            with timer.phase("style", layer_name):
+                style_cache.apply(layer, qml_path)
+                if result_file.artifact == "wd":
+                    adapt_wd_classification(layer, *layer_quantiles(index, result_file, layer))
+        layer.setCustomProperty("splashtool/artifact", layer_name)
+        loaded.append((result_file, layer_name, layer))
+    return index, loaded, failed
+
+
+def write_group(folder, loaded, output, output_format, timer):
+    """Write loaded layers as one SplashTool group into a QGIS project (qgs) or layer definition (qlr).
+
+    The layers are owned by a new project afterwards.
+    """
+    from qgis.core import QgsProject, QgsLayerDefinition, QgsLayerTreeLayer
+
+    project = QgsProject()
+    group = project.layerTreeRoot().addGroup(GROUP_NAME)
+    layers = [layer for _, _, layer in loaded]
+    with timer.phase("add_map_layer"):
+        project.addMapLayers(layers, False)
+    with timer.phase("group_add_layer"):
+        group.insertChildNodes(-1, [QgsLayerTreeLayer(layer) for layer in layers])
+    group.setCustomProperty("splashtool/folder", folder)
+    group.setCustomProperty("splashtool/iteration", max((f.iteration for f, _, _ in loaded), default=0))
+
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    if output_format == "qgs":
+        ok = project.write(output)
+        message = project.error()
+    else:
+        ok, message = QgsLayerDefinition.exportLayerDefinition(output, [group])
+    if not ok:
+        raise IOError(f"Could not write {output}: {message}")
+
+
+def process_folder(folder, output, output_format):
+    """Load and style the latest results of one folder and write them to a project or layer definition.
+
+    :returns: Report with the folder, output path, loaded layers, per-phase timings and error (if any).
+    :rtype: dict
+    """
+    from .log import LoadLog
+    from .timing import LoadTimer
+
+    timer = LoadTimer(folder)
+    log = LoadLog()
+    report = {"folder": folder, "output": output, "layers": [], "failed": [], "error": None}
+    try:
+        index, loaded, report["failed"] = load_styled_layers(folder, timer, log)
+        report["layers"] = [layer_name for _, layer_name, _ in loaded]
+        write_group(folder, loaded, output, output_format, timer)
+        index.save_manifest()
+    except Exception as e:
+        report["error"] = str(e)
+    log.flush()
+    timer.stop()
+    report["seconds"] = round(timer.total, 3)
+    report["timings"] = timer.to_dict()
+    return report
+
+
+def run_batch(folders, output_dir=None, output_format="qgs", workers=None):
+    """Process many output folders in a process pool.
+
+    :returns: One report per folder, in the order of the folders.
+    :rtype: list
+    """
+    outputs = [output_path(folder, output_dir, output_format) for folder in folders]
+    # Folders with the same name would overwrite each other's output
+    seen = {}
+    for i, output in enumerate(outputs):
+        if output in seen:
+            base, ext = os.path.splitext(output)
+            outputs[i] = f"{base}_{i}{ext}"
+        seen[outputs[i]] = i
+
+    reports = [None] * len(folders)
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+        futures = {executor.submit(process_folder, folder, output, output_format): i
+                   for i, (folder, output) in enumerate(zip(folders, outputs))}
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                reports[i] = future.result()
+            except Exception as e:
+                # The worker process itself failed (e.g. QGIS could not be initialized)
+                reports[i] = {"folder": folders[i], "output": outputs[i], "layers": [], "failed": [],
+                              "error": str(e), "seconds": None}
+            print_report(reports[i])
+    return reports
+
+
+def print_report(report):
+    status = "FAILED" if report["error"] else "ok"
+    seconds = "-" if report["seconds"] is None else f"{report['seconds']:.2f} s"
+    line = f"[{status}] {report['folder']} ({seconds})"
+    if report["error"]:
+        line += f": {report['error']}"
+    else:
+        line += f" -> {report['output']} ({len(report['layers'])} layers)"
+    if report["failed"]:
+        line += f", could not load: {', '.join(report['failed'])}"
+    print(line, flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m splashtool_result_loader",
+        description="Load the latest results of SplashTool output folders and write styled QGIS projects.")
+    parser.add_argument("folders", nargs="+", help="SplashTool output folders")
+    parser.add_argument("-o", "--output-dir",
+                        help="Folder for the written files (default: inside each output folder)")
+    parser.add_argument("-f", "--format", choices=("qgs", "qlr"), default="qgs",
+                        help="Write a QGIS project (qgs) or a layer definition (qlr)")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="Number of worker processes (default: number of CPUs)")
+    parser.add_argument("--report", help="Write the per-folder reports as JSON to this file")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    reports = run_batch(args.folders, args.output_dir, args.format, args.workers)
+    failed = [r for r in reports if r["error"]]
+    print(f"{len(reports) - len(failed)} of {len(reports)} folders processed in "
+          f"{time.perf_counter() - start:.2f} s", flush=True)
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(reports, f, indent=1)
+    return 1 if failed else 0
@@ -0,0 +1,122 @@
+# Qt imports
+from qgis.PyQt.QtCore import QLocale
+
+# QGIS imports
+from qgis.core import QgsColorRampShader
+
+# Local imports
+from .style_cache import style_cache
+from .symbology import style_path
+
+# The class breaks in wd.qml were taken from one project. This module adapts them
+# to the water depths of the loaded raster: the breaks of the visible classes are
+# set to quantiles of the visible water depths, estimated from a histogram of a
+# raster sample. The transparent classes of wd.qml hide negligible depths and keep
+# their fixed breaks, otherwise a share of the water would be hidden whatever its
+# depth. GDAL reads the sample from the overviews if there are any, so no full
+# resolution pass is needed. The quantiles are stored with the layer metadata in
+# the manifest (see manifest.py).
+
+# Quantiles of the water depths above the transparent classes, one per visible finite break of wd.qml
+WD_QUANTILES = (0.5, 0.9, 0.98)
+# Cells with less water are dry, used if the style has no transparent classes
+WET_DEPTH = 0.001
+HISTOGRAM_BINS = 1000
+SAMPLE_SIZE = 250000
+
+
+def visible_depth():
+    """Water depth above which wd.qml shows the cells, the highest break of its transparent classes."""
+    return max(style_cache.transparent_breaks(style_path("wd", "wd")), default=WET_DEPTH)
+
+
+def quantiles_from_histogram(counts, minimum, maximum, probabilities):
+    """Estimate quantiles from histogram counts, interpolating linearly inside a bin.
+
+    :returns: One value per probability, an empty list if the histogram is empty.
+    :rtype: list
+    """
+    total = sum(counts)
+    if not total:
+        return []
+    bin_width = (maximum - minimum) / len(counts)
+    quantiles = []
+    cumulative = 0
+    index = 0
+    for probability in probabilities:
+        target = probability * total
+        while index < len(counts) - 1 and cumulative + counts[index] < target:
+            cumulative += counts[index]
+            index += 1
+        fraction = (target - cumulative) / counts[index] if counts[index] else 0.0
+        quantiles.append(minimum + (index + min(max(fraction, 0.0), 1.0)) * bin_width)
+    return quantiles
+
+
+def sample_quantiles(provider, extent, maximum, probabilities=WD_QUANTILES):
+    """Estimate quantiles of the visible water depths of band 1 from a raster sample.
+
+    :param maximum: Maximum value of the band, e.g. from the sampled band statistics.
+    :type maximum: float
+
+    :returns: One value per probability, an empty list if no cell is deeper than the transparent classes.
+    :rtype: list
+    """
+    minimum = visible_depth()
+    if maximum is None or maximum <= minimum:
+        return []
+    histogram = provider.histogram(1, HISTOGRAM_BINS, minimum, maximum, extent, SAMPLE_SIZE)
+    return quantiles_from_histogram(list(histogram.histogramVector), minimum, maximum, probabilities)
+
+
+def class_breaks(quantiles, minimum=None):
+    """Strictly increasing class breaks above minimum from quantiles, which can repeat for very uniform rasters."""
+    breaks = []
+    for value in quantiles:
+        previous = breaks[-1] if breaks else minimum
+        if previous is not None and value <= previous:
+            value = previous + WET_DEPTH
+        breaks.append(value)
+    return breaks
+
+
+def adapt_wd_classification(layer, quantiles, maximum):
+    """Move the visible finite class breaks of a layer styled with wd.qml to the given quantiles.
+
+    The breaks of the transparent classes, colors and transparency of the classes are kept.
+
+    :returns: False if the renderer has no color ramp with one visible finite break per quantile.
+    :rtype: bool
+    """
+    renderer = layer.renderer()
+    shader = renderer.shader() if hasattr(renderer, "shader") else None
+    function = shader.rasterShaderFunction() if shader else None
+    if not isinstance(function, QgsColorRampShader):
+        return False
+    items = function.colorRampItemList()
+    finite = [item for item in items if item.value != float("inf")]
+    transparent = [item for item in finite if item.color.alpha() == 0]
+    visible = [item for item in finite if item.color.alpha() != 0]
+    if not quantiles or len(visible) != len(quantiles):
+        return False
+
+    locale = QLocale()
+    cutoff = max((item.value for item in transparent), default=None)
+    breaks = class_breaks(quantiles, cutoff)
+    previous = locale.toString(cutoff, "f", 4) if cutoff is not None else None
+    for item, value in zip(visible, breaks):
+        item.value = value
+        text = locale.toString(value, "f", 4)
+        item.label = f"<= {text}" if previous is None else f"{previous} - {text}"
+        previous = text
+    for item in items:
+        if item.value == float("inf"):
+            item.label = f"> {previous}"
+    function.setColorRampItemList(items)
+
+    maximum = max(maximum or 0.0, breaks[-1])
+    function.setMinimumValue(0.0)
+    function.setMaximumValue(maximum)
+    renderer.setClassificationMin(0.0)
+    renderer.setClassificationMax(maximum)
+    return True
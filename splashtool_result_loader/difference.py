@@ -0,0 +1,181 @@
+# Python standard library
+import os
+
+# QGIS imports
+from qgis.core import QgsTask
+from osgeo import gdal
+import numpy as np
+
+# Local imports
+from .manifest import cache_directory
+from .result_files import tr
+
+# The difference of two water depth rasters (later minus earlier iteration, or
+# one run minus another) shows where ponding grows or drains. It is computed
+# window by window, so memory use only depends on the window size and not on the
+# size of the rasters. The result is a compressed GeoTIFF in the cache folder of
+# the later run, reused as long as it is newer than both inputs.
+
+# SplashTool writes this nodata value if the .splashconfig does not say otherwise
+DEFAULT_NODATA = -88888.0
+# Rows of full raster width processed at once if the rasters are not tiled
+WINDOW_ROWS = 256
+CREATION_OPTIONS = ["COMPRESS=DEFLATE", "PREDICTOR=3", "TILED=YES", "BIGTIFF=IF_SAFER"]
+
+
+def difference_path(folder, name):
+    """Path of a difference raster in the cache folder of an output folder."""
+    return os.path.join(cache_directory(folder), f"{name}.tif")
+
+
+def is_up_to_date(output_path, *input_paths):
+    if not os.path.exists(output_path):
+        return False
+    output_mtime = os.stat(output_path).st_mtime_ns
+    return all(os.stat(path).st_mtime_ns <= output_mtime for path in input_paths)
+
+
+def raster_windows(width, height, block_width, block_height):
+    """Yield (xoff, yoff, xsize, ysize) windows covering a raster.
+
+    Windows follow the block layout of the input, full-width strips of at least
+    WINDOW_ROWS rows for striped rasters.
+    """
+    if block_width >= width:
+        block_width = width
+        block_height = max(block_height, WINDOW_ROWS)
+    for yoff in range(0, height, block_height):
+        ysize = min(block_height, height - yoff)
+        for xoff in range(0, width, block_width):
+            yield xoff, yoff, min(block_width, width - xoff), ysize
+
+
+def compute_difference(earlier_path, later_path, output_path, earlier_nodata=None, later_nodata=None,
+                       is_canceled=None, progress=None):
+    """Write later minus earlier water depth into a compressed GeoTIFF.
+
+    Cells that are nodata in either raster are nodata in the result. A partial
+    output is removed if the computation fails or is canceled.
+
+    :param earlier_nodata: Nodata value of the earlier raster (from the .splashconfig
+        of its run), the value of its raster band if not given.
+    :type earlier_nodata: float
+
+    :param later_nodata: Nodata value of the later raster, the value of its raster
+        band if not given. Also used for the output, DEFAULT_NODATA if both are unknown.
+    :type later_nodata: float
+
+    :param is_canceled: Returns True if the computation should stop, optional.
+    :type is_canceled: function
+
+    :param progress: Called with the finished percentage, optional.
+    :type progress: function
+
+    :returns: False if the computation was canceled.
+    :rtype: bool
+    """
+    earlier = gdal.Open(earlier_path, gdal.GA_ReadOnly)
+    later = gdal.Open(later_path, gdal.GA_ReadOnly)
+    if earlier is None or later is None:
+        raise IOError(f"Could not open {earlier_path if earlier is None else later_path}")
+    width, height = later.RasterXSize, later.RasterYSize
+    if (earlier.RasterXSize, earlier.RasterYSize) != (width, height) or \
+            earlier.GetGeoTransform() != later.GetGeoTransform():
+        raise ValueError(f"{earlier_path} and {later_path} do not cover the same grid")
+
+    earlier_band = earlier.GetRasterBand(1)
+    later_band = later.GetRasterBand(1)
+    # Two runs can use different nodata values, each raster is masked with its own
+    input_nodata = [nodata if nodata is not None else band.GetNoDataValue()
+                    for nodata, band in ((earlier_nodata, earlier_band), (later_nodata, later_band))]
+    output_nodata = input_nodata[1] if input_nodata[1] is not None else DEFAULT_NODATA
+
+    tmp_path = output_path + ".tmp.tif"
+    driver = gdal.GetDriverByName("GTiff")
+    output = None
+    output_band = None
+    completed = False
+    try:
+        output = driver.Create(tmp_path, width, height, 1, gdal.GDT_Float32, CREATION_OPTIONS)
+        if output is None:
+            raise IOError(f"Could not create {tmp_path}")
+        output.SetGeoTransform(later.GetGeoTransform())
+        output.SetProjection(later.GetProjection())
+        output_band = output.GetRasterBand(1)
+        output_band.SetNoDataValue(output_nodata)
+
+        block_width, block_height = later_band.GetBlockSize()
+        windows = list(raster_windows(width, height, block_width, block_height))
+        for index, (xoff, yoff, xsize, ysize) in enumerate(windows):
+            if is_canceled and is_canceled():
+                return False
+            a = earlier_band.ReadAsArray(xoff, yoff, xsize, ysize).astype(np.float32, copy=False)
+            b = later_band.ReadAsArray(xoff, yoff, xsize, ysize).astype(np.float32, copy=False)
+            invalid = ~(np.isfinite(a) & np.isfinite(b))
+            for values, value_nodata in ((a, input_nodata[0]), (b, input_nodata[1])):
+                if value_nodata is not None:
+                    invalid |= values == np.float32(value_nodata)
+            difference = np.subtract(b, a)
+            difference[invalid] = output_nodata
+            output_band.WriteArray(difference, xoff, yoff)
+            if progress:
+                progress(100.0 * (index + 1) / len(windows))
+        output_band.FlushCache()
+        completed = True
+    finally:
+        # Bands keep their dataset open (GDAL >= 3.8), on Windows the file could not be renamed or removed
+        output_band = earlier_band = later_band = None
+        output = None
+        earlier = None
+        later = None
+        # Canceled or failed, a partial raster is never left in the cache folder
+        if not completed and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    os.replace(tmp_path, output_path)
+    return True
+
+
+class DifferenceTask(QgsTask):
+    """Computes a water depth difference raster in the background."""
+
+    def __init__(self, earlier_path, later_path, output_path, earlier_nodata, later_nodata, on_finished):
+        """Constructor.
+        :param earlier_path: Water depth raster that is subtracted.
+        :type earlier_path: str
+
+        :param later_path: Water depth raster it is subtracted from.
+        :type later_path: str
+
+        :param output_path: Path of the difference GeoTIFF.
+        :type output_path: str
+
+        :param earlier_nodata: Nodata value of the .splashconfig of the earlier raster, None to use the raster nodata.
+        :type earlier_nodata: float
+
+        :param later_nodata: Nodata value of the .splashconfig of the later raster, None to use the raster nodata.
+        :type later_nodata: float
+
+        :param on_finished: Called on the main thread with (task, result) once the task ended.
+        :type on_finished: function
+        """
+        super().__init__(tr("Computing SplashTool water depth difference"), QgsTask.Flag.CanCancel)
+        self.earlier_path = earlier_path
+        self.later_path = later_path
+        self.output_path = output_path
+        self.earlier_nodata = earlier_nodata
+        self.later_nodata = later_nodata
+        self.on_finished = on_finished
+        self.exception = None
+
+    def run(self):
+        try:
+            if is_up_to_date(self.output_path, self.earlier_path, self.later_path):
+                return True
+            return compute_difference(self.earlier_path, self.later_path, self.output_path, self.earlier_nodata,
+                                      self.later_nodata, self.isCanceled, self.setProgress)
+        except Exception as e:
+            self.exception = e
+            return False
+
+    def finished(self, result):
+        self.on_finished(self, result)
@@ -0,0 +1,58 @@
+# Qt imports
+from qgis.PyQt.QtWidgets import QComboBox, QDialog, QDialogButtonBox, QFormLayout
+
+# Local imports
+from .result_files import tr
+
+# Dialog to choose the two water depth rasters of a difference layer. Every
+# iteration of every loaded SplashTool group can be chosen, so the difference
+# can be taken between two iterations of one run or between two runs.
+
+
+class DifferenceDialog(QDialog):
+    """Lets the user pick the earlier and the later water depth raster."""
+
+    def __init__(self, candidates, parent=None):
+        """Constructor.
+        :param candidates: List of (label, folder, result_file) of all wd rasters,
+            the first one is the default for the later raster.
+        :type candidates: list
+        """
+        super().__init__(parent)
+        self.setWindowTitle(tr("Water depth difference"))
+        self.candidates = candidates
+
+        self.later_combo = QComboBox(self)
+        self.earlier_combo = QComboBox(self)
+        for label, _, _ in candidates:
+            self.later_combo.addItem(label)
+            self.earlier_combo.addItem(label)
+        self.earlier_combo.setCurrentIndex(self.default_earlier_index())
+
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel, self)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+
+        layout = QFormLayout(self)
+        layout.addRow(tr("Water depth"), self.later_combo)
+        layout.addRow(tr("minus water depth"), self.earlier_combo)
+        layout.addRow(buttons)
+
+    def default_earlier_index(self):
+        """Previous iteration of the default later raster, or the next other run."""
+        _, folder, later = self.candidates[0]
+        previous = [i for i, (_, f, result_file) in enumerate(self.candidates)
+                    if f == folder and result_file.iteration < later.iteration]
+        if previous:
+            return max(previous, key=lambda i: self.candidates[i][2].iteration)
+        return 1 if len(self.candidates) > 1 else 0
+
+    def selection(self):
+        """The chosen rasters.
+
+        :returns: ((folder, result_file) of the earlier raster, (folder, result_file) of the later raster).
+        :rtype: tuple
+        """
+        earlier = self.candidates[self.earlier_combo.currentIndex()]
+        later = self.candidates[self.later_combo.currentIndex()]
+        return earlier[1:], later[1:]
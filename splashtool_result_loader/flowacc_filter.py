@@ -0,0 +1,40 @@
+# The FlowAcc threshold of a SplashTool group is applied as subset filter of its
+# flowvectors layers. The filter is evaluated by the data provider, so features
+# below the threshold never reach the renderer. In the GeoPackage caches the
+# filter is served by an index on ("scale", "FlowAcc"), see flowvector_cache.py.
+# Changing the subset of a layer redraws it without reloading the group.
+
+# Group property with the minimum flow accumulation of its flowvectors layers
+MIN_FLOWACC_PROPERTY = "splashtool/min_flowacc"
+# Layer property with the subset of the data source without the threshold,
+# e.g. the scale filter of a GeoPackage layer
+BASE_SUBSET_PROPERTY = "splashtool/base_subset"
+
+
+def flowacc_subset(base_subset, min_flowacc):
+    """Subset string combining the subset of the data source with a minimum FlowAcc.
+
+    :param min_flowacc: Minimum flow accumulation, 0 or None for no threshold.
+    :type min_flowacc: float
+    """
+    conditions = [f"({base_subset})"] if base_subset else []
+    if min_flowacc:
+        conditions.append(f'"FlowAcc" >= {float(min_flowacc)!r}')
+    return " AND ".join(conditions)
+
+
+def apply_flowacc_filter(layer, min_flowacc, new_source=False):
+    """Filter a flowvectors layer by a minimum FlowAcc, keeping the subset of its data source.
+
+    :param new_source: The data source of the layer was replaced since the last
+        call, its current subset becomes the new base subset.
+    :type new_source: bool
+
+    :returns: False if the provider rejected the subset string.
+    :rtype: bool
+    """
+    base_subset = layer.customProperty(BASE_SUBSET_PROPERTY)
+    if base_subset is None or new_source:
+        base_subset = layer.subsetString()
+        layer.setCustomProperty(BASE_SUBSET_PROPERTY, base_subset)
+    return layer.setSubsetString(flowacc_subset(base_subset, min_flowacc))
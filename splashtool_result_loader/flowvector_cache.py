@@ -0,0 +1,209 @@
+# Python standard library
+import os
+
+# QGIS imports
+from qgis.core import QgsTask
+from osgeo import ogr, osr
+
+# Local imports
+from .manifest import cache_directory
+from .result_files import tr
+
+# Each iteration writes one flowvectors shapefile per scale with text-encoded DBF
+# numbers that OGR parses on every redraw. This module streams all scales of an
+# iteration into a single GeoPackage with a scale column, typed float fields and
+# a spatial index. The GeoPackage is keyed by the sizes and mtimes of its source
+# shapefiles and rebuilt only if one of them changed. Layers are loaded from it
+# with a subset filter per scale. In watch mode the flowvectors of every new
+# iteration are converted in the background before the layers are swapped.
+
+FLOWVECTOR_FIELDS = ("FlowAcc", "Flow_X", "Flow_Y", "FlowDir")
+GEOPACKAGE_LAYER = "flowvectors"
+# Group property, set if the flowvectors of the group are loaded from the GeoPackage
+GEOPACKAGE_PROPERTY = "splashtool/flowvectors_geopackage"
+SOURCES_METADATA_KEY = "SPLASHTOOL_SOURCES"
+# Part of the cache key, increased when the layout or indexes of the GeoPackage change
+CACHE_VERSION = 2
+# Features written per transaction
+BATCH_SIZE = 20000
+
+
+def geopackage_path(folder, iteration):
+    return os.path.join(cache_directory(folder), f"{iteration}flowvectors.gpkg")
+
+
+def geopackage_layer_uri(path, scale):
+    """Data source of one flowvectors scale inside the GeoPackage."""
+    return f'{path}|layername={GEOPACKAGE_LAYER}|subset="scale" = {int(scale)}'
+
+
+def sources_key(result_files):
+    return f"v{CACHE_VERSION};" + ";".join(
+        f"{f.filename}:{f.size}:{f.mtime}" for f in sorted(result_files, key=lambda f: f.filename))
+
+
+def create_attribute_indexes(dataset):
+    """Index the columns used in subset filters of the flowvectors layers.
+
+    The composite index serves the scale filter alone as well as the scale
+    filter combined with a minimum FlowAcc (see flowacc_filter.py).
+    """
+    dataset.ExecuteSQL(f'CREATE INDEX IF NOT EXISTS "{GEOPACKAGE_LAYER}_scale_flowacc" '
+                       f'ON "{GEOPACKAGE_LAYER}" ("scale", "FlowAcc")')
+
+
+def is_up_to_date(path, key):
+    if not os.path.exists(path):
+        return False
+    dataset = ogr.Open(path, 0)
+    if dataset is None:
+        return False
+    return dataset.GetMetadataItem(SOURCES_METADATA_KEY) == key
+
+
+def read_spatial_ref(shapefile_path):
+    """Spatial reference from the .prj of a shapefile, None if it has none."""
+    try:
+        with open(os.path.splitext(shapefile_path)[0] + ".prj", encoding="utf-8", errors="replace") as f:
+            wkt = f.read()
+    except OSError:
+        return None
+    spatial_ref = osr.SpatialReference()
+    return spatial_ref if spatial_ref.ImportFromWkt(wkt) == 0 else None
+
+
+def write_geopackage(path, key, spatial_ref, rows, is_canceled=lambda: False):
+    """Write flowvectors into a GeoPackage with the cache layout and replace the GeoPackage at path.
+
+    The features are written to a temporary file first, so a canceled or failed
+    conversion never leaves a half-written cache. Used for the conversion of the
+    shapefiles and for the flowvectors pyramid (see flowvector_pyramid.py).
+
+    :param key: Cache key stored in the metadata, see is_up_to_date.
+    :type key: str
+
+    :param rows: Iterable of (geometry, scale, values) with one float (or None) per field of FLOWVECTOR_FIELDS.
+    :type rows: iterable
+
+    :param is_canceled: Checked between batches, writing is aborted if it returns True.
+    :type is_canceled: function
+
+    :returns: path, or None if writing was canceled.
+    :rtype: str
+    """
+    tmp_path = path + ".tmp.gpkg"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    dataset = ogr.GetDriverByName("GPKG").CreateDataSource(tmp_path)
+    if dataset is None:
+        raise IOError(f"Could not create {tmp_path}")
+    out_layer = out_defn = None
+    completed = False
+    try:
+        out_layer = dataset.CreateLayer(GEOPACKAGE_LAYER, spatial_ref, ogr.wkbPoint, ["SPATIAL_INDEX=YES"])
+        out_layer.CreateField(ogr.FieldDefn("scale", ogr.OFTInteger))
+        for name in FLOWVECTOR_FIELDS:
+            out_layer.CreateField(ogr.FieldDefn(name, ogr.OFTReal))
+        out_defn = out_layer.GetLayerDefn()
+
+        dataset.StartTransaction()
+        for count, (geometry, scale, values) in enumerate(rows, start=1):
+            feature = ogr.Feature(out_defn)
+            feature.SetGeometry(geometry)
+            feature.SetField(0, scale)
+            for out_index, value in enumerate(values, start=1):
+                if value is not None:
+                    feature.SetField(out_index, value)
+            out_layer.CreateFeature(feature)
+            if count % BATCH_SIZE == 0:
+                dataset.CommitTransaction()
+                if is_canceled():
+                    return None
+                dataset.StartTransaction()
+        dataset.CommitTransaction()
+
+        create_attribute_indexes(dataset)
+        dataset.SetMetadataItem(SOURCES_METADATA_KEY, key)
+        completed = True
+    finally:
+        # Layers keep their dataset open (GDAL >= 3.8), on Windows the file could not be renamed or removed
+        out_layer = out_defn = None
+        dataset = None
+        if not completed and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    os.replace(tmp_path, path)
+    return path
+
+
+def shapefile_rows(index, result_files):
+    """Features of flowvectors shapefiles as rows for write_geopackage."""
+    for result_file in result_files:
+        source = ogr.Open(index.file_path(result_file), 0)
+        if source is None:
+            raise IOError(f"Could not open {index.file_path(result_file)}")
+        source_layer = source.GetLayer(0)
+        source_fields = [source_layer.GetLayerDefn().GetFieldIndex(name) for name in FLOWVECTOR_FIELDS]
+        for feature in source_layer:
+            yield (feature.GetGeometryRef(), result_file.scale,
+                   [feature.GetFieldAsDouble(i) if i >= 0 else None for i in source_fields])
+        source_layer = None
+        source = None
+
+
+def convert_flowvectors(index, result_files, is_canceled=lambda: False):
+    """Convert the flowvectors shapefiles of one iteration into a GeoPackage, if not cached yet.
+
+    :param index: Index of the output folder.
+    :type index: ResultDirectoryIndex
+
+    :param result_files: Flowvectors files of one iteration.
+    :type result_files: list
+
+    :param is_canceled: Checked between batches, the conversion is aborted if it returns True.
+    :type is_canceled: function
+
+    :returns: Path of the GeoPackage, or None if the conversion was canceled.
+    :rtype: str
+    """
+    path = geopackage_path(index.path, result_files[0].iteration)
+    key = sources_key(result_files)
+    if is_up_to_date(path, key):
+        return path
+    spatial_ref = read_spatial_ref(index.file_path(result_files[0]))
+    return write_geopackage(path, key, spatial_ref, shapefile_rows(index, result_files), is_canceled)
+
+
+class ConvertFlowvectorsTask(QgsTask):
+    """Converts the flowvectors of an iteration into the GeoPackage in the background, e.g. for a watch mode refresh."""
+
+    def __init__(self, index, result_files, on_finished):
+        """Constructor.
+        :param index: Index of the output folder.
+        :type index: ResultDirectoryIndex
+
+        :param result_files: Flowvectors files of one iteration.
+        :type result_files: list
+
+        :param on_finished: Called on the main thread with (task, result) once the task ended.
+        :type on_finished: function
+        """
+        super().__init__(tr("Converting SplashTool flowvectors"), QgsTask.Flag.CanCancel)
+        self.index = index
+        self.result_files = result_files
+        self.iteration = result_files[0].iteration
+        self.on_finished = on_finished
+        # Path of the GeoPackage once it was converted
+        self.path = None
+        self.exception = None
+
+    def run(self):
+        try:
+            self.path = convert_flowvectors(self.index, self.result_files, self.isCanceled)
+            return self.path is not None
+        except Exception as e:
+            self.exception = e
+            return False
+
+    def finished(self, result):
+        self.on_finished(self, result)
@@ -0,0 +1,133 @@
+# Python standard library
+import os
+
+# QGIS imports
+from qgis.core import QgsTask
+from osgeo import ogr
+import numpy as np
+
+# Local imports
+from .flowvector_cache import FLOWVECTOR_FIELDS, is_up_to_date, read_spatial_ref, sources_key, write_geopackage
+from .manifest import cache_directory
+from .result_files import tr
+from .shapefile_reader import read_flowvectors
+
+# SplashTool only writes the flowvectors scales of flowdir_distances (e.g. 16, 32
+# and 64), so zoomed out views show nothing or far too many points. This module
+# derives coarser levels from the finest scale by grid thinning: the vector with
+# the highest FlowAcc of every grid cell of the level's size is kept. Each level
+# is thinned from the previous one, which gives the same result as thinning the
+# finest scale because the grids are nested. The levels of an iteration are
+# cached in one GeoPackage with the layout of the flowvectors GeoPackage (see
+# flowvector_cache.py) and loaded with a subset filter per level. The levels
+# are optional: if they cannot be built the results are loaded without them.
+
+PYRAMID_SCALES = (128, 256, 512)
+# Errors of building the levels that do not prevent loading the results, e.g. no
+# writable cache directory, a malformed shapefile or a GeoPackage that cannot be written
+PYRAMID_ERRORS = (OSError, ValueError, RuntimeError)
+
+
+def pyramid_path(folder, iteration):
+    return os.path.join(cache_directory(folder), f"{iteration}flowvectors_pyramid.gpkg")
+
+
+def pyramid_levels(result_files, scales=PYRAMID_SCALES):
+    """Pyramid levels that are coarser than all flowvectors scales written by SplashTool."""
+    coarsest = max((f.scale for f in result_files), default=None)
+    if coarsest is None:
+        return []
+    return [scale for scale in scales if scale > coarsest]
+
+
+def thin_indices(x, y, flowacc, cell_size):
+    """Indices of the vector with the highest FlowAcc per grid cell, vectorized in one sort.
+
+    :rtype: numpy.ndarray
+    """
+    column = np.floor(x / cell_size).astype(np.int64)
+    row = np.floor(y / cell_size).astype(np.int64)
+    # Sorted by cell, within a cell by descending FlowAcc (the last key is the primary one)
+    order = np.lexsort((-flowacc, column, row))
+    row, column = row[order], column[order]
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = (row[1:] != row[:-1]) | (column[1:] != column[:-1])
+    return order[first]
+
+
+def build_pyramid(index, result_files, levels, is_canceled=lambda: False):
+    """Thin the finest flowvectors scale of an iteration into the given levels, if not cached yet.
+
+    :param index: Index of the output folder.
+    :type index: ResultDirectoryIndex
+
+    :param result_files: Flowvectors files of one iteration.
+    :type result_files: list
+
+    :param levels: Pyramid levels (grid cell sizes in map units) to derive, see pyramid_levels.
+    :type levels: list
+
+    :returns: Path of the pyramid GeoPackage, or None if it was canceled.
+    :rtype: str
+    """
+    finest = min(result_files, key=lambda f: f.scale)
+    path = pyramid_path(index.path, finest.iteration)
+    key = sources_key([finest]) + ";levels=" + ",".join(str(level) for level in levels)
+    if is_up_to_date(path, key):
+        return path
+
+    x, y, fields = read_flowvectors(index.file_path(finest))
+    spatial_ref = read_spatial_ref(index.file_path(finest))
+    flowacc = fields["FlowAcc"] if fields["FlowAcc"] is not None else np.zeros(len(x))
+    if is_canceled():
+        return None
+
+    def level_rows():
+        kept = np.arange(len(x))
+        for level in sorted(levels):
+            kept = kept[thin_indices(x[kept], y[kept], flowacc[kept], level)]
+            for i in kept.tolist():
+                point = ogr.Geometry(ogr.wkbPoint)
+                point.AddPoint_2D(float(x[i]), float(y[i]))
+                yield point, level, [float(fields[name][i]) if fields[name] is not None else None
+                                     for name in FLOWVECTOR_FIELDS]
+
+    return write_geopackage(path, key, spatial_ref, level_rows(), is_canceled)
+
+
+class BuildPyramidTask(QgsTask):
+    """Builds the flowvectors pyramid of an iteration in the background, e.g. for a watch mode refresh."""
+
+    def __init__(self, index, result_files, on_finished):
+        """Constructor.
+        :param index: Index of the output folder.
+        :type index: ResultDirectoryIndex
+
+        :param result_files: Flowvectors files of one iteration.
+        :type result_files: list
+
+        :param on_finished: Called on the main thread with (task, result) once the task ended.
+        :type on_finished: function
+        """
+        super().__init__(tr("Thinning SplashTool flowvectors"), QgsTask.Flag.CanCancel)
+        self.index = index
+        self.result_files = result_files
+        self.iteration = result_files[0].iteration if result_files else None
+        self.levels = pyramid_levels(result_files)
+        self.on_finished = on_finished
+        # Path of the pyramid GeoPackage once it was built
+        self.path = None
+        self.exception = None
+
+    def run(self):
+        if not self.levels:
+            return True
+        try:
+            self.path = build_pyramid(self.index, self.result_files, self.levels, self.isCanceled)
+            return self.path is not None
+        except Exception as e:
+            self.exception = e
+            return False
+
+    def finished(self, result):
+        self.on_finished(self, result)
@@ -6,20 +6,20 @@
     <message>
         <location filename="splashtool_result_loader.py" line="32"/>
         <source>Load Latest Files</source>
-        <translation>Neueste Dateien laden</translation>
+        <translation type="obsolete">Neueste Dateien laden</translation>
     </message>
     <message>
-        <location filename="splashtool_result_loader.py" line="156"/>
+        <location filename="splashtool_result_loader.py" line="203"/>
         <source>Load results from SplashTool</source>
         <translation>Ergebnisse von SplashTool laden</translation>
     </message>
     <message>
         <location filename="splashtool_result_loader.py" line="171"/>
         <source>Custom Plugins</source>
-        <translation>Benutzerdefinierte Plugins</translation>
+        <translation type="obsolete">Benutzerdefinierte Plugins</translation>
     </message>
     <message>
-        <location filename="splashtool_result_loader.py" line="168"/>
+        <location filename="splashtool_result_loader.py" line="198"/>
         <source>&amp;SplashTool Result Loader</source>
         <translation>&amp;SplashTool Ergebnis-Lader</translation>
     </message>
@@ -29,99 +29,706 @@
         <translation type="obsolete">Eingabeordner auswählen</translation>
     </message>
     <message>
-        <location filename="splashtool_result_loader.py" line="289"/>
+        <location filename="splashtool_result_loader.py" line="623"/>
         <source>Error</source>
         <translation>Fehler</translation>
     </message>
     <message>
-        <location filename="splashtool_result_loader.py" line="289"/>
+        <location filename="splashtool_result_loader.py" line="629"/>
         <source>Failed to load {}</source>
         <translation>Fehler beim Laden von {}</translation>
     </message>
     <message>
-        <location filename="splashtool_result_loader.py" line="350"/>
+        <location filename="splashtool_result_loader.py" line="1048"/>
         <source>Warning</source>
         <translation>Warnung</translation>
     </message>
     <message>
-        <location filename="splashtool_result_loader.py" line="351"/>
+        <location filename="splashtool_result_loader.py" line="1049"/>
         <source>QML file not found for {}: {}</source>
         <translation>QML-Datei nicht gefunden für {}: {}</translation>
     </message>
     <message>
-        <location filename="splashtool_result_loader.py" line="187"/>
+        <location filename="splashtool_result_loader.py" line="348"/>
         <source>No folder selected</source>
         <translation>Kein Ordner ausgewählt</translation>
     </message>
     <message>
-        <location filename="splashtool_result_loader.py" line="190"/>
+        <location filename="splashtool_result_loader.py" line="351"/>
         <source>Selected folder: {}</source>
         <translation>Ausgewählter Ordner: {}</translation>
     </message>
     <message>
         <location filename="splashtool_result_loader.py" line="204"/>
         <source>Found {} files in directory</source>
-        <translation>{} Dateien im Verzeichnis gefunden</translation>
+        <translation type="obsolete">{} Dateien im Verzeichnis gefunden</translation>
     </message>
     <message>
         <location filename="splashtool_result_loader.py" line="225"/>
         <source>Found matching file: {} (type: {}, counter: {})</source>
-        <translation>Passende Datei gefunden: {} (Typ: {}, Zähler: {})</translation>
+        <translation type="obsolete">Passende Datei gefunden: {} (Typ: {}, Zähler: {})</translation>
     </message>
     <message>
-        <location filename="splashtool_result_loader.py" line="228"/>
+        <location filename="result_files.py" line="56"/>
         <source>Latest files found: {}</source>
         <translation>Neueste Dateien gefunden: {}</translation>
     </message>
     <message>
-        <location filename="splashtool_result_loader.py" line="282"/>
+        <location filename="loader_task.py" line="57"/>
         <source>Unsupported file type: {}</source>
         <translation>Nicht unterstützter Dateityp: {}</translation>
     </message>
     <message>
-        <location filename="splashtool_result_loader.py" line="287"/>
+        <location filename="loader_task.py" line="67"/>
         <source>Failed to load layer: {}</source>
         <translation>Fehler beim Laden der Ebene: {}</translation>
     </message>
     <message>
-        <location filename="splashtool_result_loader.py" line="292"/>
+        <location filename="loader_task.py" line="70"/>
         <source>Successfully loaded layer: {}</source>
         <translation>Ebene erfolgreich geladen: {}</translation>
     </message>
     <message>
-        <location filename="splashtool_result_loader.py" line="325"/>
+        <location filename="splashtool_result_loader.py" line="1027"/>
         <source>No numeric value found in layer name, using default style</source>
         <translation>Kein numerischer Wert im Ebenennamen gefunden, verwende Standardstil</translation>
     </message>
     <message>
-        <location filename="splashtool_result_loader.py" line="330"/>
+        <location filename="splashtool_result_loader.py" line="1031"/>
         <source>No style mapping for layer type: {}</source>
         <translation>Keine Stilzuordnung für Ebenentyp: {}</translation>
     </message>
     <message>
-        <location filename="splashtool_result_loader.py" line="335"/>
+        <location filename="splashtool_result_loader.py" line="1034"/>
         <source>Attempting to apply style from: {}</source>
         <translation>Versuche Stil anzuwenden von: {}</translation>
     </message>
     <message>
-        <location filename="splashtool_result_loader.py" line="341"/>
+        <location filename="splashtool_result_loader.py" line="1039"/>
         <source>Successfully applied style to {}</source>
         <translation>Stil erfolgreich auf {} angewendet</translation>
     </message>
     <message>
         <location filename="splashtool_result_loader.py" line="344"/>
         <source>Failed to apply style to {}</source>
-        <translation>Fehler beim Anwenden des Stils auf {}</translation>
+        <translation type="obsolete">Fehler beim Anwenden des Stils auf {}</translation>
     </message>
     <message>
-        <location filename="splashtool_result_loader.py" line="348"/>
+        <location filename="splashtool_result_loader.py" line="1047"/>
         <source>Style file not found: {}</source>
         <translation>Stildatei nicht gefunden: {}</translation>
     </message>
     <message>
-        <location filename="splashtool_result_loader.py" line="185"/>
+        <location filename="splashtool_result_loader.py" line="346"/>
         <source>Select Folder containing SplashTool results</source>
         <translation>Wähle Ordner mit SplashTool Ergebnisdateien</translation>
     </message>
+    <message>
+        <location filename="difference.py" line="161"/>
+        <source>Computing SplashTool water depth difference</source>
+        <translation>Berechne SplashTool Wassertiefendifferenz</translation>
+    </message>
+    <message>
+        <location filename="difference_dialog.py" line="22"/>
+        <source>Water depth difference</source>
+        <translation>Wassertiefendifferenz</translation>
+    </message>
+    <message>
+        <location filename="difference_dialog.py" line="37"/>
+        <source>Water depth</source>
+        <translation>Wassertiefe</translation>
+    </message>
+    <message>
+        <location filename="difference_dialog.py" line="38"/>
+        <source>minus water depth</source>
+        <translation>minus Wassertiefe</translation>
+    </message>
+    <message>
+        <location filename="flowvector_cache.py" line="191"/>
+        <source>Converting SplashTool flowvectors</source>
+        <translation>Konvertiere SplashTool Fließvektoren</translation>
+    </message>
+    <message>
+        <location filename="flowvector_pyramid.py" line="112"/>
+        <source>Thinning SplashTool flowvectors</source>
+        <translation>Dünne SplashTool Fließvektoren aus</translation>
+    </message>
+    <message>
+        <location filename="loader_task.py" line="124"/>
+        <source>Loading SplashTool results</source>
+        <translation>Lade SplashTool Ergebnisse</translation>
+    </message>
+    <message>
+        <location filename="loader_task.py" line="255"/>
+        <source>Deferred opening {} until the canvas zooms into its scale range</source>
+        <translation>Öffnen von {} zurückgestellt, bis die Karte in seinen Maßstabsbereich zoomt</translation>
+    </message>
+    <message>
+        <location filename="loader_task.py" line="174"/>
+        <source>Flowvectors pyramid could not be built, loading without it: {}</source>
+        <translation>Fließvektoren-Pyramide konnte nicht erstellt werden, lade ohne sie: {}</translation>
+    </message>
+    <message>
+        <location filename="overviews.py" line="112"/>
+        <source>Building overviews for SplashTool results</source>
+        <translation>Erstelle Übersichten für SplashTool Ergebnisse</translation>
+    </message>
+    <message>
+        <location filename="overviews.py" line="90"/>
+        <source>Resampling {} not supported, building overviews with {}</source>
+        <translation>Resampling {} nicht unterstützt, erstelle Übersichten mit {}</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="112"/>
+        <source>Derived data</source>
+        <translation>Abgeleitete Daten</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="150"/>
+        <source>Load latest SplashTool results</source>
+        <translation>Neueste SplashTool Ergebnisse laden</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="153"/>
+        <source>Results</source>
+        <translation>Ergebnisse</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="159"/>
+        <source>Finds the latest iteration of a SplashTool output folder and loads its flowvectors and rasters with the styles of the plugin into a group named after the run. Optionally the group is also written to a QGIS project (.qgs) or layer definition (.qlr).</source>
+        <translation>Sucht die neueste Iteration eines SplashTool Ausgabeordners und lädt deren Fließvektoren und Raster mit den Stilen des Plugins in eine nach dem Lauf benannte Gruppe. Optional wird die Gruppe auch in ein QGIS-Projekt (.qgs) oder eine Layerdefinition (.qlr) geschrieben.</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="218"/>
+        <source>Build raster overviews</source>
+        <translation>Raster-Übersichten erstellen</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="221"/>
+        <source>Builds external .ovr overviews of the latest water depth (averaged) and flow accumulation (maximum) rasters of a SplashTool output folder. Up-to-date overviews are kept.</source>
+        <translation>Erstellt externe .ovr-Übersichten der neuesten Raster der Wassertiefe (gemittelt) und der Fließakkumulation (Maximum) eines SplashTool Ausgabeordners. Aktuelle Übersichten bleiben erhalten.</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="257"/>
+        <source>Build flowvectors spatial indexes</source>
+        <translation>Räumliche Indizes der Fließvektoren erstellen</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="260"/>
+        <source>Creates .qix spatial indexes for the flowvectors shapefiles of the latest iteration of a SplashTool output folder. Up-to-date indexes are kept.</source>
+        <translation>Erstellt räumliche .qix-Indizes für die Fließvektoren-Shapefiles der neuesten Iteration eines SplashTool Ausgabeordners. Aktuelle Indizes bleiben erhalten.</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="291"/>
+        <source>Convert flowvectors to GeoPackage</source>
+        <translation>Fließvektoren in GeoPackage konvertieren</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="294"/>
+        <source>Converts all flowvectors scales of the latest iteration into one spatially indexed GeoPackage with a scale column in the cache folder of the output folder. An up-to-date GeoPackage is reused.</source>
+        <translation>Konvertiert alle Fließvektoren-Maßstäbe der neuesten Iteration in ein räumlich indiziertes GeoPackage mit einer Maßstabsspalte im Cache-Ordner des Ausgabeordners. Ein aktuelles GeoPackage wird wiederverwendet.</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="318"/>
+        <source>Build flowvectors pyramid</source>
+        <translation>Fließvektoren-Pyramide erstellen</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="321"/>
+        <source>Derives the flowvectors levels 128, 256 and 512 that are coarser than the scales written by SplashTool from the finest scale of the latest iteration, keeping the vector with the highest FlowAcc per grid cell. The levels are cached in a GeoPackage.</source>
+        <translation>Leitet die Fließvektoren-Stufen 128, 256 und 512, die gröber als die von SplashTool geschriebenen Maßstäbe sind, aus dem feinsten Maßstab der neuesten Iteration ab und behält dabei je Gitterzelle den Vektor mit dem höchsten FlowAcc. Die Stufen werden in einem GeoPackage zwischengespeichert.</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="355"/>
+        <source>Computes the later minus the earlier water depth window by window, e.g. of two checkpoints or two runs. Cells that are nodata in either raster are nodata in the result. The result is shown red where the water depth decreased and blue where it increased.</source>
+        <translation>Berechnet fensterweise die spätere minus die frühere Wassertiefe, z. B. zweier Checkpoints oder zweier Läufe. Zellen, die in einem der Raster NoData sind, sind auch im Ergebnis NoData. Das Ergebnis wird rot dargestellt, wo die Wassertiefe abgenommen hat, und blau, wo sie zugenommen hat.</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="392"/>
+        <source>Water balance table</source>
+        <translation>Wasserbilanz-Tabelle</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="401"/>
+        <source>Collects the water balance (initial and remaining volume, outflow from sinks, volume error, ...) written to the .splashconfig of every checkpoint into one table with a row per iteration.</source>
+        <translation>Sammelt die in die .splashconfig jedes Checkpoints geschriebene Wasserbilanz (Anfangs- und Restvolumen, Abfluss aus Senken, Volumenfehler, ...) in einer Tabelle mit einer Zeile je Iteration.</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="118"/>
+        <source>SplashTool output folder</source>
+        <translation>SplashTool Ausgabeordner</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="166"/>
+        <source>Project or layer definition file</source>
+        <translation>Projekt- oder Layerdefinitionsdatei</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="167"/>
+        <source>QGIS project (*.qgs);;QGIS layer definition (*.qlr)</source>
+        <translation>QGIS-Projekt (*.qgs);;QGIS-Layerdefinition (*.qlr)</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="168"/>
+        <source>Loaded layers</source>
+        <translation>Geladene Ebenen</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="169"/>
+        <source>Iteration</source>
+        <translation>Iteration</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="226"/>
+        <source>Rasters with new overviews</source>
+        <translation>Raster mit neuen Übersichten</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="265"/>
+        <source>Shapefiles with new spatial indexes</source>
+        <translation>Shapefiles mit neuen räumlichen Indizes</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="300"/>
+        <source>Flowvectors GeoPackage</source>
+        <translation>Fließvektoren-GeoPackage</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="327"/>
+        <source>Flowvectors pyramid GeoPackage</source>
+        <translation>GeoPackage der Fließvektoren-Pyramide</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="335"/>
+        <source>SplashTool already wrote all pyramid levels</source>
+        <translation>SplashTool hat bereits alle Pyramidenstufen geschrieben</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="360"/>
+        <source>Earlier water depth</source>
+        <translation>Frühere Wassertiefe</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="361"/>
+        <source>Later water depth</source>
+        <translation>Spätere Wassertiefe</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="363"/>
+        <source>Nodata value (default: nodata of the rasters)</source>
+        <translation>NoData-Wert (Standard: NoData der Raster)</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="371"/>
+        <source>Choose two water depth rasters</source>
+        <translation>Zwei Wassertiefen-Raster auswählen</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="408"/>
+        <source>Water balance</source>
+        <translation>Wasserbilanz</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="408"/>
+        <source>CSV files (*.csv)</source>
+        <translation>CSV-Dateien (*.csv)</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="95"/>
+        <source>Failed to apply style to {}: {}</source>
+        <translation>Fehler beim Anwenden des Stils auf {}: {}</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="124"/>
+        <source>SplashTool output folder not found: {}</source>
+        <translation>SplashTool Ausgabeordner nicht gefunden: {}</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="182"/>
+        <source>No SplashTool results could be loaded from {}</source>
+        <translation>Aus {} konnten keine SplashTool Ergebnisse geladen werden</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="239"/>
+        <source>Building overviews of {}</source>
+        <translation>Erstelle Übersichten von {}</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="305"/>
+        <source>No flowvectors found in {}</source>
+        <translation>Keine Fließvektoren in {} gefunden</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="415"/>
+        <source>No water balance found in {}</source>
+        <translation>Keine Wasserbilanz in {} gefunden</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="237"/>
+        <source>Overviews of {} are up to date</source>
+        <translation>Übersichten von {} sind aktuell</translation>
+    </message>
+    <message>
+        <location filename="processing_algorithms.py" line="279"/>
+        <source>Could not index {}: {}</source>
+        <translation>{} konnte nicht indiziert werden: {}</translation>
+    </message>
+    <message>
+        <location filename="processing_provider.py" line="26"/>
+        <source>SplashTool</source>
+        <translation>SplashTool</translation>
+    </message>
+    <message>
+        <location filename="result_files.py" line="42"/>
+        <source>Found {} result files in directory</source>
+        <translation>{} Ergebnisdateien im Verzeichnis gefunden</translation>
+    </message>
+    <message>
+        <location filename="result_files.py" line="40"/>
+        <source>Results of {} not found, searching the directory</source>
+        <translation>Ergebnisse von {} nicht gefunden, durchsuche das Verzeichnis</translation>
+    </message>
+    <message>
+        <location filename="result_files.py" line="84"/>
+        <source>Resolved results from {}: {}</source>
+        <translation>Ergebnisse aus {} ermittelt: {}</translation>
+    </message>
+    <message>
+        <location filename="spatial_index.py" line="74"/>
+        <source>Building spatial indexes for SplashTool flowvectors</source>
+        <translation>Erstelle räumliche Indizes für SplashTool Fließvektoren</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="924"/>
+        <source>Refreshed {} to iteration {}</source>
+        <translation>{} auf Iteration {} aktualisiert</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="359"/>
+        <source>Select Folders containing SplashTool results</source>
+        <translation>Wähle Ordner mit SplashTool Ergebnisdateien</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="691"/>
+        <source>tiles</source>
+        <translation>Kacheln</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="710"/>
+        <source>Minimum flow accumulation</source>
+        <translation>Minimale Fließakkumulation</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="1057"/>
+        <source>{} is no SplashTool result, keeping the class breaks of the style</source>
+        <translation>{} ist kein SplashTool Ergebnis, die Klassengrenzen des Stils bleiben erhalten</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="1063"/>
+        <source>Adapted class breaks of {} to {}</source>
+        <translation>Klassengrenzen von {} an {} angepasst</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="1065"/>
+        <source>Class breaks of {} not adapted</source>
+        <translation>Klassengrenzen von {} nicht angepasst</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="209"/>
+        <source>Load and compare several SplashTool runs</source>
+        <translation>Mehrere SplashTool Läufe laden und vergleichen</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="216"/>
+        <source>Water depth difference between iterations or runs</source>
+        <translation>Wassertiefendifferenz zwischen Iterationen oder Läufen</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="223"/>
+        <source>Minimum flow accumulation of the selected group</source>
+        <translation>Minimale Fließakkumulation der ausgewählten Gruppe</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="230"/>
+        <source>Flowvectors statistics of the selected group</source>
+        <translation>Fließvektoren-Statistik der ausgewählten Gruppe</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="237"/>
+        <source>Water balance of the selected group</source>
+        <translation>Wasserbilanz der ausgewählten Gruppe</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="244"/>
+        <source>Export the last loaded group to a tile cache</source>
+        <translation>Zuletzt geladene Gruppe in einen Kachel-Cache exportieren</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="251"/>
+        <source>Verbose logging</source>
+        <translation>Ausführliche Protokollierung</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="259"/>
+        <source>Open result files concurrently</source>
+        <translation>Ergebnisdateien parallel öffnen</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="267"/>
+        <source>Build raster overviews in the background</source>
+        <translation>Raster-Übersichten im Hintergrund erstellen</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="275"/>
+        <source>Build flowvectors spatial indexes in the background</source>
+        <translation>Räumliche Indizes der Fließvektoren im Hintergrund erstellen</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="283"/>
+        <source>Load flowvectors from a GeoPackage cache</source>
+        <translation>Fließvektoren aus einem GeoPackage-Cache laden</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="291"/>
+        <source>Derive coarser flowvectors levels for zoomed out views</source>
+        <translation>Gröbere Fließvektoren-Stufen für herausgezoomte Ansichten ableiten</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="299"/>
+        <source>Open flowvectors only when zoomed into their scale range</source>
+        <translation>Fließvektoren erst öffnen, wenn in ihren Maßstabsbereich gezoomt wird</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="307"/>
+        <source>Watch loaded folder for new iterations</source>
+        <translation>Geladenen Ordner auf neue Iterationen überwachen</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="413"/>
+        <source>SplashTool: loaded {} ({}/{})</source>
+        <translation>SplashTool: {} geladen ({}/{})</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="567"/>
+        <source>Load SplashTool results with at least two water depth rasters first.</source>
+        <translation>Laden Sie zuerst SplashTool Ergebnisse mit mindestens zwei Wassertiefen-Rastern.</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="575"/>
+        <source>Choose two different water depth rasters.</source>
+        <translation>Wählen Sie zwei verschiedene Wassertiefen-Raster.</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="623"/>
+        <source>Failed to compute the water depth difference</source>
+        <translation>Fehler beim Berechnen der Wassertiefendifferenz</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="638"/>
+        <source>Tile cache</source>
+        <translation>Kachel-Cache</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="639"/>
+        <source>Load SplashTool results first, the last loaded group will be exported.</source>
+        <translation>Laden Sie zuerst SplashTool Ergebnisse, die zuletzt geladene Gruppe wird exportiert.</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="649"/>
+        <source>The group has no layers to export.</source>
+        <translation>Die Gruppe enthält keine Ebenen zum Exportieren.</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="707"/>
+        <source>Select a SplashTool group in the layers panel first.</source>
+        <translation>Wählen Sie zuerst eine SplashTool Gruppe im Ebenenbedienfeld aus.</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="730"/>
+        <source>Flowvectors statistics</source>
+        <translation>Fließvektoren-Statistik</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="847"/>
+        <source>Watch mode</source>
+        <translation>Überwachungsmodus</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="848"/>
+        <source>Load SplashTool results first, the last loaded folder will be watched.</source>
+        <translation>Laden Sie zuerst SplashTool Ergebnisse, der zuletzt geladene Ordner wird überwacht.</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="364"/>
+        <source>Selected folders: {}</source>
+        <translation>Ausgewählte Ordner: {}</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="415"/>
+        <source>, about {:.0f} s remaining</source>
+        <translation>, noch etwa {:.0f} s</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="711"/>
+        <source>Hide flowvectors of {} with a flow accumulation below:</source>
+        <translation>Fließvektoren von {} ausblenden mit einer Fließakkumulation unter:</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="757"/>
+        <source>Flowvectors statistics of {}:
+{}</source>
+        <translation>Fließvektoren-Statistik von {}:
+{}</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="759"/>
+        <source>Flowvectors statistics of {}</source>
+        <translation>Fließvektoren-Statistik von {}</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="862"/>
+        <source>Watching {} for iterations after {}</source>
+        <translation>Überwache {} auf Iterationen nach {}</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="450"/>
+        <source>Loading SplashTool results was canceled</source>
+        <translation>Laden der SplashTool Ergebnisse wurde abgebrochen</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="468"/>
+        <source>Load details for {}:</source>
+        <translation>Ladedetails für {}:</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="548"/>
+        <source>{} failed: {}</source>
+        <translation>{} fehlgeschlagen: {}</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="551"/>
+        <source>{} failed for {}: {}</source>
+        <translation>{} für {} fehlgeschlagen: {}</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="612"/>
+        <source>{}: iteration {}</source>
+        <translation>{}: Iteration {}</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="664"/>
+        <source>Processing algorithm {} not available</source>
+        <translation>Processing-Algorithmus {} nicht verfügbar</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="688"/>
+        <source>Tile cache export of {} failed</source>
+        <translation>Export von {} in den Kachel-Cache fehlgeschlagen</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="745"/>
+        <source>{}: {} vectors</source>
+        <translation>{}: {} Vektoren</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="755"/>
+        <source>No flowvectors found for iteration {}</source>
+        <translation>Keine Fließvektoren für Iteration {} gefunden</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="808"/>
+        <source>Opened deferred layer {} at scale 1:{:.0f}</source>
+        <translation>Zurückgestellte Ebene {} bei Maßstab 1:{:.0f} geöffnet</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="959"/>
+        <source>{} failed, loading the shapefiles: {}</source>
+        <translation>{} fehlgeschlagen, lade die Shapefiles: {}</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="446"/>
+        <source>Loading SplashTool results failed: {}</source>
+        <translation>Laden der SplashTool Ergebnisse fehlgeschlagen: {}</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="559"/>
+        <source>{}: {}</source>
+        <translation>{}: {}</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="723"/>
+        <source>Could not filter {} by flow accumulation</source>
+        <translation>{} konnte nicht nach Fließakkumulation gefiltert werden</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="748"/>
+        <source>  FlowAcc {:.1f} to {:.1f}, mean {:.1f}, median {:.1f}, 90 % {:.1f}</source>
+        <translation>  FlowAcc {:.1f} bis {:.1f}, Mittelwert {:.1f}, Median {:.1f}, 90 % {:.1f}</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="839"/>
+        <source>Could not write load timings: {}</source>
+        <translation>Ladezeiten konnten nicht geschrieben werden: {}</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="743"/>
+        <source>{}: could not be read ({})</source>
+        <translation>{}: konnte nicht gelesen werden ({})</translation>
+    </message>
+    <message>
+        <location filename="splashtool_result_loader.py" line="752"/>
+        <source>  {:g} - {:g}: {}</source>
+        <translation>  {:g} - {:g}: {}</translation>
+    </message>
+    <message>
+        <location filename="water_balance_dock.py" line="24"/>
+        <source>remaining volume</source>
+        <translation>Restvolumen</translation>
+    </message>
+    <message>
+        <location filename="water_balance_dock.py" line="25"/>
+        <source>outflow from sinks</source>
+        <translation>Abfluss aus Senken</translation>
+    </message>
+    <message>
+        <location filename="water_balance_dock.py" line="28"/>
+        <source>volume error [%]</source>
+        <translation>Volumenfehler [%]</translation>
+    </message>
+    <message>
+        <location filename="water_balance_dock.py" line="97"/>
+        <source>SplashTool water balance</source>
+        <translation>SplashTool Wasserbilanz</translation>
+    </message>
+    <message>
+        <location filename="water_balance_dock.py" line="107"/>
+        <source>Refresh</source>
+        <translation>Aktualisieren</translation>
+    </message>
+    <message>
+        <location filename="water_balance_dock.py" line="64"/>
+        <source>Not enough checkpoints</source>
+        <translation>Nicht genügend Checkpoints</translation>
+    </message>
+    <message>
+        <location filename="water_balance_dock.py" line="154"/>
+        <source>stable</source>
+        <translation>stabil</translation>
+    </message>
+    <message>
+        <location filename="water_balance_dock.py" line="154"/>
+        <source>not stable yet</source>
+        <translation>noch nicht stabil</translation>
+    </message>
+    <message>
+        <location filename="water_balance_dock.py" line="152"/>
+        <source>{} checkpoints</source>
+        <translation>{} Checkpoints</translation>
+    </message>
+    <message>
+        <location filename="water_balance_dock.py" line="155"/>
+        <source>{} checkpoints, remaining volume changed by {:+.3f} % since the previous checkpoint ({})</source>
+        <translation>{} Checkpoints, Restvolumen seit dem vorherigen Checkpoint um {:+.3f} % verändert ({})</translation>
+    </message>
 </context>
 </TS>
@@ -0,0 +1,291 @@
+# Python standard library
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Qt imports
+from qgis.PyQt.QtCore import QCoreApplication, pyqtSignal
+
+# QGIS imports
+from qgis.core import QgsTask, QgsCoordinateReferenceSystem, QgsRasterLayer, QgsVectorLayer
+
+# Local imports
+from .flowvector_cache import FLOWVECTOR_FIELDS, convert_flowvectors, geopackage_layer_uri
+from .flowvector_pyramid import PYRAMID_ERRORS, build_pyramid, pyramid_levels
+from .log import LoadLog
+from .manifest import collect_layer_metadata
+from .result_files import tr, find_result_files, layer_load_order, read_config
+from .result_index import get_result_index
+from .splashconfig import run_name
+from .style_cache import style_cache, in_scale_range
+from .symbology import style_path
+from .timing import LoadTimer
+
+# The loader task scans the output folder and opens all data providers in a
+# background thread. Styling and adding the layers to the layer tree has to
+# happen on the main thread and is done by the plugin once the task finished.
+#
+# In lazy mode flowvectors scales that are not visible at the current canvas
+# scale are not opened. They are added as empty memory layers that remember
+# their real source in the custom property DEFERRED_SOURCE_PROPERTY, the plugin
+# swaps in the real data provider once the canvas zooms into their scale range.
+
+DEFERRED_SOURCE_PROPERTY = "splashtool/deferred_source"
+
+
+def open_layer(file_path, layer_name, timer=None, log=None):
+    """Open a SplashTool result file as a QGIS layer.
+
+    Safe to call from a background thread, the layer is not added to any project.
+
+    :param timer: Records the provider_open and is_valid phases, optional.
+    :type timer: LoadTimer
+
+    :param log: Log of the load, a new LoadLog if not given.
+    :type log: LoadLog
+
+    :returns: The opened layer or None if the file type is not supported or the layer is invalid.
+    :rtype: QgsMapLayer
+    """
+    log = log or LoadLog()
+    start = time.perf_counter()
+    if file_path.endswith(".tif"):
+        layer = QgsRasterLayer(file_path, layer_name)
+    elif file_path.split("|")[0].endswith((".shp", ".gpkg")):
+        layer = QgsVectorLayer(file_path, layer_name, "ogr")
+    else:
+        log.warning("Unsupported file type: {}", file_path)
+        return None
+    if timer:
+        timer.add("provider_open", time.perf_counter() - start, layer_name)
+
+    start = time.perf_counter()
+    valid = layer.isValid()
+    if timer:
+        timer.add("is_valid", time.perf_counter() - start, layer_name)
+    if not valid:
+        log.critical("Failed to load layer: {}", file_path)
+        return None
+
+    log.verbose("Successfully loaded layer: {}", file_path)
+    return layer
+
+
+def placeholder_layer(source, layer_name, crs):
+    """Create an empty flowvectors layer that stands in for a source that is opened later.
+
+    The placeholder has the point geometry and fields of the flowvectors, so the
+    style can be applied to it and is kept when the data source is swapped.
+
+    :param source: Path or URI of the real flowvectors data source.
+    :type source: str
+
+    :param crs: Coordinate reference system of the real data source.
+    :type crs: QgsCoordinateReferenceSystem
+
+    :rtype: QgsVectorLayer
+    """
+    fields = "&".join(f"field={name}:double" for name in FLOWVECTOR_FIELDS)
+    layer = QgsVectorLayer(f"Point?{fields}", layer_name, "memory")
+    layer.setCrs(crs)
+    layer.setCustomProperty(DEFERRED_SOURCE_PROPERTY, source)
+    return layer
+
+
+class ResultLoaderTask(QgsTask):
+    """Background task that finds and opens the latest results of a SplashTool output folder."""
+
+    # layer name, number of opened files, total number of files, estimated remaining seconds
+    fileLoaded = pyqtSignal(str, int, int, float)
+
+    def __init__(self, input_folder, on_finished, concurrent=True, flowvectors_geopackage=False, lazy_scale=None,
+                 pyramid=False):
+        """Constructor.
+        :param input_folder: SplashTool output directory to load.
+        :type input_folder: str
+
+        :param on_finished: Called on the main thread with (task, result) once the task ended.
+        :type on_finished: function
+
+        :param concurrent: Open all data providers at the same time in a worker pool.
+        :type concurrent: bool
+
+        :param flowvectors_geopackage: Load the flowvectors from a cached GeoPackage
+            conversion instead of the shapefiles.
+        :type flowvectors_geopackage: bool
+
+        :param lazy_scale: Current canvas scale. If given, flowvectors that are not
+            visible at this scale are added as placeholders instead of being opened.
+        :type lazy_scale: float
+
+        :param pyramid: Add coarser flowvectors levels thinned from the finest scale.
+        :type pyramid: bool
+        """
+        super().__init__(tr("Loading SplashTool results"), QgsTask.Flag.CanCancel)
+        self.input_folder = input_folder
+        self.on_finished = on_finished
+        self.concurrent = concurrent
+        self.flowvectors_geopackage = flowvectors_geopackage
+        self.lazy_scale = lazy_scale
+        self.pyramid = pyramid
+        # layer name -> data source of the flowvectors pyramid levels
+        self.pyramid_sources = {}
+        # Path of the converted flowvectors GeoPackage, if used
+        self.geopackage = None
+        self.index = None
+        # Newest iteration among the loaded files
+        self.iteration = None
+        # Name of the run derived from its newest .splashconfig, used for group names
+        self.run_name = None
+        # List of (layer, layer_name) in the order they are added to the group
+        self.loaded_layers = []
+        self.failed_files = []
+        self.exception = None
+        self.timer = LoadTimer(input_folder)
+        self.log = LoadLog()
+
+    def run(self):
+        try:
+            with self.timer.phase("scan"):
+                self.index = get_result_index(self.input_folder)
+            with self.timer.phase("match"):
+                latest_files, all_flowvectors = find_result_files(self.index, self.log)
+                self.run_name = run_name(read_config(self.index), self.input_folder)
+            if self.isCanceled():
+                return False
+
+            if self.flowvectors_geopackage and all_flowvectors:
+                self.setDescription(tr("Converting SplashTool flowvectors"))
+                with self.timer.phase("convert"):
+                    self.geopackage = convert_flowvectors(self.index, all_flowvectors, self.isCanceled)
+                self.setDescription(tr("Loading SplashTool results"))
+            if self.isCanceled():
+                return False
+
+            pyramid_layers = []
+            levels = pyramid_levels(all_flowvectors) if self.pyramid else []
+            if levels:
+                self.setDescription(tr("Thinning SplashTool flowvectors"))
+                with self.timer.phase("pyramid"):
+                    try:
+                        path = build_pyramid(self.index, all_flowvectors, levels, self.isCanceled)
+                    except PYRAMID_ERRORS as e:
+                        # The levels are an extra, the results are loaded without them
+                        self.log.warning("Flowvectors pyramid could not be built, loading without it: {}", e)
+                        path = None
+                self.setDescription(tr("Loading SplashTool results"))
+                if self.isCanceled():
+                    return False
+                if path is not None:
+                    # The levels are coarser than all written scales, so they come first
+                    finest = min(all_flowvectors, key=lambda f: f.scale)
+                    for level in sorted(levels, reverse=True):
+                        layer_name = f"flowvectors_{level}"
+                        self.pyramid_sources[layer_name] = geopackage_layer_uri(path, level)
+                        pyramid_layers.append((finest, layer_name))
+
+            layers = pyramid_layers + layer_load_order(latest_files, all_flowvectors)
+            self.iteration = max((result_file.iteration for result_file, _ in layers), default=None)
+            self._start = time.monotonic()
+            self._opened = 0
+            with self.timer.phase("open"):
+                if self.concurrent and len(layers) > 1:
+                    opened = self.open_concurrently(layers)
+                else:
+                    opened = self.open_sequentially(layers)
+            if opened is None:
+                return False
+
+            # Assemble in the original order, independent of which file finished first
+            for (result_file, layer_name), layer in zip(layers, opened):
+                if layer:
+                    self.loaded_layers.append((layer, layer_name))
+                else:
+                    self.failed_files.append(self.pyramid_sources.get(layer_name) or self.index.file_path(result_file))
+
+            # Keep the manifest next to the results up to date for the next load
+            self.index.save_manifest()
+            return True
+        except Exception as e:
+            self.exception = e
+            return False
+
+    def open_sequentially(self, layers):
+        opened = []
+        for result_file, layer_name in layers:
+            if self.isCanceled():
+                return None
+            opened.append(self.open_task_layer(result_file, layer_name))
+            self.report_opened(layer_name, len(layers))
+        return opened
+
+    def open_concurrently(self, layers):
+        opened = [None] * len(layers)
+        max_workers = min(len(layers), os.cpu_count() or 4)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = {
+                executor.submit(self.open_task_layer, result_file, layer_name): index
+                for index, (result_file, layer_name) in enumerate(layers)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                opened[index] = future.result()
+                self.report_opened(layers[index][1], len(layers))
+                if self.isCanceled():
+                    return None
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        return opened
+
+    def open_task_layer(self, result_file, layer_name):
+        """Open a layer and hand it over to the main thread (runs in a worker thread)."""
+        if self.isCanceled():
+            return None
+        if layer_name in self.pyramid_sources:
+            source = self.pyramid_sources[layer_name]
+        elif result_file.artifact == "flowvectors" and self.geopackage:
+            source = geopackage_layer_uri(self.geopackage, result_file.scale)
+        else:
+            source = self.index.file_path(result_file)
+        if self.lazy_scale is not None and result_file.artifact == "flowvectors":
+            scale_range = style_cache.scale_range(style_path("flowvectors", layer_name))
+            if not in_scale_range(scale_range, self.lazy_scale):
+                layer = placeholder_layer(source, layer_name, self.flowvectors_crs(result_file))
+                self.log.verbose("Deferred opening {} until the canvas zooms into its scale range", source)
+                layer.moveToThread(QCoreApplication.instance().thread())
+                return layer
+        layer = open_layer(source, layer_name, self.timer, self.log)
+        if layer:
+            metadata = self.index.layer_metadata(result_file)
+            quantiles = result_file.artifact == "wd"
+            # Pyramid levels share the result file of the finest scale, but not its metadata
+            if layer_name not in self.pyramid_sources and \
+                    (metadata is None or (quantiles and "visible_quantiles" not in metadata)):
+                # Water depth quantiles are sampled here, so styling needs no raster access
+                self.index.set_layer_metadata(result_file, collect_layer_metadata(layer, quantiles))
+            # A QObject can only be moved by the thread it belongs to
+            layer.moveToThread(QCoreApplication.instance().thread())
+        return layer
+
+    def flowvectors_crs(self, result_file):
+        """CRS of a flowvectors file from the cached metadata or its .prj, without opening it."""
+        metadata = self.index.layer_metadata(result_file)
+        if metadata and metadata.get("crs"):
+            return QgsCoordinateReferenceSystem(metadata["crs"])
+        prj_path = os.path.splitext(self.index.file_path(result_file))[0] + ".prj"
+        try:
+            with open(prj_path, encoding="utf-8", errors="replace") as f:
+                return QgsCoordinateReferenceSystem.fromWkt(f.read())
+        except OSError:
+            return QgsCoordinateReferenceSystem()
+
+    def report_opened(self, layer_name, total):
+        self._opened += 1
+        elapsed = time.monotonic() - self._start
+        remaining = elapsed / self._opened * (total - self._opened)
+        self.fileLoaded.emit(layer_name, self._opened, total, remaining)
+        self.setProgress(100.0 * self._opened / total)
+
+    def finished(self, result):
+        self.on_finished(self, result)
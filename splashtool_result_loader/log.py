@@ -0,0 +1,87 @@
+# Python standard library
+from collections import deque
+
+# Qt imports
+from qgis.PyQt.QtCore import QCoreApplication
+
+# QGIS imports
+from qgis.core import QgsMessageLog, Qgis
+
+# Local imports
+from .settings import get_setting
+
+# Level-gated logging for loads. Messages are passed untranslated with their
+# format arguments, so nothing is translated or formatted for levels below the
+# configured threshold. Verbose messages (one per file, layer or style step) are
+# collected in a ring buffer and written as one log message per load by flush().
+
+LOG_TAG = "SplashTool Result Loader"
+
+VERBOSE = 0
+INFO = 1
+WARNING = 2
+CRITICAL = 3
+
+LEVEL_NAMES = {"verbose": VERBOSE, "info": INFO, "warning": WARNING, "critical": CRITICAL}
+QGIS_LEVELS = {VERBOSE: Qgis.Info, INFO: Qgis.Info, WARNING: Qgis.Warning, CRITICAL: Qgis.Critical}
+
+# Number of verbose entries kept per load, older entries are dropped
+RING_BUFFER_SIZE = 1000
+
+
+class LoadLog:
+    """Log of a single load with a verbosity threshold and a ring buffer for verbose messages."""
+
+    def __init__(self, level=None, capacity=RING_BUFFER_SIZE):
+        """Constructor.
+        :param level: Threshold, one of "verbose", "info", "warning" or "critical".
+            Defaults to the "log_level" setting.
+        :type level: str
+        """
+        if level is None:
+            level = get_setting("log_level")
+        self.threshold = LEVEL_NAMES.get(level, INFO)
+        self._buffer = deque(maxlen=capacity)
+        self._dropped = 0
+
+    def enabled(self, level):
+        return level >= self.threshold
+
+    def log(self, level, message, *args):
+        """Log a message, translated and formatted only if its level is enabled."""
+        if level < self.threshold:
+            return
+        text = QCoreApplication.translate('SplashToolResultLoader', message)
+        if args:
+            text = text.format(*args)
+        if level == VERBOSE:
+            if len(self._buffer) == self._buffer.maxlen:
+                self._dropped += 1
+            self._buffer.append(text)
+        else:
+            QgsMessageLog.logMessage(text, LOG_TAG, QGIS_LEVELS[level])
+
+    def verbose(self, message, *args):
+        self.log(VERBOSE, message, *args)
+
+    def info(self, message, *args):
+        self.log(INFO, message, *args)
+
+    def warning(self, message, *args):
+        self.log(WARNING, message, *args)
+
+    def critical(self, message, *args):
+        self.log(CRITICAL, message, *args)
+
+    def flush(self, title=""):
+        """Write all buffered verbose messages as a single log message."""
+        if not self._buffer:
+            return
+        lines = list(self._buffer)
+        self._buffer.clear()
+        if self._dropped:
+            lines.insert(0, f"... {self._dropped} earlier entries dropped")
+            self._dropped = 0
+        if title:
+            lines.insert(0, title)
+        QgsMessageLog.logMessage("\n".join(lines), LOG_TAG, Qgis.Info)
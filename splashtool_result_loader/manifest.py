@@ -0,0 +1,152 @@
+# Python standard library
+import hashlib
+import json
+import os
+
+# QGIS imports
+from qgis.core import QgsApplication, QgsVectorLayer, QgsMessageLog, Qgis
+
+# Local imports
+from .classification import sample_quantiles
+
+# The manifest is a small JSON file that stores the result index of a SplashTool
+# output folder together with layer metadata (extents, raster statistics, vector
+# feature counts). It is written into the output folder, so it can be reused in a
+# new QGIS session or by a colleague. If the folder is not writable, the manifest
+# is stored in the QGIS profile instead.
+#
+# Layout:
+# {
+#   "version": 1,
+#   "dir_mtime": <folder mtime in ns>,
+#   "latest": {"wd": "315000wd_out.tif", ...},
+#   "iterations": {"315000": ["315000.splashconfig", ...], ...},
+#   "files": {"315000wd_out.tif": {"iteration": 315000, "artifact": "wd", "scale": null,
+#                                  "size": ..., "mtime": ..., "metadata": {...}}, ...}
+# }
+
+MANIFEST_NAME = ".splashtool_manifest.json"
+MANIFEST_VERSION = 1
+# Folder for derived data (e.g. converted flowvectors) inside the output folder
+CACHE_DIR_NAME = ".splashtool_cache"
+
+
+def folder_key(folder):
+    return hashlib.sha1(os.path.normcase(os.path.abspath(folder)).encode("utf-8")).hexdigest()
+
+
+def profile_directory(*parts):
+    return os.path.join(QgsApplication.qgisSettingsDirPath(), "splashtool_result_loader", *parts)
+
+
+def manifest_paths(folder):
+    """Possible manifest locations, in the order they are tried."""
+    return [os.path.join(folder, MANIFEST_NAME),
+            profile_directory("manifests", f"{folder_key(folder)}.json")]
+
+
+def cache_directory(folder):
+    """Directory for derived data of an output folder, created if missing.
+
+    Like the manifest it lives inside the output folder, or in the QGIS profile
+    if the output folder is read-only.
+    """
+    for path in (os.path.join(folder, CACHE_DIR_NAME), profile_directory("cache", folder_key(folder))):
+        try:
+            os.makedirs(path, exist_ok=True)
+        except OSError:
+            continue
+        if os.access(path, os.W_OK):
+            return path
+    raise IOError(f"No writable cache directory for {folder}")
+
+
+def read_manifest(folder):
+    """Read the manifest of an output folder.
+
+    :returns: The manifest or None if there is no valid manifest.
+    :rtype: dict
+    """
+    for path in manifest_paths(folder):
+        try:
+            with open(path, encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if isinstance(manifest, dict) and manifest.get("version") == MANIFEST_VERSION:
+            return manifest
+    return None
+
+
+def write_manifest(folder, manifest):
+    """Write the manifest of an output folder.
+
+    The file is overwritten in place, which keeps the modification time of the folder.
+    """
+    manifest = dict(manifest, version=MANIFEST_VERSION)
+    for path in manifest_paths(folder):
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=1)
+            return path
+        except OSError:
+            continue
+    QgsMessageLog.logMessage(f"Could not write manifest for {folder}", "SplashTool Result Loader", Qgis.Warning)
+    return None
+
+
+def raster_statistics_flags():
+    """All band statistics, for QGIS versions before and after the enum moved to Qgis."""
+    try:
+        return Qgis.RasterBandStatistic.All
+    except AttributeError:
+        from qgis.core import QgsRasterBandStats
+        return QgsRasterBandStats.All
+
+
+def collect_layer_metadata(layer, quantiles=False):
+    """Collect the metadata of an opened layer that is stored in the manifest.
+
+    Raster statistics are estimated from a sample, so this stays cheap for large rasters.
+
+    :param quantiles: Also estimate the quantiles of the wet cells of a water depth raster.
+    :type quantiles: bool
+    """
+    extent = layer.extent()
+    metadata = {
+        "crs": layer.crs().authid(),
+        "extent": [extent.xMinimum(), extent.yMinimum(), extent.xMaximum(), extent.yMaximum()],
+    }
+    if isinstance(layer, QgsVectorLayer):
+        metadata["feature_count"] = layer.featureCount()
+    else:
+        provider = layer.dataProvider()
+        stats = provider.bandStatistics(1, raster_statistics_flags(), extent, 250000)
+        metadata.update({
+            "width": layer.width(),
+            "height": layer.height(),
+            "statistics": {
+                "min": stats.minimumValue,
+                "max": stats.maximumValue,
+                "mean": stats.mean,
+                "stddev": stats.stdDev,
+            },
+        })
+        if quantiles:
+            # Quantiles of the depths above the transparent classes of wd.qml (see classification.py)
+            metadata["visible_quantiles"] = sample_quantiles(provider, extent, stats.maximumValue)
+    return metadata
+
+
+def layer_quantiles(index, result_file, layer):
+    """Quantiles of a water depth raster from the cached metadata, sampled and cached if unknown.
+
+    :returns: (quantiles, maximum) of the raster.
+    :rtype: tuple
+    """
+    metadata = index.layer_metadata(result_file)
+    if metadata is None or "visible_quantiles" not in metadata:
+        metadata = collect_layer_metadata(layer, quantiles=True)
+        index.set_layer_metadata(result_file, metadata)
+    return metadata["visible_quantiles"], metadata["statistics"]["max"]
@@ -0,0 +1,136 @@
+# Python standard library
+import os
+
+# QGIS imports
+from qgis.core import QgsTask, QgsMessageLog, Qgis
+from osgeo import gdal
+
+# Local imports
+from .result_files import tr
+
+# Large wd and flow_xy rasters are single-resolution GeoTIFFs. Without overviews
+# QGIS reads full-resolution blocks when zoomed out. This module builds external
+# .ovr overviews in a background task. An existing .ovr is reused as long as it
+# is not older than its raster.
+
+# Overviews are built until the smallest level fits into a block of this size
+MIN_OVERVIEW_SIZE = 256
+# Rasters smaller than this do not need overviews
+MIN_RASTER_SIZE = 1024
+# Used if the configured resampling method is not supported by the GDAL version
+FALLBACK_RESAMPLING = "NEAREST"
+
+
+def overview_path(raster_path):
+    return raster_path + ".ovr"
+
+
+def needs_overviews(raster_path):
+    """Check whether a raster has no up-to-date overviews and is large enough to need them."""
+    ovr_path = overview_path(raster_path)
+    if os.path.exists(ovr_path):
+        return os.stat(ovr_path).st_mtime_ns < os.stat(raster_path).st_mtime_ns
+
+    dataset = gdal.Open(raster_path, gdal.GA_ReadOnly)
+    if dataset is None:
+        return False
+    if max(dataset.RasterXSize, dataset.RasterYSize) <= MIN_RASTER_SIZE:
+        return False
+    # Internal overviews are fine as well
+    return dataset.GetRasterBand(1).GetOverviewCount() == 0
+
+
+def overview_levels(width, height):
+    levels = []
+    factor = 2
+    while max(width, height) / factor >= MIN_OVERVIEW_SIZE:
+        levels.append(factor)
+        factor *= 2
+    return levels or [2]
+
+
+def build_overviews(raster_path, resampling, progress=None, is_canceled=lambda: False):
+    """Build the external .ovr overviews of a raster, replacing outdated ones.
+
+    :param resampling: GDAL resampling method, e.g. "AVERAGE".
+    :type resampling: str
+
+    :param progress: Called with the finished fraction (0 to 1), optional.
+    :type progress: function
+
+    :param is_canceled: GDAL stops building if it returns True.
+    :type is_canceled: function
+    """
+    def callback(complete, message, data):
+        if progress is not None:
+            progress(complete)
+        return 0 if is_canceled() else 1
+
+    ovr_path = overview_path(raster_path)
+    if os.path.exists(ovr_path):
+        # Outdated overviews of a previous version of the raster
+        os.remove(ovr_path)
+
+    # Opening read-only makes GDAL write the overviews to an external .ovr file
+    dataset = gdal.Open(raster_path, gdal.GA_ReadOnly)
+    if dataset is None:
+        raise IOError(f"Could not open {raster_path}")
+    levels = overview_levels(dataset.RasterXSize, dataset.RasterYSize)
+
+    gdal.SetThreadLocalConfigOption("COMPRESS_OVERVIEW", "DEFLATE")
+    gdal.SetThreadLocalConfigOption("BIGTIFF_OVERVIEW", "IF_SAFER")
+    try:
+        gdal.PushErrorHandler("CPLQuietErrorHandler")
+        try:
+            result = dataset.BuildOverviews(resampling, levels, callback=callback)
+        finally:
+            gdal.PopErrorHandler()
+        if result != 0 and resampling != FALLBACK_RESAMPLING and not is_canceled():
+            QgsMessageLog.logMessage(
+                tr("Resampling {} not supported, building overviews with {}").format(
+                    resampling, FALLBACK_RESAMPLING), "SplashTool Result Loader", Qgis.Warning)
+            result = dataset.BuildOverviews(FALLBACK_RESAMPLING, levels, callback=callback)
+    finally:
+        gdal.SetThreadLocalConfigOption("COMPRESS_OVERVIEW", None)
+        gdal.SetThreadLocalConfigOption("BIGTIFF_OVERVIEW", None)
+    dataset = None
+    if result != 0:
+        raise IOError(f"Could not build overviews for {raster_path}")
+
+
+class BuildOverviewsTask(QgsTask):
+    """Builds external .ovr overviews for all rasters of a list that need them."""
+
+    def __init__(self, rasters, on_finished):
+        """Constructor.
+        :param rasters: List of (raster_path, resampling) tuples, e.g. ("315000wd_out.tif", "AVERAGE").
+        :type rasters: list
+
+        :param on_finished: Called on the main thread with (task, result) once the task ended.
+        :type on_finished: function
+        """
+        super().__init__(tr("Building overviews for SplashTool results"), QgsTask.Flag.CanCancel)
+        self.rasters = rasters
+        self.on_finished = on_finished
+        self.built = []
+        self.exception = None
+
+    def run(self):
+        try:
+            for index, (raster_path, resampling) in enumerate(self.rasters):
+                if self.isCanceled():
+                    return False
+                if not needs_overviews(raster_path):
+                    continue
+                build_overviews(raster_path, resampling,
+                                lambda complete, index=index: self.setProgress(
+                                    100.0 * (index + complete) / len(self.rasters)),
+                                self.isCanceled)
+                self.built.append(raster_path)
+            return True
+        except Exception as e:
+            self.exception = e
+            return False
+
+    def finished(self, result):
+        self.on_finished(self, result)
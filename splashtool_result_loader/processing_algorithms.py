@@ -0,0 +1,437 @@
+# Python standard library
+import csv
+import os
+
+# QGIS imports
+from qgis.core import (QgsLayerTreeLayer, QgsProcessingAlgorithm, QgsProcessingContext, QgsProcessingException,
+                       QgsProcessingLayerPostProcessorInterface, QgsProcessingOutputFile,
+                       QgsProcessingOutputMultipleLayers, QgsProcessingOutputNumber, QgsProcessingParameterFile,
+                       QgsProcessingParameterFileDestination, QgsProcessingParameterNumber,
+                       QgsProcessingParameterRasterDestination, QgsProcessingParameterRasterLayer)
+
+# Local imports
+from .batch import load_styled_layers, write_group
+from .difference import compute_difference
+from .flowvector_cache import convert_flowvectors
+from .flowvector_pyramid import build_pyramid, pyramid_levels
+from .log import LoadLog
+from .overviews import build_overviews, needs_overviews
+from .result_files import find_result_files, read_config, tr
+from .result_index import get_result_index
+from .settings import get_setting
+from .spatial_index import build_spatial_index, needs_spatial_index
+from .splashconfig import run_name
+from .style_cache import style_cache
+from .symbology import style_path
+from .timing import LoadTimer
+from .water_balance import water_balance_series
+
+# Processing algorithms of the plugin (see processing_provider.py). They reuse the
+# functions of the background tasks, so they run in the threads of Processing, can
+# be run for many folders in the batch dialog, used in models and run headless:
+#
+#   qgis_process run splashtool:loadlatestresults -- FOLDER=run1/ OUTPUT=run1.qgs
+#
+# Layers are created in the algorithm thread and handed over to the project by
+# Processing once the algorithm finished. The post processors below put them into
+# a SplashTool group and style them on the main thread.
+
+# Post processors are only referenced by C++ until they ran, so Python keeps them alive
+_post_processors = set()
+
+
+class GroupPlacement:
+    """Places the layers of one load into their SplashTool group, in the load order."""
+
+    def __init__(self, group_name, folder, iteration, layer_ids):
+        self.group_name = group_name
+        self.folder = folder
+        self.iteration = iteration
+        self.layer_ids = layer_ids
+
+    def place(self, layer, project):
+        root = project.layerTreeRoot()
+        node = root.findLayer(layer.id())
+        if node is None:
+            return
+        group = root.findGroup(self.group_name)
+        if group is None:
+            group = root.insertGroup(0, self.group_name)
+            group.setCustomProperty("splashtool/folder", self.folder)
+            group.setCustomProperty("splashtool/iteration", self.iteration)
+        # Processing adds the layers in any order, the position follows the already placed layers of the load
+        order = self.layer_ids.index(layer.id())
+        position = sum(1 for child in group.children()
+                       if isinstance(child, QgsLayerTreeLayer) and child.layerId() in self.layer_ids
+                       and self.layer_ids.index(child.layerId()) < order)
+        group.insertChildNode(position, node.clone())
+        node.parent().removeChildNode(node)
+
+
+class GroupPostProcessor(QgsProcessingLayerPostProcessorInterface):
+    """Moves a loaded result layer into its SplashTool group."""
+
+    def __init__(self, placement):
+        super().__init__()
+        self.placement = placement
+        _post_processors.add(self)
+
+    def postProcessLayer(self, layer, context, feedback):
+        self.placement.place(layer, context.project())
+        _post_processors.discard(self)
+
+
+class StylePostProcessor(QgsProcessingLayerPostProcessorInterface):
+    """Applies a style of the plugin to a layer written by an algorithm."""
+
+    def __init__(self, qml_path):
+        super().__init__()
+        self.qml_path = qml_path
+        _post_processors.add(self)
+
+    def postProcessLayer(self, layer, context, feedback):
+        ok, message = style_cache.apply(layer, self.qml_path)
+        if not ok:
+            feedback.reportError(tr("Failed to apply style to {}: {}").format(layer.name(), message))
+        _post_processors.discard(self)
+
+
+class SplashToolAlgorithm(QgsProcessingAlgorithm):
+    """Base of the algorithms, most of them work on the latest results of one output folder."""
+
+    FOLDER = "FOLDER"
+    OUTPUT = "OUTPUT"
+
+    def tr(self, message):
+        return tr(message)
+
+    def createInstance(self):
+        return type(self)()
+
+    def group(self):
+        return self.tr("Derived data")
+
+    def groupId(self):
+        return "deriveddata"
+
+    def add_folder_parameter(self):
+        self.addParameter(QgsProcessingParameterFile(self.FOLDER, self.tr("SplashTool output folder"),
+                                                     behavior=QgsProcessingParameterFile.Behavior.Folder))
+
+    def folder(self, parameters, context):
+        folder = self.parameterAsFile(parameters, self.FOLDER, context)
+        if not folder or not os.path.isdir(folder):
+            raise QgsProcessingException(self.tr("SplashTool output folder not found: {}").format(folder))
+        return folder
+
+    def latest_results(self, parameters, context):
+        """Index of the output folder and its latest result files, see find_result_files.
+
+        :returns: (index, {raster type: result file}, [flowvectors result files]).
+        :rtype: tuple
+        """
+        index = get_result_index(self.folder(parameters, context))
+        log = LoadLog()
+        latest_files, all_flowvectors = find_result_files(index, log)
+        log.flush()
+        return index, latest_files, all_flowvectors
+
+
+class LoadLatestResultsAlgorithm(SplashToolAlgorithm):
+    """Loads the latest results of an output folder, styled, into a SplashTool group."""
+
+    LAYERS = "LAYERS"
+    ITERATION = "ITERATION"
+
+    def name(self):
+        return "loadlatestresults"
+
+    def displayName(self):
+        return self.tr("Load latest SplashTool results")
+
+    def group(self):
+        return self.tr("Results")
+
+    def groupId(self):
+        return "results"
+
+    def shortHelpString(self):
+        return self.tr("Finds the latest iteration of a SplashTool output folder and loads its flowvectors and "
+                       "rasters with the styles of the plugin into a group named after the run. Optionally the "
+                       "group is also written to a QGIS project (.qgs) or layer definition (.qlr).")
+
+    def initAlgorithm(self, config=None):
+        self.add_folder_parameter()
+        self.addParameter(QgsProcessingParameterFileDestination(
+            self.OUTPUT, self.tr("Project or layer definition file"),
+            self.tr("QGIS project (*.qgs);;QGIS layer definition (*.qlr)"), optional=True, createByDefault=False))
+        self.addOutput(QgsProcessingOutputMultipleLayers(self.LAYERS, self.tr("Loaded layers")))
+        self.addOutput(QgsProcessingOutputNumber(self.ITERATION, self.tr("Iteration")))
+
+    def processAlgorithm(self, parameters, context, feedback):
+        folder = self.folder(parameters, context)
+        timer = LoadTimer(folder)
+        log = LoadLog()
+        index, loaded, failed = load_styled_layers(folder, timer, log, feedback.isCanceled)
+        log.flush()
+        for path in failed:
+            feedback.reportError(self.tr("Failed to load layer: {}").format(path))
+        if feedback.isCanceled():
+            return {}
+        if not loaded:
+            raise QgsProcessingException(self.tr("No SplashTool results could be loaded from {}").format(folder))
+        iteration = max(result_file.iteration for result_file, _, _ in loaded)
+
+        results = {self.ITERATION: iteration}
+        output = self.parameterAsFileOutput(parameters, self.OUTPUT, context)
+        if output:
+            output_format = "qlr" if output.lower().endswith(".qlr") else "qgs"
+            # Written with clones, the layers themselves are handed over to the current project
+            write_group(folder, [(result_file, layer_name, layer.clone()) for result_file, layer_name, layer in loaded],
+                        output, output_format, timer)
+            results[self.OUTPUT] = output
+
+        placement = GroupPlacement(f"SplashTool {run_name(read_config(index), folder)}", folder, iteration,
+                                   [layer.id() for _, _, layer in loaded])
+        for _, layer_name, layer in loaded:
+            context.temporaryLayerStore().addMapLayer(layer)
+            details = QgsProcessingContext.LayerDetails(layer_name, context.project(), self.LAYERS)
+            details.setPostProcessor(GroupPostProcessor(placement))
+            context.addLayerToLoadOnCompletion(layer.id(), details)
+        results[self.LAYERS] = [layer.id() for _, _, layer in loaded]
+
+        index.save_manifest()
+        timer.stop()
+        feedback.pushInfo(timer.summary())
+        return results
+
+
+class BuildOverviewsAlgorithm(SplashToolAlgorithm):
+    """Builds the external overviews of the latest wd and flow_xy rasters."""
+
+    BUILT = "BUILT"
+
+    def name(self):
+        return "buildoverviews"
+
+    def displayName(self):
+        return self.tr("Build raster overviews")
+
+    def shortHelpString(self):
+        return self.tr("Builds external .ovr overviews of the latest water depth (averaged) and flow accumulation "
+                       "(maximum) rasters of a SplashTool output folder. Up-to-date overviews are kept.")
+
+    def initAlgorithm(self, config=None):
+        self.add_folder_parameter()
+        self.addOutput(QgsProcessingOutputNumber(self.BUILT, self.tr("Rasters with new overviews")))
+
+    def processAlgorithm(self, parameters, context, feedback):
+        index, latest_files, _ = self.latest_results(parameters, context)
+        rasters = [(index.file_path(result_file), get_setting(f"overview_resampling_{ftype}"))
+                   for ftype, result_file in latest_files.items()]
+        built = 0
+        for number, (raster_path, resampling) in enumerate(rasters):
+            if feedback.isCanceled():
+                break
+            if not needs_overviews(raster_path):
+                feedback.pushInfo(self.tr("Overviews of {} are up to date").format(raster_path))
+                continue
+            feedback.pushInfo(self.tr("Building overviews of {}").format(raster_path))
+            build_overviews(raster_path, resampling,
+                            lambda complete, number=number: feedback.setProgress(
+                                100.0 * (number + complete) / len(rasters)),
+                            feedback.isCanceled)
+            built += 1
+        return {self.BUILT: built}
+
+
+class BuildSpatialIndexAlgorithm(SplashToolAlgorithm):
+    """Creates the .qix spatial indexes of the latest flowvectors shapefiles."""
+
+    BUILT = "BUILT"
+
+    def name(self):
+        return "buildspatialindex"
+
+    def displayName(self):
+        return self.tr("Build flowvectors spatial indexes")
+
+    def shortHelpString(self):
+        return self.tr("Creates .qix spatial indexes for the flowvectors shapefiles of the latest iteration of a "
+                       "SplashTool output folder. Up-to-date indexes are kept.")
+
+    def initAlgorithm(self, config=None):
+        self.add_folder_parameter()
+        self.addOutput(QgsProcessingOutputNumber(self.BUILT, self.tr("Shapefiles with new spatial indexes")))
+
+    def processAlgorithm(self, parameters, context, feedback):
+        index, _, all_flowvectors = self.latest_results(parameters, context)
+        built = 0
+        for number, result_file in enumerate(all_flowvectors):
+            if feedback.isCanceled():
+                break
+            shapefile_path = index.file_path(result_file)
+            if needs_spatial_index(shapefile_path):
+                try:
+                    build_spatial_index(shapefile_path)
+                    built += 1
+                except (OSError, RuntimeError) as e:
+                    feedback.reportError(self.tr("Could not index {}: {}").format(shapefile_path, e))
+            feedback.setProgress(100.0 * (number + 1) / len(all_flowvectors))
+        return {self.BUILT: built}
+
+
+class ConvertFlowvectorsAlgorithm(SplashToolAlgorithm):
+    """Converts the latest flowvectors shapefiles into the GeoPackage cache."""
+
+    def name(self):
+        return "convertflowvectors"
+
+    def displayName(self):
+        return self.tr("Convert flowvectors to GeoPackage")
+
+    def shortHelpString(self):
+        return self.tr("Converts all flowvectors scales of the latest iteration into one spatially indexed "
+                       "GeoPackage with a scale column in the cache folder of the output folder. An up-to-date "
+                       "GeoPackage is reused.")
+
+    def initAlgorithm(self, config=None):
+        self.add_folder_parameter()
+        self.addOutput(QgsProcessingOutputFile(self.OUTPUT, self.tr("Flowvectors GeoPackage")))
+
+    def processAlgorithm(self, parameters, context, feedback):
+        index, _, all_flowvectors = self.latest_results(parameters, context)
+        if not all_flowvectors:
+            raise QgsProcessingException(self.tr("No flowvectors found in {}").format(index.path))
+        path = convert_flowvectors(index, all_flowvectors, feedback.isCanceled)
+        index.save_manifest()
+        return {self.OUTPUT: path} if path else {}
+
+
+class BuildPyramidAlgorithm(SplashToolAlgorithm):
+    """Thins the finest flowvectors scale into the coarser pyramid levels."""
+
+    def name(self):
+        return "buildflowvectorspyramid"
+
+    def displayName(self):
+        return self.tr("Build flowvectors pyramid")
+
+    def shortHelpString(self):
+        return self.tr("Derives the flowvectors levels 128, 256 and 512 that are coarser than the scales written "
+                       "by SplashTool from the finest scale of the latest iteration, keeping the vector with the "
+                       "highest FlowAcc per grid cell. The levels are cached in a GeoPackage.")
+
+    def initAlgorithm(self, config=None):
+        self.add_folder_parameter()
+        self.addOutput(QgsProcessingOutputFile(self.OUTPUT, self.tr("Flowvectors pyramid GeoPackage")))
+
+    def processAlgorithm(self, parameters, context, feedback):
+        index, _, all_flowvectors = self.latest_results(parameters, context)
+        if not all_flowvectors:
+            raise QgsProcessingException(self.tr("No flowvectors found in {}").format(index.path))
+        levels = pyramid_levels(all_flowvectors)
+        if not levels:
+            feedback.pushInfo(self.tr("SplashTool already wrote all pyramid levels"))
+            return {}
+        path = build_pyramid(index, all_flowvectors, levels, feedback.isCanceled)
+        return {self.OUTPUT: path} if path else {}
+
+
+class WaterDepthDifferenceAlgorithm(SplashToolAlgorithm):
+    """Subtracts an earlier water depth raster from a later one."""
+
+    EARLIER = "EARLIER"
+    LATER = "LATER"
+    NODATA = "NODATA"
+
+    def name(self):
+        return "waterdepthdifference"
+
+    def displayName(self):
+        return self.tr("Water depth difference")
+
+    def shortHelpString(self):
+        return self.tr("Computes the later minus the earlier water depth window by window, e.g. of two "
+                       "checkpoints or two runs. Cells that are nodata in either raster are nodata in the result. "
+                       "The result is shown red where the water depth decreased and blue where it increased.")
+
+    def initAlgorithm(self, config=None):
+        self.addParameter(QgsProcessingParameterRasterLayer(self.EARLIER, self.tr("Earlier water depth")))
+        self.addParameter(QgsProcessingParameterRasterLayer(self.LATER, self.tr("Later water depth")))
+        self.addParameter(QgsProcessingParameterNumber(
+            self.NODATA, self.tr("Nodata value (default: nodata of the rasters)"),
+            QgsProcessingParameterNumber.Type.Double, optional=True))
+        self.addParameter(QgsProcessingParameterRasterDestination(self.OUTPUT, self.tr("Water depth difference")))
+
+    def processAlgorithm(self, parameters, context, feedback):
+        earlier = self.parameterAsRasterLayer(parameters, self.EARLIER, context)
+        later = self.parameterAsRasterLayer(parameters, self.LATER, context)
+        if earlier is None or later is None:
+            raise QgsProcessingException(self.tr("Choose two water depth rasters"))
+        nodata = None
+        if parameters.get(self.NODATA) is not None:
+            nodata = self.parameterAsDouble(parameters, self.NODATA, context)
+        output = self.parameterAsOutputLayer(parameters, self.OUTPUT, context)
+        if not compute_difference(earlier.source(), later.source(), output, nodata, nodata, feedback.isCanceled,
+                                  feedback.setProgress):
+            return {}
+        if context.willLoadLayerOnCompletion(output):
+            context.layerToLoadOnCompletionDetails(output).setPostProcessor(
+                StylePostProcessor(style_path("wd_difference", "wd_difference")))
+        return {self.OUTPUT: output}
+
+
+class WaterBalanceAlgorithm(SplashToolAlgorithm):
+    """Writes the water balance of all checkpoints of an output folder to a CSV table."""
+
+    def name(self):
+        return "waterbalance"
+
+    def displayName(self):
+        return self.tr("Water balance table")
+
+    def group(self):
+        return self.tr("Results")
+
+    def groupId(self):
+        return "results"
+
+    def shortHelpString(self):
+        return self.tr("Collects the water balance (initial and remaining volume, outflow from sinks, volume "
+                       "error, ...) written to the .splashconfig of every checkpoint into one table with a row "
+                       "per iteration.")
+
+    def initAlgorithm(self, config=None):
+        self.add_folder_parameter()
+        self.addParameter(QgsProcessingParameterFileDestination(
+            self.OUTPUT, self.tr("Water balance"), self.tr("CSV files (*.csv)")))
+
+    def processAlgorithm(self, parameters, context, feedback):
+        index = get_result_index(self.folder(parameters, context))
+        series = water_balance_series(index)
+        index.save_manifest()
+        if not series:
+            raise QgsProcessingException(self.tr("No water balance found in {}").format(index.path))
+        keys = []
+        for _, balance in series:
+            keys.extend(key for key in balance if key not in keys)
+
+        output = self.parameterAsFileOutput(parameters, self.OUTPUT, context)
+        with open(output, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["iteration"] + keys)
+            for iteration, balance in series:
+                writer.writerow([iteration] + [balance.get(key, "") for key in keys])
+        return {self.OUTPUT: output}
+
+
+ALGORITHMS = (
+    LoadLatestResultsAlgorithm,
+    WaterBalanceAlgorithm,
+    BuildOverviewsAlgorithm,
+    BuildSpatialIndexAlgorithm,
+    ConvertFlowvectorsAlgorithm,
+    BuildPyramidAlgorithm,
+    WaterDepthDifferenceAlgorithm,
+)
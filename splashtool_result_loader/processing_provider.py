@@ -0,0 +1,34 @@
+# Python standard library
+import os
+
+# Qt imports
+from qgis.PyQt.QtGui import QIcon
+
+# QGIS imports
+from qgis.core import QgsProcessingProvider
+
+# Local imports
+from .processing_algorithms import ALGORITHMS
+from .result_files import tr
+
+# The Processing provider makes the algorithms of processing_algorithms.py available
+# in the Processing toolbox, the graphical modeler, the batch dialog and qgis_process.
+# It is registered by the plugin in initProcessing.
+
+
+class SplashToolProvider(QgsProcessingProvider):
+    """Processing provider with the SplashTool algorithms."""
+
+    def id(self):
+        return "splashtool"
+
+    def name(self):
+        return tr("SplashTool")
+
+    def icon(self):
+        # Loaded from the file, independent of the compiled resources
+        return QIcon(os.path.join(os.path.dirname(__file__), "icon.png"))
+
+    def loadAlgorithms(self):
+        for algorithm in ALGORITHMS:
+            self.addAlgorithm(algorithm())
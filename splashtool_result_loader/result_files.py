@@ -0,0 +1,122 @@
+# Qt imports
+from qgis.PyQt.QtCore import QCoreApplication
+
+# Local imports
+from .log import LoadLog, INFO
+from .splashconfig import parse_splashconfig, expected_result_files
+
+# This module finds the latest SplashTool result files in an output folder.
+# It does not touch any QGIS layers, so it can safely run in a background task.
+
+
+def tr(message):
+    """Get the translation for a string using Qt translation API."""
+    return QCoreApplication.translate('SplashToolResultLoader', message)
+
+
+def find_result_files(index, log=None):
+    """Find the result files that should be loaded from a SplashTool output folder.
+
+    The files are resolved from the newest .splashconfig if possible. Without a
+    usable config the latest files are picked from the (cached) index of the
+    folder. Only the mtimes of the returned files are checked.
+
+    :param index: Index of the SplashTool output directory.
+    :type index: ResultDirectoryIndex
+
+    :param log: Log of the load, a new LoadLog if not given.
+    :type log: LoadLog
+
+    :returns: Latest result file per raster type and the flowvectors files of
+        the latest flowvectors iteration, e.g. ({'wd': ResultFile, ...}, [ResultFile, ...]).
+    :rtype: tuple
+    """
+    log = log or LoadLog()
+    config_file = index.latest("splashconfig")
+    if config_file is not None:
+        found = find_config_result_files(index, config_file, log)
+        if found is not None:
+            return found
+        log.info("Results of {} not found, searching the directory", config_file.filename)
+
+    log.verbose("Found {} result files in directory", len(index.result_files()))
+
+    latest_files = {}
+    for ftype in ("wd", "flow_xy"):
+        result_file = index.latest(ftype)
+        if result_file:
+            latest_files[ftype] = index.validate(result_file)
+
+    all_flowvectors = []
+    latest_flowvectors = index.latest("flowvectors")
+    if latest_flowvectors:
+        all_flowvectors = [index.validate(f) for f in index.flowvectors(latest_flowvectors.iteration)]
+
+    if log.enabled(INFO):
+        log.info("Latest files found: {}", [f.filename for f in list(latest_files.values()) + all_flowvectors])
+
+    return latest_files, all_flowvectors
+
+
+def find_config_result_files(index, config_file, log):
+    """Resolve the result files of the checkpoint described by a .splashconfig.
+
+    :returns: Same as find_result_files, or None if the config cannot be read
+        or its water depth raster does not exist.
+    :rtype: tuple
+    """
+    config = read_config(index, config_file)
+    if config is None:
+        return None
+
+    expected = expected_result_files(config)
+    latest_files = {}
+    for ftype in ("wd", "flow_xy"):
+        result_file = index.stat_file(expected[ftype])
+        if result_file:
+            latest_files[ftype] = result_file
+    if "wd" not in latest_files:
+        return None
+
+    all_flowvectors = [f for f in (index.stat_file(filename) for scale, filename in expected["flowvectors"]) if f]
+
+    if log.enabled(INFO):
+        log.info("Resolved results from {}: {}", config_file.filename,
+                 [f.filename for f in list(latest_files.values()) + all_flowvectors])
+
+    return latest_files, all_flowvectors
+
+
+def read_config(index, config_file=None):
+    """Parse a .splashconfig of the folder, by default the newest one.
+
+    :returns: The parsed config, or None if there is none or it cannot be read.
+    :rtype: SplashConfig
+    """
+    config_file = config_file or index.latest("splashconfig")
+    if config_file is None:
+        return None
+    try:
+        return parse_splashconfig(index.file_path(config_file))
+    except OSError:
+        return None
+
+
+def layer_load_order(latest_files, all_flowvectors):
+    """Build the list of layers to load in the order they are added to the group.
+
+    Flowvectors come first (descending), then wd, then flow_xy.
+
+    :returns: List of (result_file, layer_name) tuples.
+    :rtype: list
+    """
+    layers = []
+
+    for result_file in sorted(all_flowvectors, key=lambda f: f.scale, reverse=True):
+        layers.append((result_file, f"flowvectors_{result_file.scale}"))
+
+    for ftype in ("wd", "flow_xy"):
+        if ftype in latest_files:
+            layers.append((latest_files[ftype], ftype))
+
+    return layers
@@ -0,0 +1,269 @@
+# Python standard library
+import os
+import re
+import threading
+from collections import namedtuple
+
+# Local imports
+from .manifest import read_manifest, write_manifest
+
+# This module keeps an index of the result files in SplashTool output folders.
+# The index is built with a single os.scandir pass and cached per folder. As long
+# as the modification time of the folder is unchanged, the cached index is reused
+# without touching the file system again. On a re-scan only names that were not
+# seen before are matched against the file name pattern. The index can be stored
+# as a manifest inside the folder (see manifest.py) to survive QGIS sessions.
+#
+# One index per folder is shared by the loader tasks, their worker pools and the
+# main thread, so every access to its files and metadata holds the lock of the
+# index. Callers iterate over result_files() snapshots instead of the dict.
+
+RESULT_FILE_PATTERN = re.compile(
+    r"(\d+)(flow_xy_out\.tif|wd_out\.tif|flowvectors_(\d+)\.shp|\.splashconfig)$")
+
+ResultFile = namedtuple("ResultFile", ["filename", "iteration", "artifact", "scale", "size", "mtime"])
+ResultFile.__doc__ = """A single SplashTool result file.
+
+artifact is one of "wd", "flow_xy", "flowvectors" or "splashconfig", scale is
+the flowvectors distance (None for other artifacts) and mtime is in nanoseconds.
+"""
+
+
+def parse_result_filename(filename):
+    """Parse a file name into (iteration, artifact, scale), or None if it is no result file."""
+    match = RESULT_FILE_PATTERN.match(filename)
+    if not match:
+        return None
+    iteration, suffix, scale = match.groups()
+    if suffix == "wd_out.tif":
+        artifact = "wd"
+    elif suffix == "flow_xy_out.tif":
+        artifact = "flow_xy"
+    elif suffix == ".splashconfig":
+        artifact = "splashconfig"
+    else:
+        artifact = "flowvectors"
+    return int(iteration), artifact, int(scale) if scale else None
+
+
+class ResultDirectoryIndex:
+    """Index of all result files in one SplashTool output folder."""
+
+    def __init__(self, path):
+        self.path = path
+        self.dir_mtime = None
+        # file name -> ResultFile
+        self.files = {}
+        # Parsed file names (None for names that are no result files), kept between re-scans
+        self._parsed_names = {}
+        # file name -> (mtime, dict) with layer metadata (extent, statistics, feature count)
+        self.metadata = {}
+        # True if the index changed since it was loaded from or saved to the manifest
+        self.dirty = False
+        # Reentrant, save_manifest refreshes and serializes while holding it
+        self._lock = threading.RLock()
+        # The manifest is only read before the first scan of the session
+        self._manifest_read = False
+
+    def refresh(self):
+        """Re-scan the folder if its modification time changed.
+
+        :returns: True if the folder was scanned, False if the cached index was still valid.
+        :rtype: bool
+        """
+        with self._lock:
+            dir_mtime = os.stat(self.path).st_mtime_ns
+            if dir_mtime == self.dir_mtime:
+                return False
+
+            files = {}
+            parsed_names = {}
+            with os.scandir(self.path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name in self._parsed_names:
+                        parsed = self._parsed_names[name]
+                    else:
+                        parsed = parse_result_filename(name)
+                    parsed_names[name] = parsed
+                    if parsed is None or not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                    files[name] = ResultFile(name, parsed[0], parsed[1], parsed[2], stat.st_size, stat.st_mtime_ns)
+
+            self.files = files
+            self._parsed_names = parsed_names
+            self.dir_mtime = dir_mtime
+            self.dirty = True
+            return True
+
+    def update(self):
+        """Fill the index from the manifest on first use and re-scan the folder if it changed.
+
+        :returns: True if the folder was scanned.
+        :rtype: bool
+        """
+        with self._lock:
+            if not self._manifest_read:
+                self._manifest_read = True
+                # A manifest from a previous session makes the first scan unnecessary
+                self.load_manifest()
+            return self.refresh()
+
+    def validate(self, result_file):
+        """Check the mtime of a single file and update the index if it was rewritten in place.
+
+        :returns: The up-to-date ResultFile.
+        :rtype: ResultFile
+        """
+        stat = os.stat(self.file_path(result_file))
+        if stat.st_mtime_ns != result_file.mtime or stat.st_size != result_file.size:
+            result_file = result_file._replace(size=stat.st_size, mtime=stat.st_mtime_ns)
+            with self._lock:
+                self.files[result_file.filename] = result_file
+                self.dirty = True
+        return result_file
+
+    def stat_file(self, filename):
+        """Stat a single result file of the folder and update the index with it.
+
+        :returns: The ResultFile, or None if the file does not exist or is no result file.
+        :rtype: ResultFile
+        """
+        parsed = parse_result_filename(filename)
+        if parsed is None:
+            return None
+        try:
+            stat = os.stat(os.path.join(self.path, filename))
+        except OSError:
+            return None
+        result_file = ResultFile(filename, parsed[0], parsed[1], parsed[2], stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            if self.files.get(filename) != result_file:
+                self.files[filename] = result_file
+                self.dirty = True
+        return result_file
+
+    def get(self, filename):
+        """ResultFile of a file name, or None if it is not in the index."""
+        with self._lock:
+            return self.files.get(filename)
+
+    def result_files(self, artifact=None):
+        """Snapshot of the indexed result files (of the given artifact type), safe to iterate.
+
+        :rtype: list
+        """
+        with self._lock:
+            return [f for f in self.files.values() if artifact is None or f.artifact == artifact]
+
+    def layer_metadata(self, result_file):
+        """Cached layer metadata of a result file, or None if unknown or outdated."""
+        with self._lock:
+            mtime, metadata = self.metadata.get(result_file.filename, (None, None))
+        return metadata if mtime == result_file.mtime else None
+
+    def set_layer_metadata(self, result_file, metadata):
+        with self._lock:
+            self.metadata[result_file.filename] = (result_file.mtime, metadata)
+            self.dirty = True
+
+    def to_manifest(self):
+        """Serialize the index into the manifest format (see manifest.py)."""
+        iterations = {}
+        files = {}
+        with self._lock:
+            for result_file in self.files.values():
+                iterations.setdefault(str(result_file.iteration), []).append(result_file.filename)
+                entry = result_file._asdict()
+                del entry["filename"]
+                metadata = self.layer_metadata(result_file)
+                if metadata is not None:
+                    entry["metadata"] = metadata
+                files[result_file.filename] = entry
+            latest = {artifact: self.latest(artifact).filename
+                      for artifact in ("wd", "flow_xy", "flowvectors", "splashconfig")
+                      if self.latest(artifact)}
+            dir_mtime = self.dir_mtime
+        return {
+            "dir_mtime": dir_mtime,
+            "latest": latest,
+            "iterations": {key: sorted(names) for key, names in sorted(iterations.items(), key=lambda x: int(x[0]))},
+            "files": files,
+        }
+
+    def load_manifest(self):
+        """Fill the index from the manifest of the folder.
+
+        :returns: True if a manifest was found and loaded.
+        :rtype: bool
+        """
+        manifest = read_manifest(self.path)
+        if manifest is None:
+            return False
+        try:
+            files = {}
+            metadata = {}
+            for name, entry in manifest["files"].items():
+                result_file = ResultFile(name, entry["iteration"], entry["artifact"], entry["scale"],
+                                         entry["size"], entry["mtime"])
+                files[name] = result_file
+                if "metadata" in entry:
+                    metadata[name] = (result_file.mtime, entry["metadata"])
+            dir_mtime = manifest["dir_mtime"]
+        except (KeyError, TypeError, AttributeError):
+            return False
+        with self._lock:
+            self.files = files
+            self.metadata = metadata
+            self.dir_mtime = dir_mtime
+            self.dirty = False
+        return True
+
+    def save_manifest(self):
+        """Write the index to the manifest of the folder if it changed."""
+        # Held while writing, so two threads never write the manifest file at the same time
+        with self._lock:
+            if not self.dirty:
+                return
+            write_manifest(self.path, self.to_manifest())
+            # Creating the manifest changes the folder mtime. Re-scanning is cheap (only
+            # new names are parsed) and overwriting the manifest keeps the folder mtime.
+            if self.refresh():
+                write_manifest(self.path, self.to_manifest())
+            self.dirty = False
+
+    def file_path(self, result_file):
+        return os.path.join(self.path, result_file.filename)
+
+    def iterations(self, artifact=None):
+        """Sorted list of iterations that have result files (of the given artifact type)."""
+        return sorted({f.iteration for f in self.result_files(artifact)})
+
+    def latest(self, artifact):
+        """Result file of the given artifact type with the highest iteration, or None."""
+        candidates = self.result_files(artifact)
+        if not candidates:
+            return None
+        return max(candidates, key=lambda f: f.iteration)
+
+    def flowvectors(self, iteration):
+        """Flowvectors files of one iteration, sorted by scale in descending order."""
+        return sorted((f for f in self.result_files("flowvectors") if f.iteration == iteration),
+                      key=lambda f: f.scale, reverse=True)
+
+
+_index_cache = {}
+_index_cache_lock = threading.Lock()
+
+
+def get_result_index(path):
+    """Return the up-to-date index of a SplashTool output folder, re-using the cached one if possible."""
+    key = os.path.normcase(os.path.abspath(path))
+    # Only the lookup holds the global lock, the folders of a multi-folder load are scanned concurrently
+    with _index_cache_lock:
+        index = _index_cache.get(key)
+        if index is None:
+            index = _index_cache[key] = ResultDirectoryIndex(path)
+    index.update()
+    return index
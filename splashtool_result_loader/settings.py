@@ -0,0 +1,48 @@
+# QGIS imports
+from qgis.core import QgsSettings
+
+# Plugin options are stored in the QGIS user profile under this prefix.
+SETTINGS_PREFIX = "splashtool_result_loader/"
+
+DEFAULTS = {
+    # Log threshold: "verbose" (details per file and style, buffered per load), "info", "warning" or "critical"
+    "log_level": "info",
+    # Open the data providers of all result files in a worker pool
+    "concurrent_loading": True,
+    # Build external overviews for loaded rasters in the background
+    "build_overviews": True,
+    # GDAL resampling used for the overviews, water depth is averaged while
+    # the maximum keeps thin flow accumulation paths visible when zoomed out
+    "overview_resampling_wd": "AVERAGE",
+    "overview_resampling_flow_xy": "MAX",
+    # Create .qix spatial indexes for the flowvectors shapefiles in the background
+    "build_spatial_index": True,
+    # Convert all flowvectors scales into one indexed GeoPackage and load them from there
+    "flowvectors_geopackage": False,
+    # Derive coarser flowvectors levels (128, 256, 512) from the finest scale by grid thinning
+    "flowvectors_pyramid": True,
+    # Minimum flow accumulation of the flowvectors of new groups, 0 shows all (adjustable per group)
+    "min_flowacc": 0.0,
+    # Watch mode also checks the folder at this interval, QFileSystemWatcher misses changes
+    # made by other machines on network shares (0 relies on file system events only)
+    "watch_poll_seconds": 30,
+    # Add flowvectors scales that are not visible at the current canvas scale as
+    # placeholders and open their data providers only once the canvas zooms in
+    "lazy_flowvectors": False,
+    # Tile cache export of a group: "mbtiles" (one file) or "xyz" (directory of PNG
+    # tiles) and the rendered zoom levels, 18 is about 1:2000
+    "tile_cache_format": "mbtiles",
+    "tile_zoom_min": 12,
+    "tile_zoom_max": 18,
+}
+
+
+def get_setting(key):
+    """Read a plugin option, falling back to its default value."""
+    default = DEFAULTS[key]
+    return QgsSettings().value(SETTINGS_PREFIX + key, default, type=type(default))
+
+
+def set_setting(key, value):
+    """Store a plugin option in the QGIS user profile."""
+    QgsSettings().setValue(SETTINGS_PREFIX + key, value)
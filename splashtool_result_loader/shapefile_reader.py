@@ -0,0 +1,168 @@
+# Python standard library
+import os
+import struct
+
+# Third party (available in the Python environment of QGIS)
+import numpy as np
+
+# Local imports
+from .flowvector_cache import FLOWVECTOR_FIELDS
+
+# Reading flowvectors through OGR or QgsVectorLayer parses every feature on its
+# own, which is slow for the large text encoded DBF files. This module memory
+# maps the .shp, .shx and .dbf files of a flowvectors shapefile and decodes the
+# point coordinates and the fixed-width numeric columns with NumPy, without
+# creating OGR layers. Only point shapefiles with numeric (N/F) columns, as
+# written by SplashTool, are supported.
+#
+# Layouts (see the ESRI shapefile and dBASE specifications):
+#   .shx: 100 byte header, then per record offset and content length (big endian, 16 bit words)
+#   .shp: per point record an 8 byte header, shape type (int32) and x, y (float64), little endian
+#   .dbf: header with record count, header and record length, 32 byte field descriptors,
+#         then fixed-width text records starting with a deletion flag ("*" if deleted)
+
+SHAPEFILE_HEADER_SIZE = 100
+SHAPE_TYPE_POINT = 1
+DBF_DESCRIPTOR_SIZE = 32
+DBF_DELETED = ord("*")
+
+
+def sidecar_path(shapefile_path, extension):
+    return os.path.splitext(shapefile_path)[0] + extension
+
+
+def memory_map(path):
+    """Read-only memory map of a file as bytes, an empty array for empty files."""
+    if os.path.getsize(path) == 0:
+        return np.zeros(0, dtype=np.uint8)
+    return np.memmap(path, dtype=np.uint8, mode="r")
+
+
+def gather(data, positions, dtype):
+    """Values of a fixed-size dtype at the given byte positions of a buffer, vectorized."""
+    dtype = np.dtype(dtype)
+    indexes = positions[:, np.newaxis] + np.arange(dtype.itemsize)
+    return np.ascontiguousarray(data[indexes]).view(dtype).ravel()
+
+
+def read_points(shapefile_path):
+    """Read the coordinates of a point shapefile using the record offsets of its .shx.
+
+    :returns: (x, y) arrays, NaN for null shapes.
+    :rtype: tuple
+    """
+    index = memory_map(sidecar_path(shapefile_path, ".shx"))
+    count = max(len(index) - SHAPEFILE_HEADER_SIZE, 0) // 8
+    records = index[SHAPEFILE_HEADER_SIZE:SHAPEFILE_HEADER_SIZE + count * 8].view(">i4").reshape(count, 2)
+    # Offsets and lengths are in 16 bit words, the content follows the 8 byte record header.
+    # Null shapes only have the 4 byte shape type and keep NaN coordinates.
+    content = records[:, 0].astype(np.int64) * 2 + 8
+    points = records[:, 1] >= 10
+
+    data = memory_map(shapefile_path)
+    x = np.full(count, np.nan)
+    y = np.full(count, np.nan)
+    if count:
+        positions = content[points]
+        if np.any(gather(data, positions, "<i4") != SHAPE_TYPE_POINT):
+            raise ValueError(f"{shapefile_path} is no point shapefile")
+        x[points] = gather(data, positions + 4, "<f8")
+        y[points] = gather(data, positions + 12, "<f8")
+    return x, y
+
+
+def read_dbf_header(data):
+    """Record count, header length, record length and {name: (offset, width, type)} of the fields."""
+    count, header_length, record_length = struct.unpack("<IHH", bytes(data[4:12]))
+    fields = {}
+    offset = 1  # deletion flag
+    for start in range(DBF_DESCRIPTOR_SIZE, header_length - 1, DBF_DESCRIPTOR_SIZE):
+        descriptor = bytes(data[start:start + DBF_DESCRIPTOR_SIZE])
+        if descriptor[0] == 0x0D:
+            break
+        name = descriptor[:11].split(b"\0", 1)[0].decode("ascii", errors="replace")
+        width = descriptor[16]
+        fields[name] = (offset, width, chr(descriptor[11]))
+        offset += width
+    return count, header_length, record_length, fields
+
+
+def parse_numbers(column):
+    """Convert a column of fixed-width text numbers to float64, NaN for empty or invalid values."""
+    try:
+        return column.astype(np.float64)
+    except ValueError:
+        # Rare empty ("    ") or overflowed ("*****") values, converted one by one
+        values = np.empty(len(column))
+        for i, text in enumerate(column):
+            try:
+                values[i] = float(text)
+            except ValueError:
+                values[i] = np.nan
+        return values
+
+
+def read_dbf_columns(dbf_path, names=FLOWVECTOR_FIELDS):
+    """Read numeric columns of a .dbf file.
+
+    :returns: ({name: float64 array or None if the column is missing}, deleted mask).
+    :rtype: tuple
+    """
+    data = memory_map(dbf_path)
+    count, header_length, record_length, fields = read_dbf_header(data)
+    records = data[header_length:header_length + count * record_length].reshape(count, record_length)
+    columns = {}
+    for name in names:
+        if name not in fields or fields[name][2] not in "NF":
+            columns[name] = None
+            continue
+        offset, width, _ = fields[name]
+        text = np.ascontiguousarray(records[:, offset:offset + width]).view(f"S{width}").ravel()
+        columns[name] = parse_numbers(text)
+    deleted = records[:, 0] == DBF_DELETED
+    return columns, deleted
+
+
+def read_flowvectors(shapefile_path):
+    """Read the points and flowvectors columns of a shapefile, without deleted records.
+
+    :returns: (x, y, {field name: values or None if the field is missing}).
+    :rtype: tuple
+    """
+    x, y = read_points(shapefile_path)
+    columns, deleted = read_dbf_columns(sidecar_path(shapefile_path, ".dbf"))
+    if len(deleted) != len(x):
+        raise ValueError(f"{shapefile_path} and its .dbf have different record counts")
+    keep = ~deleted & np.isfinite(x)
+    return x[keep], y[keep], {name: values[keep] if values is not None else None
+                              for name, values in columns.items()}
+
+
+def flowvector_statistics(shapefile_path, class_ranges=()):
+    """Summary of a flowvectors shapefile: count, bounding box, FlowAcc distribution and class counts.
+
+    :param class_ranges: (lower, upper) FlowAcc ranges of the style classes, counted like
+        the graduated renderer (lower exclusive, except for the first class).
+    :type class_ranges: list
+
+    :rtype: dict
+    """
+    x, y, fields = read_flowvectors(shapefile_path)
+    statistics = {"count": len(x)}
+    if len(x):
+        statistics["extent"] = [float(x.min()), float(y.min()), float(x.max()), float(y.max())]
+    flowacc = fields["FlowAcc"]
+    if flowacc is not None and len(flowacc):
+        statistics["flowacc"] = {
+            "min": float(np.nanmin(flowacc)),
+            "max": float(np.nanmax(flowacc)),
+            "mean": float(np.nanmean(flowacc)),
+            "quantiles": dict(zip(("p50", "p90", "p99"),
+                                  (float(q) for q in np.nanpercentile(flowacc, (50, 90, 99))))),
+        }
+        classes = []
+        for number, (lower, upper) in enumerate(class_ranges):
+            above = flowacc >= lower if number == 0 else flowacc > lower
+            classes.append({"lower": lower, "upper": upper, "count": int(np.count_nonzero(above & (flowacc <= upper)))})
+        statistics["classes"] = classes
+    return statistics
@@ -0,0 +1,102 @@
+# Python standard library
+import os
+
+# QGIS imports
+from qgis.core import QgsTask
+from osgeo import ogr
+
+# Local imports
+from .result_files import tr
+
+# Flowvectors shapefiles are written without a spatial index, so every pan or
+# zoom scans the whole .shp. This module creates the .qix spatial index of the
+# OGR shapefile driver in a background task, once per version of the shapefile.
+# Shapefiles that cannot be indexed (e.g. on a read-only share) are skipped and
+# not tried again until they change, so they are reported only once per session.
+
+# shapefile path -> mtime (ns) of the version that could not be indexed
+_failed_versions = {}
+
+
+def index_path(shapefile_path):
+    return os.path.splitext(shapefile_path)[0] + ".qix"
+
+
+def needs_spatial_index(shapefile_path):
+    """Check whether a shapefile has no spatial index or one older than the shapefile."""
+    qix_path = index_path(shapefile_path)
+    if not os.path.exists(qix_path):
+        return True
+    return os.stat(qix_path).st_mtime_ns < os.stat(shapefile_path).st_mtime_ns
+
+
+def failed_before(shapefile_path):
+    """Check whether indexing this version of the shapefile already failed in this session."""
+    try:
+        return _failed_versions.get(shapefile_path) == os.stat(shapefile_path).st_mtime_ns
+    except OSError:
+        return False
+
+
+def remember_failure(shapefile_path):
+    try:
+        _failed_versions[shapefile_path] = os.stat(shapefile_path).st_mtime_ns
+    except OSError:
+        pass
+
+
+def build_spatial_index(shapefile_path):
+    """Create the .qix spatial index of a shapefile, replacing an outdated one."""
+    dataset = ogr.Open(shapefile_path, 1)
+    if dataset is None:
+        raise IOError(f"Could not open {shapefile_path} for writing")
+    layer_name = dataset.GetLayer(0).GetName()
+    # Drops an outdated index before the new one is written
+    if os.path.exists(index_path(shapefile_path)):
+        dataset.ExecuteSQL(f'DROP SPATIAL INDEX ON "{layer_name}"')
+    dataset.ExecuteSQL(f'CREATE SPATIAL INDEX ON "{layer_name}"')
+    dataset = None
+    if not os.path.exists(index_path(shapefile_path)):
+        raise IOError(f"Could not create spatial index for {shapefile_path}")
+
+
+class BuildSpatialIndexTask(QgsTask):
+    """Creates .qix spatial indexes for all shapefiles of a list that need them."""
+
+    def __init__(self, shapefiles, on_finished):
+        """Constructor.
+        :param shapefiles: Paths of the shapefiles to index.
+        :type shapefiles: list
+
+        :param on_finished: Called on the main thread with (task, result) once the task ended.
+        :type on_finished: function
+        """
+        super().__init__(tr("Building spatial indexes for SplashTool flowvectors"), QgsTask.Flag.CanCancel)
+        self.shapefiles = shapefiles
+        self.on_finished = on_finished
+        self.built = []
+        # List of (shapefile path, error) of the shapefiles that could not be indexed
+        self.failed = []
+        self.exception = None
+
+    def run(self):
+        try:
+            for index, shapefile_path in enumerate(self.shapefiles):
+                if self.isCanceled():
+                    return False
+                if needs_spatial_index(shapefile_path) and not failed_before(shapefile_path):
+                    try:
+                        build_spatial_index(shapefile_path)
+                        self.built.append(shapefile_path)
+                    except (OSError, RuntimeError) as e:
+                        # e.g. not writable, the other scales are indexed anyway
+                        remember_failure(shapefile_path)
+                        self.failed.append((shapefile_path, e))
+                self.setProgress(100.0 * (index + 1) / len(self.shapefiles))
+            return True
+        except Exception as e:
+            self.exception = e
+            return False
+
+    def finished(self, result):
+        self.on_finished(self, result)
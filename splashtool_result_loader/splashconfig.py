@@ -0,0 +1,132 @@
+# Python standard library
+import ntpath
+import os
+from dataclasses import dataclass, field
+
+# Every SplashTool checkpoint writes a <i>.splashconfig next to its results. Besides
+# a water balance it contains the parameters used for restarting the iteration,
+# including the paths of the result rasters. This module parses these files and
+# derives the result file names of an iteration, so they can be loaded without
+# matching every file name of the output folder.
+#
+# Example of the water balance and the restart section:
+#   initial volume:			491650.06
+#   volume error:			0.127%
+#   outdir=C:/Projekte/SplashOut
+#   wd=C:/Projekte/SplashOut\315000wd_out.tif
+#   flowdir_distances=16.0000;32.0000;64.0000
+#   nodata=-88888.000000000
+#   i=315000
+
+
+@dataclass
+class SplashConfig:
+    """Restart parameters of one SplashTool checkpoint."""
+    path: str
+    iteration: int
+    outdir: str = ""
+    wd: str = ""
+    flow: str = ""
+    flow_x: str = ""
+    flow_y: str = ""
+    flowdir_distances: list = field(default_factory=list)
+    flowdir_minacc: float = 0.0
+    nodata: float = None
+    # All key=value parameters as written in the file
+    parameters: dict = field(default_factory=dict)
+    # Water balance, e.g. {"initial_volume": 491650.06, "volume_error": 0.127, ...}
+    balance: dict = field(default_factory=dict)
+
+
+def to_float(value, default=None):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def parse_splashconfig(path):
+    """Parse a .splashconfig file.
+
+    :returns: The parsed config, or None if the file has no iteration (i=) parameter.
+    :rtype: SplashConfig
+    """
+    parameters = {}
+    balance = {}
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if "=" in line:
+                key, value = line.split("=", 1)
+                parameters[key.strip()] = value.strip()
+            elif ":" in line:
+                key, value = line.split(":", 1)
+                value = to_float(value.strip().rstrip("%"))
+                if value is not None:
+                    balance[balance_key(key)] = value
+
+    try:
+        iteration = int(parameters["i"])
+    except (KeyError, ValueError):
+        return None
+
+    distances = [to_float(d) for d in parameters.get("flowdir_distances", "").split(";") if d.strip()]
+    return SplashConfig(
+        path=path,
+        iteration=iteration,
+        outdir=parameters.get("outdir", ""),
+        wd=parameters.get("wd", ""),
+        flow=parameters.get("flow", ""),
+        flow_x=parameters.get("flow_x", ""),
+        flow_y=parameters.get("flow_y", ""),
+        flowdir_distances=[d for d in distances if d is not None],
+        flowdir_minacc=to_float(parameters.get("flowdir_minacc"), 0.0),
+        nodata=to_float(parameters.get("nodata")),
+        parameters=parameters,
+        balance=balance,
+    )
+
+
+def balance_key(label):
+    """Key of a water balance line, e.g. "volume error" -> "volume_error"."""
+    return "_".join(label.lower().split())
+
+
+def local_file_name(config_path_value):
+    """File name of a path written by SplashTool, which may use Windows separators."""
+    return ntpath.basename(config_path_value.replace("\\", "/"))
+
+
+def expected_result_files(config):
+    """File names of the results of a checkpoint, relative to the folder of its config.
+
+    The folder of the config is used instead of outdir, which may point to
+    another machine or drive if the results were copied.
+
+    :returns: Dict with the file name per artifact ("wd", "flow_xy") and a
+        list of (scale, file name) for "flowvectors".
+    :rtype: dict
+    """
+    i = config.iteration
+    files = {
+        "wd": local_file_name(config.wd) if config.wd else f"{i}wd_out.tif",
+        # flow_xy is not part of the restart parameters, but follows the same naming
+        "flow_xy": f"{i}flow_xy_out.tif",
+        "flowvectors": [(int(d), f"{i}flowvectors_{int(d)}.shp") for d in config.flowdir_distances],
+    }
+    return files
+
+
+def run_name(config, folder):
+    """Name of a SplashTool run, used to name its group when several runs are compared.
+
+    The name of the output directory written in the config is used, falling
+    back to the name of the folder the results were loaded from.
+    """
+    name = local_file_name(config.outdir.rstrip("/\\")) if config else ""
+    name = name or os.path.basename(os.path.normpath(folder))
+    if config:
+        return f"{name} ({config.iteration})"
+    return name
@@ -1,18 +1,48 @@
 # Qt imports
-from qgis.PyQt.QtWidgets import QAction, QFileDialog, QMessageBox
-from qgis.PyQt.QtCore import QCoreApplication, QTranslator, QLocale
+from qgis.PyQt.QtWidgets import (QAbstractItemView, QAction, QFileDialog, QInputDialog, QListView, QMessageBox,
+                                 QTreeView)
+from qgis.PyQt.QtCore import Qt, QCoreApplication, QTranslator, QLocale, QTimer
 from qgis.PyQt.QtGui import QIcon
 
 # QGIS imports
-from qgis.core import QgsProject, QgsRasterLayer, QgsVectorLayer, QgsMessageLog, Qgis
+from qgis.core import (QgsApplication, QgsDataProvider, QgsLayerTreeLayer, QgsProcessingAlgRunnerTask,
+                       QgsProcessingContext, QgsProcessingFeedback, QgsProject, QgsRasterLayer,
+                       QgsMessageLog, Qgis)
 from qgis.gui import QgisInterface  # For type hinting the iface parameter
 
 # Python standard library
 import os
-import re
+import shutil
+import time
 
 # Local imports
 from splashtool_result_loader import resources
+from splashtool_result_loader.classification import adapt_wd_classification
+from splashtool_result_loader.difference import DifferenceTask, difference_path
+from splashtool_result_loader.difference_dialog import DifferenceDialog
+from splashtool_result_loader.flowacc_filter import MIN_FLOWACC_PROPERTY, apply_flowacc_filter
+from splashtool_result_loader.flowvector_cache import GEOPACKAGE_PROPERTY, ConvertFlowvectorsTask, geopackage_layer_uri
+from splashtool_result_loader.flowvector_pyramid import PYRAMID_SCALES, BuildPyramidTask
+from splashtool_result_loader.loader_task import DEFERRED_SOURCE_PROPERTY, ResultLoaderTask
+from splashtool_result_loader.log import LoadLog
+from splashtool_result_loader.manifest import folder_key, layer_quantiles, profile_directory
+from splashtool_result_loader.overviews import BuildOverviewsTask
+from splashtool_result_loader.processing_provider import SplashToolProvider
+from splashtool_result_loader.result_files import read_config
+from splashtool_result_loader.result_index import get_result_index
+from splashtool_result_loader.settings import get_setting, set_setting
+from splashtool_result_loader.shapefile_reader import flowvector_statistics
+from splashtool_result_loader.spatial_index import BuildSpatialIndexTask
+from splashtool_result_loader.style_cache import style_cache
+from splashtool_result_loader.symbology import flowvectors_style_file, style_path, style_type
+from splashtool_result_loader.tile_cache import (TILE_ALGORITHMS, layers_extent, tile_cache_path,
+                                                 tile_layer_uri, tile_parameters, tile_project)
+from splashtool_result_loader.timing import append_record
+from splashtool_result_loader.water_balance_dock import WaterBalanceDock
+from splashtool_result_loader.watcher import ResultFolderWatcher
+
+# Timings are reported without first render if the canvas did not render within this time
+FIRST_RENDER_TIMEOUT_MS = 60000
 
 # This plugin is used to load the latest files from the SplashTool output folder
 # It will load the files into the current QGIS project
@@ -31,6 +61,14 @@ class SplashToolResultLoader:
         self.iface = iface
         self.plugin_dir = os.path.dirname(__file__)
         self.actions = []
+        # Running load tasks, kept referenced until they finished
+        self.tasks = []
+        # Folder watcher of the watch mode and the group it refreshes
+        self.watcher = None
+        self.watched_group_name = None
+        self.last_group_name = None
+        self.water_balance_dock = None
+        self.provider = None
 
     def tr(self, message):
         """Get the translation for a string using Qt translation API.
@@ -75,7 +113,8 @@ class SplashToolResultLoader:
             add_to_toolbar=True,
             status_tip=None,
             whats_this=None,
-            parent=None):
+            parent=None,
+            checked=None):
         """Add a toolbar icon to the toolbar.
 
         :param icon_path: Path to the icon for this action. Can be a resource
@@ -111,6 +150,10 @@ class SplashToolResultLoader:
         :param parent: Parent widget for the new action. Defaults None.
         :type parent: QWidget
 
+        :param checked: Makes the action checkable with the given initial
+            state. Defaults None (not checkable).
+        :type checked: bool
+
         :return: The action that was created. Note that the action is also
             added to self.actions list.
         :rtype: QAction
@@ -121,6 +164,10 @@ class SplashToolResultLoader:
         action.triggered.connect(callback)
         action.setEnabled(enabled_flag)
 
+        if checked is not None:
+            action.setCheckable(True)
+            action.setChecked(checked)
+
         if status_tip is not None:
             action.setStatusTip(status_tip)
 
@@ -140,8 +187,14 @@ class SplashToolResultLoader:
 
         return action
 
+    def initProcessing(self):
+        """Register the Processing provider, also called by qgis_process without a GUI."""
+        self.provider = SplashToolProvider()
+        QgsApplication.processingRegistry().addProvider(self.provider)
+
     def initGui(self):
         """Create the menu entries and toolbar icons inside the QGIS GUI."""
+        self.initProcessing()
         self.menu = self.tr('&SplashTool Result Loader')
         
         icon_path = ':/plugins/splashtool_result_loader/icon.png'
@@ -151,6 +204,113 @@ class SplashToolResultLoader:
             callback=self.run,
             parent=self.iface.mainWindow()
         )
+        self.add_action(
+            icon_path,
+            text=self.tr('Load and compare several SplashTool runs'),
+            callback=self.run_multiple,
+            add_to_toolbar=False,
+            parent=self.iface.mainWindow()
+        )
+        self.add_action(
+            icon_path,
+            text=self.tr('Water depth difference between iterations or runs'),
+            callback=self.run_difference,
+            add_to_toolbar=False,
+            parent=self.iface.mainWindow()
+        )
+        self.add_action(
+            icon_path,
+            text=self.tr('Minimum flow accumulation of the selected group'),
+            callback=self.set_min_flowacc,
+            add_to_toolbar=False,
+            parent=self.iface.mainWindow()
+        )
+        self.add_action(
+            icon_path,
+            text=self.tr('Flowvectors statistics of the selected group'),
+            callback=self.show_flowvector_statistics,
+            add_to_toolbar=False,
+            parent=self.iface.mainWindow()
+        )
+        self.add_action(
+            icon_path,
+            text=self.tr('Water balance of the selected group'),
+            callback=self.show_water_balance,
+            add_to_toolbar=False,
+            parent=self.iface.mainWindow()
+        )
+        self.add_action(
+            icon_path,
+            text=self.tr('Export the last loaded group to a tile cache'),
+            callback=self.export_tile_cache,
+            add_to_toolbar=False,
+            parent=self.iface.mainWindow()
+        )
+        self.add_action(
+            icon_path,
+            text=self.tr('Verbose logging'),
+            callback=lambda checked: set_setting("log_level", "verbose" if checked else "info"),
+            add_to_toolbar=False,
+            parent=self.iface.mainWindow(),
+            checked=get_setting("log_level") == "verbose"
+        )
+        self.add_action(
+            icon_path,
+            text=self.tr('Open result files concurrently'),
+            callback=lambda checked: set_setting("concurrent_loading", checked),
+            add_to_toolbar=False,
+            parent=self.iface.mainWindow(),
+            checked=get_setting("concurrent_loading")
+        )
+        self.add_action(
+            icon_path,
+            text=self.tr('Build raster overviews in the background'),
+            callback=lambda checked: set_setting("build_overviews", checked),
+            add_to_toolbar=False,
+            parent=self.iface.mainWindow(),
+            checked=get_setting("build_overviews")
+        )
+        self.add_action(
+            icon_path,
+            text=self.tr('Build flowvectors spatial indexes in the background'),
+            callback=lambda checked: set_setting("build_spatial_index", checked),
+            add_to_toolbar=False,
+            parent=self.iface.mainWindow(),
+            checked=get_setting("build_spatial_index")
+        )
+        self.add_action(
+            icon_path,
+            text=self.tr('Load flowvectors from a GeoPackage cache'),
+            callback=lambda checked: set_setting("flowvectors_geopackage", checked),
+            add_to_toolbar=False,
+            parent=self.iface.mainWindow(),
+            checked=get_setting("flowvectors_geopackage")
+        )
+        self.add_action(
+            icon_path,
+            text=self.tr('Derive coarser flowvectors levels for zoomed out views'),
+            callback=lambda checked: set_setting("flowvectors_pyramid", checked),
+            add_to_toolbar=False,
+            parent=self.iface.mainWindow(),
+            checked=get_setting("flowvectors_pyramid")
+        )
+        self.add_action(
+            icon_path,
+            text=self.tr('Open flowvectors only when zoomed into their scale range'),
+            callback=lambda checked: set_setting("lazy_flowvectors", checked),
+            add_to_toolbar=False,
+            parent=self.iface.mainWindow(),
+            checked=get_setting("lazy_flowvectors")
+        )
+        self.watch_action = self.add_action(
+            icon_path,
+            text=self.tr('Watch loaded folder for new iterations'),
+            callback=self.toggle_watch_mode,
+            add_to_toolbar=False,
+            parent=self.iface.mainWindow(),
+            checked=False
+        )
+        self.iface.mapCanvas().scaleChanged.connect(self.open_deferred_layers)
 
     def unload(self):
         """Removes the plugin menu item and icon from QGIS GUI."""
@@ -159,11 +319,22 @@ class SplashToolResultLoader:
                 self.tr('&SplashTool Result Loader'),
                 action)
             self.iface.removeToolBarIcon(action)
+        self.iface.mapCanvas().scaleChanged.disconnect(self.open_deferred_layers)
+        for task in self.tasks:
+            task.cancel()
+        self.stop_watching()
+        if self.water_balance_dock is not None:
+            self.water_balance_dock.stop_watching()
+            self.iface.removeDockWidget(self.water_balance_dock)
+            self.water_balance_dock.deleteLater()
+            self.water_balance_dock = None
+        if self.provider is not None:
+            QgsApplication.processingRegistry().removeProvider(self.provider)
+            self.provider = None
 
-    def get_next_group_name(self):
+    def get_next_group_name(self, base_name="SplashTool"):
         """Find the next available group name."""
         root = QgsProject.instance().layerTreeRoot()
-        base_name = "SplashTool"
         counter = 0
         while True:
             name = base_name if counter == 0 else f"{base_name}_{counter}"
@@ -178,164 +349,717 @@ class SplashToolResultLoader:
             return
 
         QgsMessageLog.logMessage(self.tr("Selected folder: {}").format(input_folder), "SplashTool Result Loader", Qgis.Info)
-        
-        file_types = {
-            "wd": "_wd_out.tif",
-            "flow_xy": "flow_xy_out.tif",
-            "flowvectors": "flowvectors_\\d+.shp"
-        }
-        latest_files = {}
-        all_flowvectors = []
-
-        # Updated pattern to match your file naming convention
-        pattern = re.compile(r"(\d+)(flow_xy_out\.tif|wd_out\.tif|flowvectors_\d+\.shp)$")
-        
-        files_in_dir = os.listdir(input_folder)
-        QgsMessageLog.logMessage(self.tr("Found {} files in directory").format(len(files_in_dir)), 
-                               "SplashTool Result Loader", Qgis.Info)
 
-        for file in files_in_dir:
-            match = pattern.match(file)
-            if match:
-                counter, file_suffix = match.groups()
-                counter = int(counter)
-                
-                # Determine the file type based on the suffix
-                if file_suffix.endswith("wd_out.tif"):
-                    ftype = "wd"
-                elif file_suffix.endswith("flow_xy_out.tif"):
-                    ftype = "flow_xy"
-                elif "flowvectors_" in file_suffix:
-                    ftype = "flowvectors"
-                    all_flowvectors.append({"filename": file, "counter": counter})
-                    continue  # Skip adding to latest_files
-                
-                if ftype not in latest_files or latest_files[ftype]["counter"] < counter:
-                    latest_files[ftype] = {"filename": file, "counter": counter}
-                    QgsMessageLog.logMessage(self.tr("Found matching file: {} (type: {}, counter: {})").format(
-                        file, ftype, counter), "SplashTool Result Loader", Qgis.Info)
-
-        QgsMessageLog.logMessage(self.tr("Latest files found: {}").format(latest_files), 
+        # Scanning and opening the data sources runs in the background,
+        # styling and adding the layers happens in on_load_finished
+        self.start_load_task(input_folder, self.on_load_finished)
+
+    def run_multiple(self):
+        """Load the results of several SplashTool runs, one group per run."""
+        input_folders = self.select_folders(self.tr("Select Folders containing SplashTool results"))
+        if not input_folders:
+            QgsMessageLog.logMessage(self.tr("No folder selected"), "SplashTool Result Loader", Qgis.Info)
+            return
+
+        QgsMessageLog.logMessage(self.tr("Selected folders: {}").format(", ".join(input_folders)),
                                "SplashTool Result Loader", Qgis.Info)
 
+        # The folders are scanned and opened by concurrent tasks, the groups are
+        # added together in the selected order once the last task finished
+        tasks = []
+        results = {}
+        for input_folder in input_folders:
+            tasks.append(self.start_load_task(
+                input_folder, lambda task, result: self.on_multiple_load_finished(tasks, results, task, result)))
+
+    def select_folders(self, title):
+        """Show a folder dialog that allows selecting several folders.
+
+        :returns: The selected folders, an empty list if the dialog was canceled.
+        :rtype: list
+        """
+        dialog = QFileDialog(None, title)
+        dialog.setFileMode(QFileDialog.FileMode.Directory)
+        dialog.setOption(QFileDialog.Option.DontUseNativeDialog, True)
+        dialog.setOption(QFileDialog.Option.ShowDirsOnly, True)
+        # The native dialogs only support selecting a single folder, the file
+        # views of the Qt dialog accept several folders with Ctrl/Shift
+        for view in dialog.findChildren(QListView) + dialog.findChildren(QTreeView):
+            view.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        if not dialog.exec():
+            return []
+        return dialog.selectedFiles()
+
+    def start_load_task(self, input_folder, on_finished):
+        """Start a background task that scans a folder and opens its result files.
+
+        :param on_finished: Called on the main thread with (task, result) once the task ended.
+        :type on_finished: function
+
+        :rtype: ResultLoaderTask
+        """
+        task = ResultLoaderTask(input_folder, on_finished,
+                                concurrent=get_setting("concurrent_loading"),
+                                flowvectors_geopackage=get_setting("flowvectors_geopackage"),
+                                lazy_scale=self.iface.mapCanvas().scale() if get_setting("lazy_flowvectors") else None,
+                                pyramid=get_setting("flowvectors_pyramid"))
+        task.fileLoaded.connect(self.show_load_progress)
+        self.tasks.append(task)
+        QgsApplication.taskManager().addTask(task)
+        return task
+
+    def show_load_progress(self, layer_name, index, total, remaining):
+        """Show the last loaded file and the estimated remaining time in the status bar."""
+        message = self.tr("SplashTool: loaded {} ({}/{})").format(layer_name, index, total)
+        if index < total:
+            message += self.tr(", about {:.0f} s remaining").format(remaining)
+        self.iface.statusBarIface().showMessage(message)
+
+    def on_load_finished(self, task, result):
+        """Apply the styles and add the opened layers to a new group (main thread)."""
+        self.iface.statusBarIface().clearMessage()
+        if task in self.tasks:
+            self.tasks.remove(task)
+        self.add_loaded_groups([(task, result, "SplashTool")])
+
+    def on_multiple_load_finished(self, tasks, results, task, result):
+        """Add the groups of all runs once the last of their load tasks finished (main thread)."""
+        if task in self.tasks:
+            self.tasks.remove(task)
+        results[task] = result
+        if len(results) < len(tasks):
+            return
+        self.iface.statusBarIface().clearMessage()
+        # Runs are named after their config, e.g. "SplashTool SplashOut (315000)"
+        self.add_loaded_groups([(task, results[task], f"SplashTool {task.run_name}") for task in tasks])
+
+    def add_loaded_groups(self, loads):
+        """Style the layers of finished load tasks and add one group per task.
+
+        :param loads: (task, result, base group name) per finished load task,
+            the groups are added in this order.
+        :type loads: list
+        """
+        loaded = []
+        for task, result, base_name in loads:
+            if task.exception is not None:
+                QgsMessageLog.logMessage(self.tr("Loading SplashTool results failed: {}").format(task.exception),
+                                       "SplashTool Result Loader", Qgis.Critical)
+                QMessageBox.critical(None, self.tr("Error"), self.tr("Failed to load {}").format(task.input_folder))
+            elif not result:
+                QgsMessageLog.logMessage(self.tr("Loading SplashTool results was canceled"),
+                                       "SplashTool Result Loader", Qgis.Info)
+            else:
+                for file_path in task.failed_files:
+                    QMessageBox.critical(None, self.tr("Error"), self.tr("Failed to load {}").format(file_path))
+                loaded.append((task, base_name))
+        if not loaded:
+            return
+
+        # Freeze the canvas until all groups are assembled, so they are rendered only once
+        canvas = self.iface.mapCanvas()
+        canvas.freeze(True)
+        try:
+            for task, base_name in loaded:
+                group_name = self.add_result_group(task, self.get_next_group_name(base_name))
+        finally:
+            canvas.freeze(False)
+        for task, _ in loaded:
+            task.log.flush(self.tr("Load details for {}:").format(task.input_folder))
+            self.time_first_render(task.timer)
+        canvas.refresh()
+
+        self.last_group_name = group_name
+        if self.watch_action.isChecked():
+            self.start_watching(group_name)
+
+        loaded_layers = [loaded_layer for task, _ in loaded for loaded_layer in task.loaded_layers]
+        if get_setting("build_overviews"):
+            self.build_overviews([layer for layer, layer_name in loaded_layers
+                                  if layer_name in ("wd", "flow_xy")])
+        if get_setting("build_spatial_index"):
+            self.build_spatial_indexes([layer for layer, layer_name in loaded_layers
+                                        if layer_name.startswith("flowvectors_")])
+
+    def add_result_group(self, task, group_name):
+        """Style the layers of a load task and add them to a new group (the canvas should be frozen).
+
+        :returns: Name of the new group.
+        :rtype: str
+        """
         # Create a new group
         root = QgsProject.instance().layerTreeRoot()
-        group_name = self.get_next_group_name()
         group = root.addGroup(group_name)
 
-        # Dictionary to store loaded layers
-        loaded_layers = {
-            'flowvectors': [],
-            'wd': None,
-            'flow_xy': None
-        }
-
-        # Load flowvectors layers
-        all_flowvectors.sort(key=lambda x: x['counter'], reverse=True)  # Sort by counter in descending order
-        for data in all_flowvectors:
-            file_path = os.path.join(input_folder, data["filename"])
-            suffix = re.search(r'flowvectors_(\d+)\.shp$', data["filename"]).group(1)
-            layer_name = f"flowvectors_{suffix}"
-            layer = self.load_layer(file_path, layer_name)
-            if layer:
-                loaded_layers['flowvectors'].append(layer)
-
-        # Load wd and flow layers
-        for ftype, data in latest_files.items():
-            file_path = os.path.join(input_folder, data["filename"])
-            layer = self.load_layer(file_path, ftype)
-            if layer:
-                loaded_layers[ftype] = layer
-
-        # Add layers to group in specific order
-        # First add flowvectors (they're already sorted in descending order)
-        for layer in loaded_layers['flowvectors']:
-            QgsProject.instance().addMapLayer(layer, False)
-            group.addLayer(layer)
-
-        # Add wd layer
-        if loaded_layers['wd']:
-            QgsProject.instance().addMapLayer(loaded_layers['wd'], False)
-            group.addLayer(loaded_layers['wd'])
-
-        # Add flow layer
-        if loaded_layers['flow_xy']:
-            QgsProject.instance().addMapLayer(loaded_layers['flow_xy'], False)
-            group.addLayer(loaded_layers['flow_xy'])
-
-    def load_layer(self, file_path, ftype):
-        if file_path.endswith(".tif"):
-            layer = QgsRasterLayer(file_path, ftype)
-        elif file_path.endswith(".shp"):
-            layer = QgsVectorLayer(file_path, ftype, "ogr")
-        else:
-            QgsMessageLog.logMessage(self.tr("Unsupported file type: {}").format(file_path), 
+        group.setCustomProperty("splashtool/folder", task.input_folder)
+        group.setCustomProperty("splashtool/iteration", task.iteration)
+        # Watch mode converts the flowvectors of new iterations as well
+        group.setCustomProperty(GEOPACKAGE_PROPERTY, task.geopackage is not None)
+        min_flowacc = get_setting("min_flowacc")
+        group.setCustomProperty(MIN_FLOWACC_PROPERTY, min_flowacc)
+
+        # Layers are already in group order: flowvectors (descending), wd, flow_xy
+        timer = task.timer
+        layers = []
+        for layer, layer_name in task.loaded_layers:
+            with timer.phase("style", layer_name):
+                self.apply_symbology(layer, style_type(layer_name), task.log, repaint=False)
+            if min_flowacc and layer_name.startswith("flowvectors_"):
+                apply_flowacc_filter(layer, min_flowacc)
+            # Remember which result artifact the layer shows, even if the user renames it
+            layer.setCustomProperty("splashtool/artifact", layer_name)
+            layers.append(layer)
+
+        # Register and insert all layers at once instead of emitting the signals per layer
+        with timer.phase("add_map_layer"):
+            QgsProject.instance().addMapLayers(layers, False)
+        with timer.phase("group_add_layer"):
+            group.insertChildNodes(-1, [QgsLayerTreeLayer(layer) for layer in layers])
+        return group_name
+
+    def build_overviews(self, layers):
+        """Build missing overviews of the given raster layers in a background task."""
+        rasters = [(layer.source(), get_setting(f"overview_resampling_{layer.customProperty('splashtool/artifact')}"))
+                   for layer in layers]
+        if not rasters:
+            return
+        task = BuildOverviewsTask(rasters, self.on_derived_data_finished)
+        self.tasks.append(task)
+        QgsApplication.taskManager().addTask(task)
+
+    def build_spatial_indexes(self, layers):
+        """Create missing spatial indexes of the given flowvectors layers in a background task."""
+        # Layers loaded from the GeoPackage cache already have a spatial index,
+        # deferred layers get the index before their source is opened
+        sources = [(layer.customProperty(DEFERRED_SOURCE_PROPERTY) or layer.source()).split("|")[0]
+                   for layer in layers]
+        shapefiles = [source for source in sources if source.endswith(".shp")]
+        if not shapefiles:
+            return
+        task = BuildSpatialIndexTask(shapefiles, self.on_derived_data_finished)
+        self.tasks.append(task)
+        QgsApplication.taskManager().addTask(task)
+
+    def on_derived_data_finished(self, task, result):
+        """Reload the layers whose overviews or spatial indexes were built by a background task."""
+        if task in self.tasks:
+            self.tasks.remove(task)
+        if task.exception is not None:
+            QgsMessageLog.logMessage(self.tr("{} failed: {}").format(task.description(), task.exception),
+                                   "SplashTool Result Loader", Qgis.Warning)
+        for path, error in getattr(task, "failed", []):
+            QgsMessageLog.logMessage(self.tr("{} failed for {}: {}").format(task.description(), path, error),
                                    "SplashTool Result Loader", Qgis.Warning)
-            return None
 
-        if not layer.isValid():
-            QgsMessageLog.logMessage(self.tr("Failed to load layer: {}").format(file_path), 
-                                   "SplashTool Result Loader", Qgis.Critical)
-            QMessageBox.critical(None, self.tr("Error"), self.tr("Failed to load {}").format(file_path))
-            return None
+        # Reopen the data sources so GDAL/OGR pick up the new .ovr/.qix files
+        for layer in QgsProject.instance().mapLayers().values():
+            if layer.source().split("|")[0] in task.built:
+                layer.dataProvider().reloadData()
+                layer.triggerRepaint()
+                QgsMessageLog.logMessage(self.tr("{}: {}").format(task.description(), layer.source()),
+                                       "SplashTool Result Loader", Qgis.Info)
 
-        QgsMessageLog.logMessage(self.tr("Successfully loaded layer: {}").format(file_path), 
-                               "SplashTool Result Loader", Qgis.Info)
-        
-        # For style application, we need to use the generic "flowvectors" type if it's a flowvector layer
-        style_type = "flowvectors" if "flowvectors_" in ftype else ftype
-        self.apply_symbology(layer, style_type)
-        
-        return layer
-
-    def apply_symbology(self, layer, ftype):
-        # Map layer types to their style file names
-        style_files = {
-            "wd": "wd.qml",
-            "flow_xy": "flow.qml",
-        }
-        
-        if ftype == "flowvectors":
-            # Extract the numeric value from the layer name
-            match = re.search(r'flowvectors_(\d+)', layer.name())
-            if match:
-                value = int(match.group(1))
-                # Choose style file based on thresholds
-                if value <= 16:
-                    style_file = "flowvectors_16.qml"
-                elif value <= 32:
-                    style_file = "flowvectors_32.qml"
-                elif value <= 64:
-                    style_file = "flowvectors_64.qml"
-                else:  # value > 64, including > 128
-                    style_file = "flowvectors_128.qml"
-            else:
-                # Fallback to default if no number found
-                style_file = "flowvectors.qml"
-                QgsMessageLog.logMessage(self.tr("No numeric value found in layer name, using default style"), 
-                                       "SplashTool Result Loader", Qgis.Warning)
+    def run_difference(self):
+        """Compute the difference of two water depth rasters of the loaded groups and add it as a layer."""
+        candidates = self.difference_candidates()
+        if len(candidates) < 2:
+            QMessageBox.information(None, self.tr("Water depth difference"),
+                                    self.tr("Load SplashTool results with at least two water depth rasters first."))
+            return
+        dialog = DifferenceDialog(candidates, self.iface.mainWindow())
+        if not dialog.exec():
+            return
+        (earlier_folder, earlier), (later_folder, later) = dialog.selection()
+        if (earlier_folder, earlier) == (later_folder, later):
+            QMessageBox.information(None, self.tr("Water depth difference"),
+                                    self.tr("Choose two different water depth rasters."))
+            return
+
+        # Each raster is masked with the nodata value of the .splashconfig of its own checkpoint
+        earlier_index = get_result_index(earlier_folder)
+        later_index = get_result_index(later_folder)
+        earlier_config = read_config(earlier_index, earlier_index.get(f"{earlier.iteration}.splashconfig"))
+        later_config = read_config(later_index, later_index.get(f"{later.iteration}.splashconfig"))
+        if earlier_folder == later_folder:
+            name = f"wd_diff_{later.iteration}_{earlier.iteration}"
         else:
-            style_file = style_files.get(ftype)
-            if not style_file:
-                QgsMessageLog.logMessage(self.tr("No style mapping for layer type: {}").format(ftype), 
+            name = f"wd_diff_{later.iteration}_{folder_key(earlier_folder)[:8]}_{earlier.iteration}"
+        task = DifferenceTask(earlier_index.file_path(earlier), later_index.file_path(later),
+                              difference_path(later_folder, name), earlier_config.nodata if earlier_config else None,
+                              later_config.nodata if later_config else None, self.on_difference_finished)
+        self.tasks.append(task)
+        QgsApplication.taskManager().addTask(task)
+
+    def difference_candidates(self):
+        """All water depth rasters of the SplashTool groups in the project, newest of the last loaded group first.
+
+        :returns: List of (label, folder, result_file).
+        :rtype: list
+        """
+        root = QgsProject.instance().layerTreeRoot()
+        groups = [group for group in root.findGroups(True) if group.customProperty("splashtool/folder")]
+        groups.sort(key=lambda group: group.name() != self.last_group_name)
+        candidates = []
+        folders = set()
+        for group in groups:
+            folder = group.customProperty("splashtool/folder")
+            if folder in folders or not os.path.isdir(folder):
+                continue
+            folders.add(folder)
+            index = get_result_index(folder)
+            for result_file in sorted(index.result_files("wd"),
+                                      key=lambda f: f.iteration, reverse=True):
+                label = self.tr("{}: iteration {}").format(group.name(), result_file.iteration)
+                candidates.append((label, folder, result_file))
+        return candidates
+
+    def on_difference_finished(self, task, result):
+        """Add the computed difference raster with the diverging style (main thread)."""
+        if task in self.tasks:
+            self.tasks.remove(task)
+        if task.exception is not None:
+            QgsMessageLog.logMessage(self.tr("{} failed: {}").format(task.description(), task.exception),
+                                   "SplashTool Result Loader", Qgis.Critical)
+            QMessageBox.critical(None, self.tr("Error"), self.tr("Failed to compute the water depth difference"))
+            return
+        if not result:
+            return
+        layer = QgsRasterLayer(task.output_path, os.path.splitext(os.path.basename(task.output_path))[0])
+        if not layer.isValid():
+            QMessageBox.critical(None, self.tr("Error"), self.tr("Failed to load {}").format(task.output_path))
+            return
+        self.apply_symbology(layer, "wd_difference", repaint=False)
+        QgsProject.instance().addMapLayer(layer)
+
+    def export_tile_cache(self):
+        """Render the layers of the last loaded group into a tile cache in the background."""
+        group = QgsProject.instance().layerTreeRoot().findGroup(self.last_group_name or "")
+        if group is None:
+            QMessageBox.information(None, self.tr("Tile cache"),
+                                    self.tr("Load SplashTool results first, the last loaded group will be exported."))
+            return
+        # A previous tile cache of the group is replaced
+        layers = [tree_layer.layer() for tree_layer in group.findLayers() if tree_layer.layer()]
+        QgsProject.instance().removeMapLayers([layer.id() for layer in layers
+                                               if layer.customProperty("splashtool/artifact") == "tiles"])
+        layers = [tree_layer.layer() for tree_layer in group.findLayers() if tree_layer.layer()]
+        crs = QgsProject.instance().crs()
+        extent = layers_extent(layers, crs)
+        if extent.isEmpty():
+            QMessageBox.information(None, self.tr("Tile cache"), self.tr("The group has no layers to export."))
+            return
+
+        tile_format = get_setting("tile_cache_format")
+        zoom_min, zoom_max = get_setting("tile_zoom_min"), get_setting("tile_zoom_max")
+        output = tile_cache_path(group.customProperty("splashtool/folder"),
+                                 group.customProperty("splashtool/iteration"), tile_format)
+        if os.path.isdir(output):
+            shutil.rmtree(output)
+        elif os.path.exists(output):
+            os.remove(output)
+
+        algorithm = QgsApplication.processingRegistry().algorithmById(TILE_ALGORITHMS[tile_format])
+        if algorithm is None:
+            QMessageBox.critical(None, self.tr("Error"),
+                                 self.tr("Processing algorithm {} not available").format(TILE_ALGORITHMS[tile_format]))
+            return
+        # The algorithm renders all layers of the project of its context
+        context = QgsProcessingContext()
+        context.setProject(tile_project(layers, crs))
+        context.setTransformContext(QgsProject.instance().transformContext())
+        feedback = QgsProcessingFeedback()
+        task = QgsProcessingAlgRunnerTask(algorithm, tile_parameters(extent, crs, zoom_min, zoom_max, output,
+                                                                     tile_format), context, feedback)
+        # The context (and its project) must live as long as the task
+        task.context = context
+        task.feedback = feedback
+        group_name = group.name()
+        task.executed.connect(lambda successful, results: self.on_tile_cache_finished(
+            task, successful, group_name, tile_layer_uri(output, tile_format, zoom_min, zoom_max)))
+        self.tasks.append(task)
+        QgsApplication.taskManager().addTask(task)
+
+    def on_tile_cache_finished(self, task, successful, group_name, uri):
+        """Add the tile cache on top of its group and uncheck the layers it was rendered from (main thread)."""
+        if task in self.tasks:
+            self.tasks.remove(task)
+        group = QgsProject.instance().layerTreeRoot().findGroup(group_name)
+        if not successful or group is None:
+            QgsMessageLog.logMessage(self.tr("Tile cache export of {} failed").format(group_name),
+                                   "SplashTool Result Loader", Qgis.Warning)
+            return
+        layer = QgsRasterLayer(uri, self.tr("tiles"), "wms")
+        if not layer.isValid():
+            QMessageBox.critical(None, self.tr("Error"), self.tr("Failed to load {}").format(uri))
+            return
+        layer.setCustomProperty("splashtool/artifact", "tiles")
+        # The vector and raster layers stay in the group for analysis
+        for tree_layer in group.findLayers():
+            tree_layer.setItemVisibilityChecked(False)
+        QgsProject.instance().addMapLayer(layer, False)
+        group.insertLayer(0, layer)
+
+    def set_min_flowacc(self):
+        """Ask for the minimum flow accumulation of the selected (or last loaded) group and filter its flowvectors."""
+        group = self.selected_group()
+        if group is None:
+            QMessageBox.information(None, self.tr("Minimum flow accumulation"),
+                                    self.tr("Select a SplashTool group in the layers panel first."))
+            return
+        value, ok = QInputDialog.getDouble(
+            self.iface.mainWindow(), self.tr("Minimum flow accumulation"),
+            self.tr("Hide flowvectors of {} with a flow accumulation below:").format(group.name()),
+            float(group.customProperty(MIN_FLOWACC_PROPERTY) or 0), 0, 1e12, 1)
+        if not ok:
+            return
+        group.setCustomProperty(MIN_FLOWACC_PROPERTY, value)
+        # The default of the next loaded groups
+        set_setting("min_flowacc", value)
+        for tree_layer in group.findLayers():
+            layer = tree_layer.layer()
+            if layer is None or not str(layer.customProperty("splashtool/artifact") or "").startswith("flowvectors_"):
+                continue
+            if not apply_flowacc_filter(layer, value):
+                QgsMessageLog.logMessage(self.tr("Could not filter {} by flow accumulation").format(layer.name()),
                                        "SplashTool Result Loader", Qgis.Warning)
+
+    def show_flowvector_statistics(self):
+        """Summarize the flowvectors shapefiles of the selected (or last loaded) group."""
+        group = self.selected_group()
+        if group is None:
+            QMessageBox.information(None, self.tr("Flowvectors statistics"),
+                                    self.tr("Select a SplashTool group in the layers panel first."))
+            return
+        index = get_result_index(group.customProperty("splashtool/folder"))
+        iteration = int(group.customProperty("splashtool/iteration") or 0)
+        lines = []
+        for result_file in index.flowvectors(iteration):
+            layer_name = f"flowvectors_{result_file.scale}"
+            # Counted with the classes of the style, read from memory-mapped files without OGR
+            ranges = style_cache.graduated_ranges(style_path("flowvectors", layer_name))
+            try:
+                statistics = flowvector_statistics(index.file_path(result_file), ranges)
+            except (OSError, ValueError) as e:
+                lines.append(self.tr("{}: could not be read ({})").format(layer_name, e))
+                continue
+            lines.append(self.tr("{}: {} vectors").format(layer_name, statistics["count"]))
+            if "flowacc" in statistics:
+                flowacc = statistics["flowacc"]
+                lines.append(self.tr("  FlowAcc {:.1f} to {:.1f}, mean {:.1f}, median {:.1f}, 90 % {:.1f}").format(
+                    flowacc["min"], flowacc["max"], flowacc["mean"], flowacc["quantiles"]["p50"],
+                    flowacc["quantiles"]["p90"]))
+                for flow_class in statistics["classes"]:
+                    lines.append(self.tr("  {:g} - {:g}: {}").format(
+                        flow_class["lower"], flow_class["upper"], flow_class["count"]))
+        if not lines:
+            lines.append(self.tr("No flowvectors found for iteration {}").format(iteration))
+        message = "\n".join(lines)
+        QgsMessageLog.logMessage(self.tr("Flowvectors statistics of {}:\n{}").format(group.name(), message),
+                               "SplashTool Result Loader", Qgis.Info)
+        QMessageBox.information(None, self.tr("Flowvectors statistics of {}").format(group.name()), message)
+
+    def show_water_balance(self):
+        """Show the water balance of all checkpoints of the selected (or last loaded) group in a dock."""
+        group = self.selected_group()
+        if group is None:
+            QMessageBox.information(None, self.tr("Water balance"),
+                                    self.tr("Select a SplashTool group in the layers panel first."))
+            return
+        if self.water_balance_dock is None:
+            self.water_balance_dock = WaterBalanceDock(self.iface.mainWindow())
+            self.iface.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.water_balance_dock)
+        # Follows new checkpoints of the folder until another group is shown or the dock is closed
+        self.water_balance_dock.set_folder(group.customProperty("splashtool/folder"))
+        self.water_balance_dock.show()
+        self.water_balance_dock.raise_()
+
+    def selected_group(self):
+        """The SplashTool group of the current layer tree node, or the last loaded group."""
+        node = self.iface.layerTreeView().currentNode()
+        while node is not None:
+            if node.customProperty("splashtool/folder"):
+                return node
+            node = node.parent()
+        return QgsProject.instance().layerTreeRoot().findGroup(self.last_group_name or "")
+
+    def group_min_flowacc(self, layer):
+        """Minimum flow accumulation of the SplashTool group that contains the layer (0 if none)."""
+        node = QgsProject.instance().layerTreeRoot().findLayer(layer.id())
+        while node is not None:
+            if node.customProperty("splashtool/folder"):
+                return float(node.customProperty(MIN_FLOWACC_PROPERTY) or 0)
+            node = node.parent()
+        return 0.0
+
+    def open_deferred_layers(self, scale):
+        """Open the data providers of deferred flowvectors layers that became visible at the new canvas scale."""
+        for layer in QgsProject.instance().mapLayers().values():
+            source = layer.customProperty(DEFERRED_SOURCE_PROPERTY)
+            if not source or not layer.isInScaleRange(scale):
+                continue
+            # The style of the placeholder is kept, it has the same geometry type and fields
+            layer.setDataSource(source, layer.name(), "ogr", QgsDataProvider.ProviderOptions())
+            layer.removeCustomProperty(DEFERRED_SOURCE_PROPERTY)
+            if not layer.isValid():
+                QgsMessageLog.logMessage(self.tr("Failed to load layer: {}").format(source),
+                                       "SplashTool Result Loader", Qgis.Critical)
+                continue
+            apply_flowacc_filter(layer, self.group_min_flowacc(layer), new_source=True)
+            QgsMessageLog.logMessage(self.tr("Opened deferred layer {} at scale 1:{:.0f}").format(layer.name(), scale),
+                                   "SplashTool Result Loader", Qgis.Info)
+
+    def time_first_render(self, timer):
+        """Record the time until the canvas rendered the new group, then report the timings."""
+        canvas = self.iface.mapCanvas()
+        render_start = time.perf_counter()
+
+        def report(rendered):
+            if timer.total is not None:
+                # Already reported by the other callback
                 return
-        
-        qml_path = os.path.join(self.plugin_dir, "styles", style_file)
-        QgsMessageLog.logMessage(self.tr("Attempting to apply style from: {}").format(qml_path), 
+            if rendered:
+                timer.add("first_render", time.perf_counter() - render_start)
+            timer.stop()
+            self.report_load_timings(timer)
+
+        def on_rendered():
+            canvas.mapCanvasRefreshed.disconnect(on_rendered)
+            report(True)
+
+        canvas.mapCanvasRefreshed.connect(on_rendered)
+        # Report without first_render if the canvas does not render (e.g. the group is hidden)
+        QTimer.singleShot(FIRST_RENDER_TIMEOUT_MS, lambda: report(False))
+
+    def report_load_timings(self, timer):
+        """Write the timings of a load to the log tab and append them to load_timings.jsonl in the profile."""
+        QgsMessageLog.logMessage(timer.summary(), "SplashTool Result Loader", Qgis.Info)
+        try:
+            append_record(profile_directory("load_timings.jsonl"), timer)
+        except OSError as e:
+            QgsMessageLog.logMessage(self.tr("Could not write load timings: {}").format(e),
+                                   "SplashTool Result Loader", Qgis.Warning)
+
+    def toggle_watch_mode(self, checked):
+        if not checked:
+            self.stop_watching()
+            return
+        if not self.last_group_name or not QgsProject.instance().layerTreeRoot().findGroup(self.last_group_name):
+            QMessageBox.information(None, self.tr("Watch mode"),
+                                    self.tr("Load SplashTool results first, the last loaded folder will be watched."))
+            self.watch_action.setChecked(False)
+            return
+        self.start_watching(self.last_group_name)
+
+    def start_watching(self, group_name):
+        """Refresh the given group in place whenever SplashTool writes a newer iteration."""
+        self.stop_watching()
+        group = QgsProject.instance().layerTreeRoot().findGroup(group_name)
+        folder = group.customProperty("splashtool/folder")
+        iteration = int(group.customProperty("splashtool/iteration") or 0)
+        self.watcher = ResultFolderWatcher(folder, iteration)
+        self.watcher.iterationReady.connect(self.on_new_iteration)
+        self.watched_group_name = group_name
+        QgsMessageLog.logMessage(self.tr("Watching {} for iterations after {}").format(folder, iteration),
                                "SplashTool Result Loader", Qgis.Info)
+
+    def stop_watching(self):
+        if self.watcher is not None:
+            self.watcher.stop()
+            self.watcher.deleteLater()
+            self.watcher = None
+        self.watched_group_name = None
+
+    def on_new_iteration(self, folder, iteration):
+        """Swap the data sources of the watched group to the files of a new iteration."""
+        group = QgsProject.instance().layerTreeRoot().findGroup(self.watched_group_name or "")
+        if group is None:
+            # The group was removed from the project, nothing left to refresh
+            self.stop_watching()
+            self.watch_action.setChecked(False)
+            return
+
+        log = LoadLog()
+        index = get_result_index(folder)
+        new_files = {}
+        for result_file in index.result_files():
+            if result_file.iteration != iteration:
+                continue
+            if result_file.artifact == "flowvectors":
+                new_files[f"flowvectors_{result_file.scale}"] = index.file_path(result_file)
+            elif result_file.artifact in ("wd", "flow_xy"):
+                new_files[result_file.artifact] = index.file_path(result_file)
+
+        # Flowvectors loaded from the GeoPackage stay on it, they are swapped once the new iteration is converted
+        flowvectors = index.flowvectors(iteration)
+        convert = bool(group.customProperty(GEOPACKAGE_PROPERTY)) and bool(flowvectors)
+        swapped = {artifact: path for artifact, path in new_files.items()
+                   if not (convert and artifact.startswith("flowvectors_"))}
+
+        refreshed = []
+        canvas = self.iface.mapCanvas()
+        canvas.freeze(True)
+        try:
+            for tree_layer in group.findLayers():
+                layer = tree_layer.layer()
+                artifact = layer.customProperty("splashtool/artifact") if layer else None
+                if artifact not in swapped:
+                    continue
+                refreshed.append(layer)
+                if layer.customProperty(DEFERRED_SOURCE_PROPERTY):
+                    # Not opened yet, only point the placeholder to the new file
+                    layer.setCustomProperty(DEFERRED_SOURCE_PROPERTY, swapped[artifact])
+                    continue
+                # Replaces the data provider of the layer instead of adding a new layer
+                layer.setDataSource(swapped[artifact], layer.name(), layer.providerType(),
+                                    QgsDataProvider.ProviderOptions())
+                self.apply_symbology(layer, style_type(artifact), log, repaint=False)
+                if artifact.startswith("flowvectors_"):
+                    apply_flowacc_filter(layer, float(group.customProperty(MIN_FLOWACC_PROPERTY) or 0),
+                                         new_source=True)
+        finally:
+            canvas.freeze(False)
+        canvas.refresh()
+
+        group.setCustomProperty("splashtool/iteration", iteration)
+        log.info("Refreshed {} to iteration {}", group.name(), iteration)
+        log.flush()
+
+        # The rasters and shapefiles of the new iteration have no overviews and spatial indexes yet
+        if get_setting("build_overviews"):
+            self.build_overviews([layer for layer in refreshed
+                                  if layer.customProperty("splashtool/artifact") in ("wd", "flow_xy")])
+        if get_setting("build_spatial_index"):
+            self.build_spatial_indexes([layer for layer in refreshed
+                                        if layer.customProperty("splashtool/artifact").startswith("flowvectors_")])
+
+        if convert:
+            task = ConvertFlowvectorsTask(index, flowvectors, self.on_flowvectors_converted)
+            self.tasks.append(task)
+            QgsApplication.taskManager().addTask(task)
+        # SplashTool does not write the pyramid levels, they are thinned again from the new finest scale
+        if self.pyramid_level_layers(group, new_files):
+            task = BuildPyramidTask(index, index.flowvectors(iteration), self.on_pyramid_rebuilt)
+            self.tasks.append(task)
+            QgsApplication.taskManager().addTask(task)
+
+    def on_flowvectors_converted(self, task, result):
+        """Point the flowvectors layers of the watched group to the GeoPackage of the new iteration (main thread)."""
+        if task in self.tasks:
+            self.tasks.remove(task)
+        group = QgsProject.instance().layerTreeRoot().findGroup(self.watched_group_name or "")
+        if task.isCanceled() or group is None or \
+                int(group.customProperty("splashtool/iteration") or 0) != task.iteration:
+            # Canceled, or the group was removed or refreshed again in the meantime
+            return
+        if result and task.path is not None:
+            sources = {f"flowvectors_{result_file.scale}": geopackage_layer_uri(task.path, result_file.scale)
+                       for result_file in task.result_files}
+        else:
+            # Slower to draw, but the flowvectors still match the other results of the group
+            QgsMessageLog.logMessage(self.tr("{} failed, loading the shapefiles: {}").format(task.description(),
+                                                                                              task.exception),
+                                   "SplashTool Result Loader", Qgis.Warning)
+            sources = {f"flowvectors_{result_file.scale}": task.index.file_path(result_file)
+                       for result_file in task.result_files}
+
+        min_flowacc = float(group.customProperty(MIN_FLOWACC_PROPERTY) or 0)
+        refreshed = []
+        for tree_layer in group.findLayers():
+            layer = tree_layer.layer()
+            artifact = layer.customProperty("splashtool/artifact") if layer else None
+            if artifact not in sources:
+                continue
+            refreshed.append(layer)
+            if layer.customProperty(DEFERRED_SOURCE_PROPERTY):
+                layer.setCustomProperty(DEFERRED_SOURCE_PROPERTY, sources[artifact])
+                continue
+            # The scale filter of the GeoPackage source becomes the base subset of the FlowAcc filter
+            layer.setDataSource(sources[artifact], layer.name(), "ogr", QgsDataProvider.ProviderOptions())
+            apply_flowacc_filter(layer, min_flowacc, new_source=True)
+            layer.triggerRepaint()
+        # Only the shapefiles of a failed conversion are indexed, the GeoPackage has its own index
+        if get_setting("build_spatial_index"):
+            self.build_spatial_indexes(refreshed)
+
+    def pyramid_level_layers(self, group, written):
+        """Flowvectors pyramid layers of a group, i.e. levels that are not among the written scales."""
+        names = {f"flowvectors_{scale}" for scale in PYRAMID_SCALES} - set(written)
+        return [tree_layer.layer() for tree_layer in group.findLayers()
+                if tree_layer.layer() and tree_layer.layer().customProperty("splashtool/artifact") in names]
+
+    def on_pyramid_rebuilt(self, task, result):
+        """Point the pyramid layers of the watched group to the levels of the new iteration (main thread)."""
+        if task in self.tasks:
+            self.tasks.remove(task)
+        group = QgsProject.instance().layerTreeRoot().findGroup(self.watched_group_name or "")
+        if task.isCanceled() or group is None or \
+                int(group.customProperty("splashtool/iteration") or 0) != task.iteration:
+            # Canceled, or the group was removed or refreshed again in the meantime
+            return
+        if task.exception is not None:
+            QgsMessageLog.logMessage(self.tr("{} failed: {}").format(task.description(), task.exception),
+                                   "SplashTool Result Loader", Qgis.Warning)
+
+        min_flowacc = float(group.customProperty(MIN_FLOWACC_PROPERTY) or 0)
+        written = [f"flowvectors_{result_file.scale}" for result_file in task.result_files]
+        for layer in self.pyramid_level_layers(group, written):
+            level = int(layer.customProperty("splashtool/artifact").split("_")[1])
+            if not result or task.path is None or level not in task.levels:
+                # No level at all is better than one of an old iteration next to the new results
+                QgsProject.instance().removeMapLayer(layer.id())
+                continue
+            source = geopackage_layer_uri(task.path, level)
+            if layer.customProperty(DEFERRED_SOURCE_PROPERTY):
+                layer.setCustomProperty(DEFERRED_SOURCE_PROPERTY, source)
+                continue
+            layer.setDataSource(source, layer.name(), "ogr", QgsDataProvider.ProviderOptions())
+            apply_flowacc_filter(layer, min_flowacc, new_source=True)
+            layer.triggerRepaint()
+
+    def apply_symbology(self, layer, ftype, log=None, repaint=True):
+        """Apply the style of the layer type from the styles folder.
+
+        :param repaint: Repaint the layer afterwards, disabled when the canvas is refreshed anyway.
+        :type repaint: bool
+        """
+        log = log or LoadLog()
+        if ftype == "flowvectors" and flowvectors_style_file(layer.name()) is None:
+            log.warning("No numeric value found in layer name, using default style")
+
+        qml_path = style_path(ftype, layer.name())
+        if not qml_path:
+            log.warning("No style mapping for layer type: {}", ftype)
+            return
+        
+        log.verbose("Attempting to apply style from: {}", qml_path)
         
         if os.path.exists(qml_path):
-            ok, msg = layer.loadNamedStyle(qml_path)
+            ok, msg = style_cache.apply(layer, qml_path)
             if ok:
-                QgsMessageLog.logMessage(self.tr("Successfully applied style to {}").format(layer.name()), 
-                                       "SplashTool Result Loader", Qgis.Info)
+                log.verbose("Successfully applied style to {}", layer.name())
+                if ftype == "wd":
+                    self.adapt_classification(layer, log)
             else:
-                QgsMessageLog.logMessage(self.tr("Failed to apply style to {}: {}").format(layer.name(), msg), 
-                                       "SplashTool Result Loader", Qgis.Warning)
-            layer.triggerRepaint()
+                log.warning("Failed to apply style to {}: {}", layer.name(), msg)
+            if repaint:
+                layer.triggerRepaint()
         else:
-            QgsMessageLog.logMessage(self.tr("Style file not found: {}").format(qml_path), 
-                                   "SplashTool Result Loader", Qgis.Warning)
+            log.warning("Style file not found: {}", qml_path)
             QMessageBox.warning(None, self.tr("Warning"), 
                               self.tr("QML file not found for {}: {}").format(ftype, qml_path))
+
+    def adapt_classification(self, layer, log):
+        """Move the class breaks of a water depth layer to the (cached) quantiles of its raster."""
+        path = layer.source()
+        index = get_result_index(os.path.dirname(path))
+        result_file = index.stat_file(os.path.basename(path))
+        if result_file is None:
+            log.verbose("{} is no SplashTool result, keeping the class breaks of the style", path)
+            return
+        quantiles, maximum = layer_quantiles(index, result_file, layer)
+        # Only writes the manifest if the quantiles were not cached yet
+        index.save_manifest()
+        if adapt_wd_classification(layer, quantiles, maximum):
+            log.verbose("Adapted class breaks of {} to {}", layer.name(), quantiles)
+        else:
+            log.verbose("Class breaks of {} not adapted", layer.name())
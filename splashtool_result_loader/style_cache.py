@@ -0,0 +1,130 @@
+# Python standard library
+import os
+import threading
+
+# Qt imports
+from qgis.PyQt.QtXml import QDomDocument
+
+# The style cache parses each QML file of the styles folder only once per session
+# and applies the parsed document to layers from memory. A cached document is
+# re-read if the modification time of the QML file changed.
+
+
+class StyleCache:
+    """Session cache of parsed QML style documents."""
+
+    def __init__(self):
+        # qml path -> (mtime, QDomDocument)
+        self._documents = {}
+        self._lock = threading.Lock()
+
+    def document(self, qml_path):
+        """Parsed style document of a QML file, or None if the file does not exist or is invalid."""
+        try:
+            mtime = os.stat(qml_path).st_mtime_ns
+        except OSError:
+            return None
+
+        with self._lock:
+            cached = self._documents.get(qml_path)
+            if cached and cached[0] == mtime:
+                return cached[1]
+
+            with open(qml_path, "rb") as f:
+                content = f.read()
+            document = QDomDocument("qgis")
+            parsed = document.setContent(content)
+            # PyQt returns (ok, error, line, column) for Qt5 and a result object for Qt6
+            if isinstance(parsed, tuple):
+                parsed = parsed[0]
+            if not parsed:
+                return None
+            self._documents[qml_path] = (mtime, document)
+            return document
+
+    def apply(self, layer, qml_path):
+        """Apply a QML style to a layer from the cache.
+
+        :returns: (ok, message) like QgsMapLayer.loadNamedStyle.
+        :rtype: tuple
+        """
+        document = self.document(qml_path)
+        if document is None:
+            return False, f"Could not read style {qml_path}"
+        return layer.importNamedStyle(document)
+
+    def scale_range(self, qml_path):
+        """Scale based visibility of a QML style without applying it to a layer.
+
+        :returns: (min_scale, max_scale) like QgsMapLayer.minimumScale/maximumScale,
+            or None if the style has no scale based visibility or cannot be read.
+        :rtype: tuple
+        """
+        document = self.document(qml_path)
+        if document is None:
+            return None
+        root = document.documentElement()
+        if root.attribute("hasScaleBasedVisibilityFlag", "0") != "1":
+            return None
+        try:
+            return float(root.attribute("minScale", "0")), float(root.attribute("maxScale", "0"))
+        except ValueError:
+            return None
+
+    def graduated_ranges(self, qml_path):
+        """(lower, upper) bounds of the classes of a graduated renderer style, in the order of the style.
+
+        :returns: Empty list if the style has no graduated renderer or cannot be read.
+        :rtype: list
+        """
+        document = self.document(qml_path)
+        if document is None:
+            return []
+        ranges = []
+        elements = document.documentElement().elementsByTagName("range")
+        for i in range(elements.count()):
+            element = elements.item(i).toElement()
+            try:
+                ranges.append((float(element.attribute("lower")), float(element.attribute("upper"))))
+            except ValueError:
+                continue
+        return ranges
+
+    def transparent_breaks(self, qml_path):
+        """Finite class breaks of a raster color ramp style whose classes are fully transparent.
+
+        :returns: Empty list if the style has no transparent classes or cannot be read.
+        :rtype: list
+        """
+        document = self.document(qml_path)
+        if document is None:
+            return []
+        breaks = []
+        elements = document.documentElement().elementsByTagName("item")
+        for i in range(elements.count()):
+            element = elements.item(i).toElement()
+            if element.parentNode().nodeName() != "colorrampshader" or element.attribute("alpha", "255") != "0":
+                continue
+            try:
+                value = float(element.attribute("value"))
+            except ValueError:
+                continue
+            if value != float("inf"):
+                breaks.append(value)
+        return breaks
+
+    def clear(self):
+        with self._lock:
+            self._documents.clear()
+
+
+def in_scale_range(scale_range, scale):
+    """Whether a layer with the given scale range is visible at a map scale, like QgsMapLayer.isInScaleRange."""
+    if scale_range is None:
+        return True
+    min_scale, max_scale = scale_range
+    return (min_scale == 0 or min_scale > scale) and (max_scale == 0 or scale >= max_scale)
+
+
+# Shared by all loads of the session
+style_cache = StyleCache()
@@ -0,0 +1,70 @@
+<!DOCTYPE qgis PUBLIC 'http://mrcc.com/qgis.dtd' 'SYSTEM'>
+<qgis version="3.38.3-Grenoble" minScale="1e+08" styleCategories="AllStyleCategories" maxScale="0" hasScaleBasedVisibilityFlag="0">
+  <flags>
+    <Identifiable>1</Identifiable>
+    <Removable>1</Removable>
+    <Searchable>0</Searchable>
+    <Private>0</Private>
+  </flags>
+  <customproperties>
+    <Option type="Map">
+      <Option name="identify/format" value="Value" type="QString"/>
+    </Option>
+  </customproperties>
+  <mapTip enabled="1"></mapTip>
+  <pipe>
+    <provider>
+      <resampling enabled="false" zoomedOutResamplingMethod="nearestNeighbour" maxOversampling="2" zoomedInResamplingMethod="nearestNeighbour"/>
+    </provider>
+    <rasterrenderer classificationMin="-1" band="1" nodataColor="" classificationMax="1" opacity="1" alphaBand="-1" type="singlebandpseudocolor">
+      <rasterTransparency/>
+      <minMaxOrigin>
+        <limits>None</limits>
+        <extent>WholeRaster</extent>
+        <statAccuracy>Estimated</statAccuracy>
+        <cumulativeCutLower>0.02</cumulativeCutLower>
+        <cumulativeCutUpper>0.98</cumulativeCutUpper>
+        <stdDevFactor>2</stdDevFactor>
+      </minMaxOrigin>
+      <rastershader>
+        <colorrampshader clip="0" colorRampType="INTERPOLATED" classificationMode="1" labelPrecision="2" minimumValue="-1" maximumValue="1">
+          <colorramp name="[source]" type="gradient">
+            <Option type="Map">
+              <Option name="color1" value="178,24,43,255,rgb:0.69803921568627447,0.09411764705882353,0.16862745098039217,1" type="QString"/>
+              <Option name="color2" value="33,102,172,255,rgb:0.12941176470588237,0.40000000000000002,0.67450980392156867,1" type="QString"/>
+              <Option name="direction" value="ccw" type="QString"/>
+              <Option name="discrete" value="0" type="QString"/>
+              <Option name="rampType" value="gradient" type="QString"/>
+              <Option name="spec" value="rgb" type="QString"/>
+              <Option name="stops" value="0.375;239,138,98,255,rgb:0.93725490196078431,0.54117647058823526,0.3843137254901961,1;rgb;ccw:0.49;255,255,255,0,rgb:1,1,1,0;rgb;ccw:0.51;255,255,255,0,rgb:1,1,1,0;rgb;ccw:0.625;103,169,207,255,rgb:0.40392156862745099,0.66274509803921566,0.81176470588235294,1;rgb;ccw" type="QString"/>
+            </Option>
+          </colorramp>
+          <item color="#b2182b" alpha="255" label="-1,00 (drying)" value="-1"/>
+          <item color="#ef8a62" alpha="255" label="-0,25" value="-0.25"/>
+          <item color="#ffffff" alpha="0" label="-0,02" value="-0.02"/>
+          <item color="#ffffff" alpha="0" label="0,02" value="0.02"/>
+          <item color="#67a9cf" alpha="255" label="0,25" value="0.25"/>
+          <item color="#2166ac" alpha="255" label="1,00 (wetting)" value="1"/>
+          <rampLegendSettings suffix="" useContinuousLegend="1" orientation="2" prefix="" direction="0" maximumLabel="" minimumLabel="">
+            <numericFormat id="basic">
+              <Option type="Map">
+                <Option name="decimal_separator" type="invalid"/>
+                <Option name="decimals" value="2" type="int"/>
+                <Option name="rounding_type" value="0" type="int"/>
+                <Option name="show_plus" value="true" type="bool"/>
+                <Option name="show_thousand_separator" value="true" type="bool"/>
+                <Option name="show_trailing_zeros" value="false" type="bool"/>
+                <Option name="thousand_separator" type="invalid"/>
+              </Option>
+            </numericFormat>
+          </rampLegendSettings>
+        </colorrampshader>
+      </rastershader>
+    </rasterrenderer>
+    <brightnesscontrast brightness="0" gamma="1" contrast="0"/>
+    <huesaturation saturation="0" colorizeBlue="128" invertColors="0" colorizeOn="0" grayscaleMode="0" colorizeStrength="100" colorizeRed="255" colorizeGreen="128"/>
+    <rasterresampler maxOversampling="2"/>
+    <resamplingStage>resamplingFilter</resamplingStage>
+  </pipe>
+  <blendMode>0</blendMode>
+</qgis>
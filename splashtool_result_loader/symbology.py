@@ -0,0 +1,57 @@
+# Python standard library
+import os
+import re
+
+# Styles shipped with the plugin and the rules which layer gets which style.
+# Used by the plugin as well as by the headless batch mode.
+
+STYLES_DIR = os.path.join(os.path.dirname(__file__), "styles")
+
+# Map layer types to their style file names
+STYLE_FILES = {
+    "wd": "wd.qml",
+    "flow_xy": "flow.qml",
+    # Diverging style of water depth differences, drying red, wetting blue
+    "wd_difference": "wd_difference.qml",
+}
+
+
+def flowvectors_style_file(layer_name):
+    """Style file of a flowvectors layer, chosen by the scale in its name (None if there is no scale)."""
+    match = re.search(r'flowvectors_(\d+)', layer_name)
+    if not match:
+        return None
+    value = int(match.group(1))
+    # Choose style file based on thresholds
+    if value <= 16:
+        return "flowvectors_16.qml"
+    elif value <= 32:
+        return "flowvectors_32.qml"
+    elif value <= 64:
+        return "flowvectors_64.qml"
+    elif value <= 128:
+        return "flowvectors_128.qml"
+    elif value <= 256:
+        # Levels of the thinned flowvectors pyramid (see flowvector_pyramid.py)
+        return "flowvectors_256.qml"
+    else:  # value > 256, including > 512
+        return "flowvectors_512.qml"
+
+
+def style_path(ftype, layer_name):
+    """Path of the QML style for a layer type, or None if there is no style for it.
+
+    Flowvectors layers without a scale in their name get the default flowvectors style.
+    """
+    if ftype == "flowvectors":
+        style_file = flowvectors_style_file(layer_name) or "flowvectors.qml"
+    else:
+        style_file = STYLE_FILES.get(ftype)
+        if not style_file:
+            return None
+    return os.path.join(STYLES_DIR, style_file)
+
+
+def style_type(layer_name):
+    """Layer type used for styling, flowvectors_<N> layers share the "flowvectors" type."""
+    return "flowvectors" if "flowvectors_" in layer_name else layer_name
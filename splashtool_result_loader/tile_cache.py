@@ -0,0 +1,111 @@
+# Python standard library
+import os
+from urllib.parse import quote
+
+# Qt imports
+from qgis.PyQt.QtCore import QUrl
+
+# QGIS imports
+from qgis.core import QgsCoordinateTransform, QgsDataProvider, QgsProject, QgsRectangle
+
+# Local imports
+from .loader_task import DEFERRED_SOURCE_PROPERTY
+from .manifest import cache_directory
+
+# Rendering thousands of graduated flowvector markers on every pan is slow. This
+# module pre-renders the layers of a SplashTool group into a local tile cache
+# (MBTiles file or XYZ directory) with the XYZ tiles algorithms of QGIS, which
+# render several metatiles in parallel. The algorithm renders the checked layers
+# of its project, so it gets a temporary project with clones of the group layers.
+
+TILE_ALGORITHMS = {
+    "mbtiles": "native:tilesxyzmbtiles",
+    "xyz": "native:tilesxyzdirectory",
+}
+TILE_DPI = 96
+METATILE_SIZE = 4
+
+
+def tile_cache_path(folder, iteration, tile_format):
+    """MBTiles file or XYZ directory of an iteration in the cache folder of its output folder."""
+    name = f"tiles_{iteration}"
+    return os.path.join(cache_directory(folder), name + ".mbtiles" if tile_format == "mbtiles" else name)
+
+
+def render_layers(layers):
+    """Clones of the layers for rendering in the background, deferred layers get their real source.
+
+    :rtype: list
+    """
+    clones = []
+    for layer in layers:
+        clone = layer.clone()
+        source = layer.customProperty(DEFERRED_SOURCE_PROPERTY)
+        if source:
+            clone.setDataSource(source, layer.name(), "ogr", QgsDataProvider.ProviderOptions())
+            clone.removeCustomProperty(DEFERRED_SOURCE_PROPERTY)
+        clones.append(clone)
+    return clones
+
+
+def tile_project(layers, crs):
+    """Temporary project with clones of the layers, in the order of the list (top first).
+
+    :rtype: QgsProject
+    """
+    project = QgsProject()
+    project.setCrs(crs)
+    # Added to the layer tree in the order of the list, all checked
+    project.addMapLayers(render_layers(layers))
+    return project
+
+
+def layers_extent(layers, crs):
+    """Combined extent of the layers in the given CRS, ignoring empty layers (e.g. placeholders).
+
+    :rtype: QgsRectangle
+    """
+    extent = QgsRectangle()
+    for layer in layers:
+        layer_extent = layer.extent()
+        if layer_extent.isEmpty():
+            continue
+        transform = QgsCoordinateTransform(layer.crs(), crs, QgsProject.instance())
+        layer_extent = transform.transformBoundingBox(layer_extent)
+        if extent.isEmpty():
+            extent = layer_extent
+        else:
+            extent.combineExtentWith(layer_extent)
+    return extent
+
+
+def tile_parameters(extent, crs, zoom_min, zoom_max, output, tile_format):
+    """Parameters of the XYZ tiles algorithm for the given format.
+
+    :rtype: dict
+    """
+    parameters = {
+        "EXTENT": f"{extent.xMinimum()},{extent.xMaximum()},{extent.yMinimum()},{extent.yMaximum()} [{crs.authid()}]",
+        "ZOOM_MIN": zoom_min,
+        "ZOOM_MAX": zoom_max,
+        "DPI": TILE_DPI,
+        "ANTIALIAS": True,
+        # PNG keeps the transparent classes of the styles
+        "TILE_FORMAT": 0,
+        "METATILESIZE": METATILE_SIZE,
+    }
+    if tile_format == "mbtiles":
+        parameters["OUTPUT_FILE"] = output
+    else:
+        parameters["OUTPUT_DIRECTORY"] = output
+    return parameters
+
+
+def tile_layer_uri(output, tile_format, zoom_min, zoom_max):
+    """Data source of a raster tile layer for the wms provider."""
+    # The provider turns the url back into a path with QUrl.toLocalFile, which needs the file: scheme.
+    # The percent-encoded URL is quoted once more as a value of the data source.
+    url = bytes(QUrl.fromLocalFile(output).toEncoded()).decode("ascii")
+    if tile_format == "mbtiles":
+        return f"type=mbtiles&url={quote(url, safe='')}"
+    return f"type=xyz&url={quote(url + '/{z}/{x}/{y}.png', safe='')}&zmin={zoom_min}&zmax={zoom_max}"
@@ -0,0 +1,83 @@
+# Python standard library
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+# Timing instrumentation of a single load. Every phase (scan, match, provider
+# open, isValid, style, addMapLayer, group insertion, first render) is timed in
+# total and per file; "open" is the wall time of opening all files. The timings
+# are written to the log tab as a summary and appended as one JSON record per
+# load to a JSON Lines file, so they can be collected from interactive and batch
+# runs alike.
+
+PHASES = ("scan", "match", "convert", "pyramid", "open", "provider_open", "is_valid", "style", "add_map_layer",
+          "group_add_layer", "first_render")
+
+
+class LoadTimer:
+    """Collects per-phase and per-file timings of one load."""
+
+    def __init__(self, folder):
+        self.folder = folder
+        self.started = datetime.now().isoformat(timespec="seconds")
+        self._start = time.perf_counter()
+        self.total = None
+        # phase -> seconds (summed over files, may exceed the wall time if files are opened concurrently)
+        self.phases = {}
+        # file name -> {phase: seconds}
+        self.files = {}
+        self._lock = threading.Lock()
+
+    def add(self, phase, seconds, file=None):
+        with self._lock:
+            self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+            if file is not None:
+                file_phases = self.files.setdefault(file, {})
+                file_phases[phase] = file_phases.get(phase, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, phase, file=None):
+        """Time a block as the given phase, optionally for a single file."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, time.perf_counter() - start, file)
+
+    def elapsed(self):
+        return time.perf_counter() - self._start
+
+    def stop(self):
+        self.total = self.elapsed()
+
+    def to_dict(self):
+        """Machine-readable record of the load."""
+        def rounded(phases):
+            return {name: round(seconds, 4) for name, seconds in phases.items()}
+        return {
+            "folder": self.folder,
+            "started": self.started,
+            "total": round(self.total if self.total is not None else self.elapsed(), 4),
+            "phases": rounded(self.phases),
+            "files": {file: rounded(phases) for file, phases in self.files.items()},
+        }
+
+    def summary(self):
+        """Human-readable summary, one line per phase and file."""
+        record = self.to_dict()
+        lines = [f"Load timings for {self.folder}: {record['total']:.3f} s total"]
+        for name in sorted(record["phases"], key=lambda n: PHASES.index(n) if n in PHASES else len(PHASES)):
+            lines.append(f"  {name}: {record['phases'][name]:.3f} s")
+        for file, phases in sorted(record["files"].items()):
+            lines.append(f"  {file}: " + ", ".join(f"{name} {seconds:.3f} s" for name, seconds in phases.items()))
+        return "\n".join(lines)
+
+
+def append_record(path, timer):
+    """Append the record of a load to a JSON Lines file."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(timer.to_dict()) + "\n")
@@ -0,0 +1,134 @@
+# Python standard library
+import os
+
+# Qt imports
+from qgis.PyQt.QtCore import QObject, QFileSystemWatcher, QTimer, pyqtSignal
+
+# Local imports
+from .result_index import get_result_index
+from .settings import get_setting
+from .splashconfig import expected_result_files, parse_splashconfig
+
+# The watcher monitors a SplashTool output folder while a simulation is running.
+# A new iteration is reported once its .splashconfig exists, all result files it
+# names exist and their sizes did not change between two checks, i.e. SplashTool
+# finished writing them. QFileSystemWatcher often gets no events for files written
+# by another machine to a network share, so the folder is polled as well.
+
+DEBOUNCE_MS = 2000
+SHAPEFILE_SIDECARS = (".shx", ".dbf")
+
+
+class ResultFolderWatcher(QObject):
+    """Watches a SplashTool output folder for new, completely written iterations."""
+
+    # output folder, iteration
+    iterationReady = pyqtSignal(str, int)
+
+    def __init__(self, folder, iteration, parent=None):
+        """Constructor.
+        :param folder: SplashTool output directory to watch.
+        :type folder: str
+
+        :param iteration: Iteration that is currently loaded, only newer iterations are reported.
+        :type iteration: int
+        """
+        super().__init__(parent)
+        self.folder = folder
+        self.iteration = iteration
+        self._pending_sizes = None
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(DEBOUNCE_MS)
+        self._timer.timeout.connect(self.check)
+
+        self._watcher = QFileSystemWatcher([folder], self)
+        self._watcher.directoryChanged.connect(lambda path: self._timer.start())
+
+        self._poll_timer = QTimer(self)
+        self._poll_timer.timeout.connect(self.poll)
+        poll_seconds = get_setting("watch_poll_seconds")
+        if poll_seconds > 0:
+            self._poll_timer.start(poll_seconds * 1000)
+
+    def stop(self):
+        self._timer.stop()
+        self._poll_timer.stop()
+        self._watcher.removePaths(self._watcher.directories())
+
+    def poll(self):
+        # A check that is already scheduled compares the sizes, restarting it would delay it
+        if not self._timer.isActive():
+            self.check()
+
+    def check(self):
+        """Look for a newer iteration and report it once its files are completely written."""
+        index = get_result_index(self.folder)
+        config = index.latest("splashconfig")
+        if config is None or config.iteration <= self.iteration:
+            self._pending_sizes = None
+            return
+
+        try:
+            expected = self.expected_paths(index, parse_splashconfig(index.file_path(config)))
+        except OSError:
+            expected = None
+        if not expected:
+            # The config is still being written, or results named in it do not exist yet.
+            # Their creation changes the folder, otherwise the next poll checks again.
+            self._pending_sizes = None
+            return
+
+        sizes = self.file_sizes(index, config.iteration)
+        sizes.update((path, file_size(path)) for path in expected)
+        if None in sizes.values() or sizes != self._pending_sizes:
+            # Still being written (or seen for the first time), check again later
+            self._pending_sizes = sizes
+            self._timer.start()
+            return
+
+        self._pending_sizes = None
+        self.iteration = config.iteration
+        self.iterationReady.emit(self.folder, config.iteration)
+
+    def expected_paths(self, index, config):
+        """Paths of the results a .splashconfig names, None if one of them does not exist yet.
+
+        flow_xy is only expected if the run wrote it before, it is not part of the config.
+        """
+        if config is None:
+            return None
+        expected = expected_result_files(config)
+        names = [expected["wd"]]
+        if index.latest("flow_xy") is not None:
+            names.append(expected["flow_xy"])
+        for _, name in expected["flowvectors"]:
+            base = os.path.splitext(name)[0]
+            names += [name] + [base + ext for ext in SHAPEFILE_SIDECARS]
+        paths = [os.path.join(self.folder, name) for name in names]
+        if not all(os.path.exists(path) for path in paths):
+            return None
+        return paths
+
+    def file_sizes(self, index, iteration):
+        """Current sizes of all result files of an iteration, including shapefile sidecars."""
+        sizes = {}
+        for result_file in index.result_files():
+            if result_file.iteration != iteration:
+                continue
+            paths = [index.file_path(result_file)]
+            if result_file.artifact == "flowvectors":
+                base = os.path.splitext(paths[0])[0]
+                paths += [base + ext for ext in SHAPEFILE_SIDECARS]
+            for path in paths:
+                sizes[path] = file_size(path)
+        return sizes
+
+
+def file_size(path):
+    """Size of a file, None if it does not exist (anymore)."""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return None
@@ -0,0 +1,44 @@
+# Local imports
+from .splashconfig import parse_splashconfig
+
+# Every checkpoint writes its water balance into its .splashconfig. This module
+# collects the balances of all checkpoints of an output folder into a time
+# series. Parsed balances are cached with the file metadata of the folder index,
+# which is stored in the manifest (see manifest.py), so a refresh only parses
+# configs that appeared or changed since the last one.
+
+
+def water_balance_series(index):
+    """Water balance of every checkpoint of an output folder, sorted by iteration.
+
+    :param index: Up-to-date index of the output folder.
+    :type index: ResultDirectoryIndex
+
+    :returns: List of (iteration, {balance key: value}) tuples.
+    :rtype: list
+    """
+    series = []
+    for result_file in index.result_files("splashconfig"):
+        metadata = index.layer_metadata(result_file)
+        if metadata is None or "balance" not in metadata:
+            try:
+                config = parse_splashconfig(index.file_path(result_file))
+            except OSError:
+                continue
+            metadata = {"balance": config.balance if config else {}}
+            index.set_layer_metadata(result_file, metadata)
+        if metadata["balance"]:
+            series.append((result_file.iteration, metadata["balance"]))
+    series.sort(key=lambda entry: entry[0])
+    return series
+
+
+def relative_change(series, key, checkpoints=1):
+    """Relative change of a balance value over the last checkpoints, None if unknown.
+
+    A simulation has stabilized when the remaining volume hardly changes anymore.
+    """
+    values = [balance[key] for _, balance in series if key in balance]
+    if len(values) <= checkpoints or not values[-1 - checkpoints]:
+        return None
+    return (values[-1] - values[-1 - checkpoints]) / abs(values[-1 - checkpoints])
@@ -0,0 +1,161 @@
+# Qt imports
+from qgis.PyQt.QtCore import QT_TRANSLATE_NOOP, Qt, QPointF, QRectF
+from qgis.PyQt.QtGui import QColor, QPainter, QPen, QPolygonF
+from qgis.PyQt.QtWidgets import QDockWidget, QHBoxLayout, QLabel, QPushButton, QVBoxLayout, QWidget
+
+# Local imports
+from .result_files import tr
+from .result_index import get_result_index
+from .water_balance import relative_change, water_balance_series
+from .watcher import ResultFolderWatcher
+
+# Dock panel with the water balance of a SplashTool output folder. The charts
+# show how the volumes and the volume error develop over the checkpoints, so
+# the convergence of a running simulation can be judged without loading any
+# raster. The panel refreshes itself when SplashTool writes a new checkpoint.
+
+# Relative change of the remaining volume between the last two checkpoints
+# below which a simulation is considered stable
+STABLE_CHANGE = 0.001
+
+# (balance key, label, color) per chart. The labels are only marked for translation
+# here and translated when painted, the translator is installed after the import.
+VOLUME_CURVES = (
+    ("remaining_volume", QT_TRANSLATE_NOOP("SplashToolResultLoader", "remaining volume"), QColor(33, 102, 172)),
+    ("outflow_from_sinks", QT_TRANSLATE_NOOP("SplashToolResultLoader", "outflow from sinks"), QColor(178, 24, 43)),
+)
+ERROR_CURVES = (
+    ("volume_error", QT_TRANSLATE_NOOP("SplashToolResultLoader", "volume error [%]"), QColor(90, 90, 90)),
+)
+
+
+class BalanceChart(QWidget):
+    """Minimal line chart of water balance values over the iterations."""
+
+    MARGIN = 8
+
+    def __init__(self, curves, parent=None):
+        """Constructor.
+        :param curves: (balance key, label, color) of each line.
+        :type curves: tuple
+        """
+        super().__init__(parent)
+        self.curves = curves
+        self.series = []
+        self.setMinimumHeight(140)
+
+    def set_series(self, series):
+        self.series = series
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        metrics = painter.fontMetrics()
+        line_height = metrics.height()
+        plot = QRectF(self.rect()).adjusted(self.MARGIN, self.MARGIN + line_height * len(self.curves),
+                                            -self.MARGIN, -self.MARGIN - line_height)
+        painter.setPen(QPen(self.palette().color(self.foregroundRole())))
+        painter.drawRect(plot)
+
+        points = [(iteration, balance) for iteration, balance in self.series]
+        values = [balance[key] for _, balance in points for key, _, _ in self.curves if key in balance]
+        if len(points) < 2 or not values:
+            painter.drawText(plot, Qt.AlignmentFlag.AlignCenter, tr("Not enough checkpoints"))
+            return
+        first, last = points[0][0], points[-1][0]
+        low, high = min(values), max(values)
+        if high == low:
+            high = low + 1.0
+
+        def position(iteration, value):
+            return QPointF(plot.left() + (iteration - first) / (last - first) * plot.width(),
+                           plot.bottom() - (value - low) / (high - low) * plot.height())
+
+        for number, (key, label, color) in enumerate(self.curves):
+            painter.setPen(QPen(color, 2))
+            painter.drawPolyline(QPolygonF([position(iteration, balance[key])
+                                            for iteration, balance in points if key in balance]))
+            latest = next((balance[key] for _, balance in reversed(points) if key in balance), None)
+            painter.drawText(QPointF(self.MARGIN, self.MARGIN + line_height * (number + 1) - metrics.descent()),
+                             f"{tr(label)}: {latest:,.3f}" if latest is not None else tr(label))
+
+        painter.setPen(QPen(self.palette().color(self.foregroundRole())))
+        painter.drawText(QPointF(plot.left(), plot.bottom() + line_height), f"{first}")
+        painter.drawText(QRectF(plot.left(), plot.bottom(), plot.width(), line_height),
+                         Qt.AlignmentFlag.AlignRight, f"{last}")
+        painter.drawText(QRectF(plot.left() + 2, plot.top(), plot.width(), line_height),
+                         Qt.AlignmentFlag.AlignLeft, f"{high:,.3g}")
+        painter.drawText(QRectF(plot.left() + 2, plot.bottom() - line_height, plot.width(), line_height),
+                         Qt.AlignmentFlag.AlignLeft, f"{low:,.3g}")
+
+
+class WaterBalanceDock(QDockWidget):
+    """Dock panel with the water balance charts of one output folder."""
+
+    def __init__(self, parent=None):
+        super().__init__(tr("SplashTool water balance"), parent)
+        self.setObjectName("SplashToolWaterBalanceDock")
+        self.folder = None
+        self.watcher = None
+
+        widget = QWidget(self)
+        layout = QVBoxLayout(widget)
+        header = QHBoxLayout()
+        self.folder_label = QLabel(widget)
+        self.folder_label.setWordWrap(True)
+        refresh_button = QPushButton(tr("Refresh"), widget)
+        refresh_button.clicked.connect(self.refresh)
+        header.addWidget(self.folder_label, 1)
+        header.addWidget(refresh_button)
+        layout.addLayout(header)
+        self.status_label = QLabel(widget)
+        self.status_label.setWordWrap(True)
+        layout.addWidget(self.status_label)
+        self.volume_chart = BalanceChart(VOLUME_CURVES, widget)
+        self.error_chart = BalanceChart(ERROR_CURVES, widget)
+        layout.addWidget(self.volume_chart, 2)
+        layout.addWidget(self.error_chart, 1)
+        self.setWidget(widget)
+
+    def set_folder(self, folder):
+        """Show the water balance of an output folder and follow its new checkpoints."""
+        self.stop_watching()
+        self.folder = folder
+        series = self.refresh()
+        self.watcher = ResultFolderWatcher(folder, series[-1][0] if series else 0, self)
+        self.watcher.iterationReady.connect(lambda folder, iteration: self.refresh())
+
+    def stop_watching(self):
+        if self.watcher is not None:
+            self.watcher.stop()
+            self.watcher.deleteLater()
+            self.watcher = None
+
+    def refresh(self):
+        """Re-read the balances, only configs that are new or changed are parsed.
+
+        :returns: The water balance series of the folder.
+        :rtype: list
+        """
+        if not self.folder:
+            return []
+        index = get_result_index(self.folder)
+        series = water_balance_series(index)
+        index.save_manifest()
+
+        self.folder_label.setText(self.folder)
+        self.volume_chart.set_series(series)
+        self.error_chart.set_series(series)
+        change = relative_change(series, "remaining_volume")
+        if change is None:
+            self.status_label.setText(tr("{} checkpoints").format(len(series)))
+        else:
+            state = tr("stable") if abs(change) < STABLE_CHANGE else tr("not stable yet")
+            self.status_label.setText(tr("{} checkpoints, remaining volume changed by {:+.3f} % since the "
+                                         "previous checkpoint ({})").format(len(series), change * 100, state))
+        return series
+
+    def closeEvent(self, event):
+        self.stop_watching()
+        super().closeEvent(event)